@@ -18,29 +18,34 @@ These calculations include:
     if multiple rotations are eligible."""
 
 from character_utils.follow_ups import follow_up_attack_check
-from character_utils.characters import CharStats, HUOHUO_PERCENT_ENERGY_BONUSES
+from character_utils.characters import CharStats
 from character_utils.talents import apply_talents
 from character_utils.eidolons import apply_eidolons
 from character_utils.traces import apply_traces
 from equipment_utils.light_cones import apply_light_cones
 from equipment_utils.relics import apply_ornament, apply_rope
 from gui_scripts.user_input import UserInput
-from .character_algorithms.all_algorithms import apply_correct_algorithm, print_results
+from .character_algorithms.all_algorithms import (apply_correct_algorithm, create_aggregators,
+                                                  print_results)
+from .search_budget import start_search_deadline
 from .calculations_utils import (
-    determine_ally_hit_energy, determine_initial_skill_points,
+    apply_raw_energy_bonuses, determine_ally_hit_energy, determine_initial_skill_points,
     determine_initial_energy, determine_counter_energy_values,
     derive_special_action_values)
 
 
 def run_calculations(stats: CharStats, user_input: UserInput) -> None:
     """Applies all bonuses, runs all necessary calculations,
-    and prints their results to the console."""
+    and prints their results to the console.
+    All searches the calculations run share a single time limit, see "search_budget"."""
 
+    start_search_deadline(user_input)
     _apply_bonuses(stats, user_input)
     determine_counter_energy_values(stats, user_input)
     user_input.check_for_active_counters()
-    unique_rotations = apply_correct_algorithm(stats, user_input)
-    print_results(stats, user_input, unique_rotations, apply_correct_algorithm)
+    aggregators = apply_correct_algorithm(stats, user_input,
+                                          create_aggregators(user_input))
+    print_results(stats, user_input, aggregators, apply_correct_algorithm)
 
 
 def _apply_bonuses(stats: CharStats, user_input: UserInput) -> None:
@@ -62,14 +67,4 @@ def _apply_bonuses(stats: CharStats, user_input: UserInput) -> None:
     determine_initial_skill_points(stats, user_input)
 
     stats.apply_energy_recharge(stats.energy_recharge)
-
-    # Raw energy bonuses (unaffected by Energy Recharge)
-    if user_input.assume_tingyun_ult:
-        stats.init_energy += 50
-
-    elif user_input.assume_tingyun_ult and user_input.assume_tingyun_e6:
-        stats.init_energy += 60
-
-    if user_input.huohuo_ult_level > 0:
-        bonus = HUOHUO_PERCENT_ENERGY_BONUSES[user_input.huohuo_ult_level - 1]
-        stats.init_energy += bonus / 100 * stats.ult_cost
+    apply_raw_energy_bonuses(stats, user_input)
@@ -1,10 +1,13 @@
 from typing import Callable, Optional
 from termcolor import colored
-from character_utils.characters import CharStats
+from character_utils.characters import CharStats, HUOHUO_PERCENT_ENERGY_BONUSES
 from character_utils.traces import TRACES
 from gui_scripts.user_input import UserInput
-from gui_scripts.counter import Counter
 from .rotation import Rotation, RotationList
+from .rotation_aggregators import RotationAggregator, RotationAggregators
+from .rotation_scores import get_total_value
+from .er_breakpoints import EnergyModel, create_energy_model, get_energy_components
+from .search_cache import SEARCH_CACHE, get_search_key
 
 
 def determine_initial_energy(stats: CharStats, user_input: UserInput) -> None:
@@ -65,80 +68,32 @@ def determine_initial_skill_points(stats: CharStats, user_input: UserInput) -> N
             stats.init_sp += 1
 
 
-def find_basic_only_rotation(rotations: RotationList) -> Optional[Rotation]:
-    """Finds the shortest rotation that contains only basic attacks.
-    Returns such a rotation if found, otherwise returns None."""
+def _get_default_sorting_key(rotation: Rotation) -> tuple:
+    """The shortest rotation wins, ties are broken by the lowest skill point cost."""
 
-    try:
-        basic_only_rotation = min((r for r in rotations
-                                   if r.all_skills_count == 0),
-                                  key=lambda r: (r.num_turns, -r.skill_points_generated))
+    return rotation.num_turns, -rotation.skill_points_generated
 
-        if basic_only_rotation:
-            return basic_only_rotation
-        return None
-
-    except ValueError:
-        return None
-
-
-def find_skill_only_rotation(rotations: RotationList) -> Optional[Rotation]:
-    """Finds the shortest rotation that contains only skills.
-    Returns such a rotation if found, otherwise returns None."""
-
-    try:
-        skill_only_rotation = min((r for r in rotations
-                                   if r.all_basics_count == 0),
-                                  key=lambda r: (r.num_turns, -r.skill_points_generated))
-        if skill_only_rotation:
-            return skill_only_rotation
-        return None
-
-    except ValueError:
-        return None
 
+# Categories of rotations printed by the default print function,
+# each with the condition a rotation has to meet and the key the best rotation is chosen by
+DEFAULT_ROTATION_FILTERS: dict[str, tuple[Callable[[Rotation], bool], Callable]] = {
+    "best": (lambda r: True, _get_default_sorting_key),
+    "neutral": (lambda r: r.skill_points_generated == 0, lambda r: r.num_turns),
+    "basic_only": (lambda r: r.all_skills_count == 0, _get_default_sorting_key),
+    "skill_only": (lambda r: r.all_basics_count == 0, _get_default_sorting_key),
+    "one_skill": (lambda r: r.all_skills_count == 1, _get_default_sorting_key)
+}
 
-def find_one_skill_rotation(rotations: RotationList) -> Optional[Rotation]:
-    """Finds the shortest rotation that contains only one skill.
-    Returns such a rotation if found, otherwise returns None."""
+# ER breakpoints are found to within this much ER
+ER_PRECISION = 0.00001
 
-    try:
-        skill_only_rotation = min((r for r in rotations
-                                   if r.all_skills_count == 1),
-                                  key=lambda r: (r.num_turns, -r.skill_points_generated))
-        if skill_only_rotation:
-            return skill_only_rotation
-        return None
 
-    except ValueError:
-        return None
+def create_default_aggregators(queries: tuple[str, ...],
+                               char_name: Optional[str] = None) -> RotationAggregators:
+    """Creates an aggregator for each of the specified default categories."""
 
-
-def find_neutral_rotation(rotations: RotationList) -> Optional[Rotation]:
-    """Finds the shortest neutral rotation,
-    i.e., a rotation that uses an average of 0 skill points per turn.
-    Returns such a rotation if found, otherwise returns None."""
-
-    try:
-        skill_only_rotation = min((r for r in rotations
-                                   if r.skill_points_generated == 0),
-                                  key=lambda r: (r.num_turns))
-        if skill_only_rotation:
-            return skill_only_rotation
-        return None
-
-    except ValueError:
-        return None
-
-
-def find_best_rotation(rotations: RotationList) -> Rotation:
-    """Finds the best rotation, defined as the rotation with fewest turns,
-    as well as the lowest skill point per turn cost."""
-
-    best_rot = min(rotations,
-                   key=lambda r: (r.num_turns, -r.skill_points_generated))
-
-    return best_rot
+    return RotationAggregators({query: RotationAggregator(*DEFAULT_ROTATION_FILTERS[query])
+                                for query in queries}, char_name)
 
 
 def print_char_info(stats: CharStats, user_input: UserInput) -> None:
@@ -179,6 +134,15 @@ def print_char_info(stats: CharStats, user_input: UserInput) -> None:
     print(colored(char_info, "green"))
 
 
+def print_search_warning(aggregators: RotationAggregators) -> None:
+    """Warns the user if the search was stopped before it could finish,
+    as shorter or better rotations may exist, see "search_budget"."""
+
+    if not aggregators.is_complete:
+        print(colored("Search was stopped early, the rotations below may not be optimal",
+                      "yellow"))
+
+
 def print_rotation_info(rotation_name: str, rotation: Optional[Rotation], display_sp_cost=True) -> None:
     """Prints rotation info: name, energy generated, SP cost per turn, and turn sequence."""
 
@@ -197,32 +161,42 @@ def print_rotation_info(rotation_name: str, rotation: Optional[Rotation], displa
               f"{rotation.turn_sequence}")
 
 
-def calculate_turn_energy(user_input: UserInput) -> float:
-    """Calculates and returns the energy generated during each turn based on user inputs.
-    This includes follow-up attacks, kills, hits taken, ally hits taken,
-    talents, and relic triggers."""
+def print_top_rotations(aggregators: RotationAggregators) -> None:
+    """Prints the top rotations and their scores, from the highest score, see "rotation_scores".
+    If the search was stopped early, the user is warned, as better rotations may exist."""
 
-    if not user_input.active_counters:
-        return 0
-    elif user_input.active_counters != "every turn counter":
-        user_input.check_for_active_counters()
+    print_search_warning(aggregators)
+    ranking = aggregators.get_ranking("top")
+    print(f"Top {len(ranking)} rotations by score:")
+
+    for place, (score, rotation) in enumerate(ranking, start=1):
+        print(f"{place}. {round(score, 3)} ({rotation.energy_generated} energy, "
+              f"{rotation.sp_cost_per_turn} SP/T): {rotation.turn_sequence}")
+
+    print("\n")
 
-    turn_energy = 0
 
-    def process_action(counter: Counter) -> None:
-        nonlocal turn_energy
-        if not counter or counter.num_triggers == 0 or counter.energy == 0:
-            return
-        if counter.repeat_every_turn:
-            turn_energy += counter.energy * counter.num_triggers
-        elif counter.num_triggers > 0:
-            turn_energy += counter.energy
-            counter.num_triggers -= 1
+def print_value_rotation(value_rotations: RotationList, user_input: UserInput) -> None:
+    """Prints the rotation with the highest value and its value, see "value_algorithm"."""
 
-    for counter in user_input.counters.values():
-        process_action(counter)
+    limits = (f"within {user_input.max_value_turns} turns, "
+              f"spending at most {user_input.sp_budget} SP")
+
+    if not value_rotations.is_complete:
+        print(colored("Search was stopped early, the rotation below may not be optimal",
+                      "yellow"))
+
+    if not value_rotations:
+        print(f"No rotation reaches the Ultimate {limits}")
+        print("\n")
+        return
 
-    return turn_energy
+    rotation = value_rotations[0]
+    value = get_total_value(rotation, user_input.score_weights)
+    print(f"Highest value rotation {limits}:")
+    print(f"{round(value, 3)} ({rotation.energy_generated} energy, "
+          f"{rotation.sp_cost_per_turn} SP/T): {rotation.turn_sequence}")
+    print("\n")
 
 
 def determine_ally_hit_energy(stats: CharStats, user_input: UserInput) -> None:
@@ -239,59 +213,252 @@ def determine_ally_hit_energy(stats: CharStats, user_input: UserInput) -> None:
     stats.ally_get_hit = ally_hit_bonuses.get((user_input.char_name, True), 0)
 
 
-def print_er_breakpoint(function: Callable[[RotationList], Rotation],
-                        algorithm: Callable[[CharStats, UserInput], RotationList],
-                        all_rotations: RotationList,
+def print_er_breakpoint(query: str,
+                        algorithm: Callable[[CharStats, UserInput, RotationAggregators],
+                                            RotationAggregators],
                         old_rotation: Rotation,
                         stats: CharStats, user_input: UserInput,
-                        old_er: float, upper_bound=2) -> None:
-    """Uses a Binary Search Algorithm to calculate and print the Energy Recharge breakpoint,
+                        old_er: float, upper_bound=2, is_complete=True) -> None:
+    """Calculates and prints the Energy Recharge breakpoint,
     i.e., the amount of ER required to shorten such a rotation by one turn.
-    If total ER needed is higher than 200%, Binary Search will not be performed,
-    as there is no way to reach this much ER, as of now."""
+    If total ER needed is higher than 200%, it is not calculated,
+    as there is no way to reach this much ER, as of now.
+
+    If the user selected an ER sweep, every breakpoint up to the selected ER is printed instead,
+    along with the rotation that takes over at each one, see "_find_er_steps".
+    If any search is stopped early, breakpoints after it are not printed, as they could be wrong.
+    Breakpoints of a rotation found by a search that was stopped early, i.e., not complete,
+    aren't searched for at all, as the rotation itself could be wrong."""
 
     if not user_input.show_er_breakpoints or not old_rotation or old_rotation.num_turns == 1:
         return
 
-    lower_bound = old_er
-    precision = 0.00001
+    if not is_complete:
+        print("ER needed for the next breakpoint: unknown, the search was stopped early")
+        return
+
+    if user_input.er_sweep_limit > old_er:
+        _print_er_steps(query, algorithm, old_rotation, stats, user_input, old_er,
+                        user_input.er_sweep_limit)
+        return
 
-    stats.apply_energy_recharge(upper_bound)
-    user_input.check_for_active_counters()
+    steps, is_complete = _find_er_steps(query, algorithm, old_rotation, stats, user_input,
+                                        old_er, upper_bound, max_steps=1)
 
-    all_rotations = algorithm(stats, user_input)
-    new_rotation = function(all_rotations)
+    if not is_complete:
+        print("ER needed for the next breakpoint: unknown, the search was stopped early")
+    elif not steps:
+        print(f"Total ER needed for the next breakpoint: >{round(upper_bound * 100, 3)}%")
+    else:
+        print(f"ER needed for the next breakpoint: {round((steps[0][0] - old_er) * 100, 3)}%")
 
-    if new_rotation and old_rotation.turn_sequence == new_rotation.turn_sequence:
-        max_er = round(upper_bound * 100, 3)
-        print(f"Total ER needed for the next breakpoint: >{max_er}%")
-        stats.retrieve_cache("before-er-application", delete_cache=False)
-        stats.apply_energy_recharge(old_er)
+
+def _print_er_steps(query: str, algorithm: Callable, old_rotation: Rotation,
+                    stats: CharStats, user_input: UserInput,
+                    old_er: float, max_er: float) -> None:
+    """Prints every ER breakpoint up to the maximum ER, and the rotation that takes over."""
+
+    steps, is_complete = _find_er_steps(query, algorithm, old_rotation, stats, user_input,
+                                        old_er, max_er)
+    max_er_percent = round(max_er * 100, 3)
+
+    if not steps and is_complete:
+        print(f"No ER breakpoints up to {max_er_percent}% ER")
         return
 
-    while abs(upper_bound-lower_bound) >= precision:
+    print(f"ER breakpoints up to {max_er_percent}% ER:")
+
+    for energy_recharge, rotation in steps:
+        er_diff = round((energy_recharge - old_er) * 100, 3)
+        if rotation:
+            print(f"    +{er_diff}%: {rotation.num_turns} turns, {rotation.turn_sequence}")
+        else:
+            print(f"    +{er_diff}%: no rotation")
+
+    if not is_complete:
+        print("    Further breakpoints unknown, the search was stopped early")
+
+
+def _find_er_steps(query: str, algorithm: Callable, old_rotation: Rotation,
+                   stats: CharStats, user_input: UserInput, old_er: float, max_er: float,
+                   max_steps: Optional[int] = None) -> tuple[list[tuple[float, Optional[Rotation]]],
+                                                             bool]:
+    """Returns the ER values above the old one, up to the maximum ER,
+    at which the best rotation of the specified category changes,
+    each with the rotation that takes over (None if there is no rotation of the category),
+    as well as whether they could all be found. At most max_steps values are returned, if given.
+
+    If energy is linear in ER, all of them are computed directly, see "er_breakpoints".
+    Otherwise, a Binary Search Algorithm is used from every breakpoint to the next one,
+    see "_bisect_breakpoint". Stats are left at the old ER."""
+
+    model = get_energy_model(stats, user_input, old_er)
+    if model:
+        return _find_linear_er_steps(query, model, old_rotation, user_input.char_name,
+                                     old_er, max_er, max_steps), True
+
+    steps: list[tuple[float, Optional[Rotation]]] = []
+    rotation, energy_recharge, is_complete = old_rotation, old_er, True
+
+    while rotation and rotation.num_turns > 1 and len(steps) != max_steps:
+        energy_recharge, rotation, is_complete = _bisect_breakpoint(
+            query, algorithm, rotation, stats, user_input, energy_recharge, max_er)
+
+        if energy_recharge is None:
+            break
+
+        steps.append((energy_recharge, rotation))
+
+    set_energy_recharge(stats, user_input, old_er)
+
+    return steps, is_complete
+
+
+def _find_linear_er_steps(query: str, model: EnergyModel, old_rotation: Rotation,
+                          char_name: str, old_er: float, max_er: float,
+                          max_steps: Optional[int]) -> list[tuple[float, Optional[Rotation]]]:
+    """Found rotations only change at the critical ER values of the model,
+    so every interval between two of them is checked once, at its middle.
+    All the intervals are evaluated at once, see EnergyModel.find_best_rotations."""
+
+    steps: list[tuple[float, Optional[Rotation]]] = []
+    turn_sequence = old_rotation.turn_sequence
+    candidates = model.get_candidates(model.get_max_turns(old_er))
+    critical_ers = model.get_critical_ers(candidates, old_er, max_er)
+    rotations = model.find_best_rotations(
+        candidates, [(critical_er + next_er) / 2 for critical_er, next_er
+                     in zip(critical_ers, critical_ers[1:] + [max_er])],
+        *DEFAULT_ROTATION_FILTERS[query], char_name)
+
+    for critical_er, rotation in zip(critical_ers, rotations):
+        if rotation and rotation.turn_sequence == turn_sequence:
+            continue
+
+        steps.append((critical_er, rotation))
+        if not rotation or rotation.num_turns == 1 or len(steps) == max_steps:
+            break
+
+        turn_sequence = rotation.turn_sequence
+
+    return steps
+
+
+def _bisect_breakpoint(query: str, algorithm: Callable, old_rotation: Rotation,
+                       stats: CharStats, user_input: UserInput,
+                       lower_bound: float, upper_bound: float
+                       ) -> tuple[Optional[float], Optional[Rotation], bool]:
+    """Uses a Binary Search Algorithm to find the ER at which the best rotation
+    of the specified category changes, between the bounds.
+    Searches are shared by all categories, see "_find_rotation".
+
+    Returns the lowest ER the other rotation was found at, and that rotation, or None for both
+    if the rotation is the same at the upper bound, as well as whether every search finished."""
+
+    set_energy_recharge(stats, user_input, upper_bound)
+
+    new_rotation, is_complete = _find_rotation(query, algorithm, stats, user_input)
+
+    if not is_complete:
+        return None, None, False
+
+    if new_rotation and old_rotation.turn_sequence == new_rotation.turn_sequence:
+        return None, None, True
+
+    while abs(upper_bound-lower_bound) >= ER_PRECISION:
         mid_point = (upper_bound + lower_bound) / 2
-        new_er = mid_point
 
-        user_input.retrieve_cache("before-calculation")
-        user_input.check_for_active_counters()
-        stats.retrieve_cache("before-er-application", delete_cache=False)
-        stats.apply_energy_recharge(new_er)
+        set_energy_recharge(stats, user_input, mid_point)
 
-        all_rotations = algorithm(stats, user_input)
-        new_rotation = function(all_rotations)
+        mid_rotation, is_complete = _find_rotation(query, algorithm, stats, user_input)
 
-        if new_rotation and old_rotation.turn_sequence == new_rotation.turn_sequence:
+        if not is_complete:
+            return None, None, False
+
+        if mid_rotation and old_rotation.turn_sequence == mid_rotation.turn_sequence:
             lower_bound = mid_point
 
         else:
             upper_bound = mid_point
+            new_rotation = mid_rotation
+
+    return upper_bound, new_rotation, True
+
+
+def get_energy_model(stats: CharStats, user_input: UserInput,
+                     old_er: float) -> Optional[EnergyModel]:
+    """Creates the model of the character's energy as linear functions of ER,
+    or returns None if their energy isn't linear in ER. Stats are left at the old ER."""
+
+    current = get_energy_components(stats, user_input)
+    if current is None:
+        return None
+
+    components = []
+    for energy_recharge in (0, 1):
+        set_energy_recharge(stats, user_input, energy_recharge)
+        components.append(get_energy_components(stats, user_input))
+
+    set_energy_recharge(stats, user_input, old_er)
+
+    if None in components:
+        return None
+
+    return create_energy_model(stats, *components, current)
+
+
+def _find_rotation(query: str,
+                   algorithm: Callable[[CharStats, UserInput, RotationAggregators],
+                                       RotationAggregators],
+                   stats: CharStats, user_input: UserInput) -> tuple[Optional[Rotation], bool]:
+    """Runs the algorithm, streaming all rotations into an aggregator per default category,
+    and returns the best rotation of the specified category, if any was found,
+    as well as whether the search could finish.
+
+    Searches that finish are cached (see search_cache), so any category searching
+    at the same ER with the same stats and user input reuses them, instead of searching again."""
+
+    key = get_search_key(stats, user_input, algorithm)
+    rotations = SEARCH_CACHE.get(key)
+
+    if rotations is None:
+        aggregators = create_default_aggregators(tuple(DEFAULT_ROTATION_FILTERS),
+                                                 user_input.char_name)
+        algorithm(stats, user_input, aggregators)
+
+        if not aggregators.is_complete:
+            return aggregators.get(query), False
+
+        rotations = {query: aggregators.get(query) for query in DEFAULT_ROTATION_FILTERS}
+        SEARCH_CACHE.add(key, rotations)
+
+    return rotations[query], True
+
+
+def set_energy_recharge(stats: CharStats, user_input: UserInput,
+                        energy_recharge: float) -> None:
+    """Applies the energy recharge to the stats cached before it was first applied,
+    then adds the energy bonuses it doesn't affect and updates the energy of all counters,
+    the same way they are determined before the first search."""
 
     stats.retrieve_cache("before-er-application", delete_cache=False)
-    stats.apply_energy_recharge(old_er)
+    stats.apply_energy_recharge(energy_recharge)
+    apply_raw_energy_bonuses(stats, user_input)
+    determine_counter_energy_values(stats, user_input)
+
+
+def apply_raw_energy_bonuses(stats: CharStats, user_input: UserInput) -> None:
+    """Adds the energy bonuses that are not affected by energy recharge,
+    i.e., Tingyun's Ultimate and HuoHuo's Ultimate."""
+
+    if user_input.assume_tingyun_ult:
+        stats.init_energy += 50
+
+    elif user_input.assume_tingyun_ult and user_input.assume_tingyun_e6:
+        stats.init_energy += 60
 
-    er_diff = round((new_er - old_er) * 100, 3)
-    print(f"ER needed for the next breakpoint: {er_diff}%")
+    if user_input.huohuo_ult_level > 0:
+        bonus = HUOHUO_PERCENT_ENERGY_BONUSES[user_input.huohuo_ult_level - 1]
+        stats.init_energy += bonus / 100 * stats.ult_cost
 
 
 def determine_counter_energy_values(stats: CharStats, user_input: UserInput) -> None:
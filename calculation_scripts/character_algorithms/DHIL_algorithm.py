@@ -1,76 +1,48 @@
-"""This module contains a specific algorithm for Dan Heng Imbibitor Lunae (DHIL)."""
+"""This module contains a specific print function for Dan Heng Imbibitor Lunae (DHIL)."""
 
 from character_utils.characters import CharStats
-from equipment_utils.support_light_cones import apply_support_lcs
 from gui_scripts.user_input import UserInput
 from ..detailed_breakdown import print_detailed_breakdown
-from calculation_scripts.rotation import Rotation, RotationList
-from calculation_scripts.calculations_utils import (calculate_turn_energy,
-                                                    print_char_info, print_rotation_info)
+from calculation_scripts.rotation import Rotation
+from calculation_scripts.rotation_aggregators import RotationAggregator, RotationAggregators
+from calculation_scripts.search_bound import DHIL_QUERIES
+from calculation_scripts.calculations_utils import (
+    print_char_info, print_rotation_info, print_search_warning)
 
 
-def dfs_algorithm_dhil(stats: CharStats, user_input: UserInput) -> RotationList:
-    """Dan Heng Imbibitor Lunae, or DHIL for short,
-    possesses the ability to use 3 levels of enhanced basic attacks
-    which generate more energy (30, 35, 40 respectively).
-    Their costs are 1, 2, and 3 skill points respectively.
-    Additionally, DHIL can get stacks through the use of his ultimate or technique
-    these stacks can be used instead of regular Skill Points."""
+def create_dhil_aggregators() -> RotationAggregators:
+    """Creates aggregators for DHIL's best rotation, and for each of his skill point breakpoints,
+    e.g., "sp_per_turn>=-0.5" for rotations that cost at most 0.5 skill points per turn."""
 
-    all_rotations = RotationList()
-    stack = [(stats.init_energy, [], stats.init_sp)]
+    aggregators = {"best": RotationAggregator(lambda r: True, _get_best_rotation_sorting_key)}
 
-    while stack:
-        curr_energy, turns, skill_points_generated = stack.pop()
+    for query in DHIL_QUERIES[1:]:
+        sp_cost_per_turn = float(query.split(">=")[1])
+        aggregators[query] = RotationAggregator(
+            lambda r, sp_cost_per_turn=sp_cost_per_turn: r.sp_cost_per_turn >= sp_cost_per_turn,
+            _get_best_general_sorting_key)
 
-        if curr_energy >= stats.ult_cost:
-            all_rotations.add_rotation(curr_energy, turns,
-                                       skill_points_generated)
-            continue
-
-        curr_energy = apply_support_lcs(stats, user_input, curr_energy)
-        curr_energy += calculate_turn_energy(user_input)
-
-        # DHIL uses Basic Attack
-        stack.append((curr_energy + stats.basic,
-                      turns + ["BASIC"],
-                      skill_points_generated + 1))
-
-        # DHIL uses Enhanced Attack 1
-        stack.append((curr_energy + stats.e_basic,
-                      turns + ["EB1"],
-                      skill_points_generated - 1))
-
-        # DHIL uses Enhanced Attack 2
-        stack.append((curr_energy + stats.e_basic_2,
-                      turns + ["EB2"],
-                      skill_points_generated - 2))
-
-        # DHIL uses Enhanced Attack 3
-        stack.append((curr_energy + stats.e_basic_3,
-                      turns + ["EB3"],
-                      skill_points_generated - 3))
-
-    return all_rotations
+    return RotationAggregators(aggregators, "Dan Heng IL")
 
 
 def print_results_dhil(stats: CharStats, user_input: UserInput,
-                       all_rotations: RotationList) -> None:
+                       aggregators: RotationAggregators) -> None:
     """Prints DHIL's various rotations. This includes his best, most effective rotation,
     as well as rotations with various skill point breakpoints.
     Such breakpoints include -0.5, -1.25, -1.5, -2, and -2.33 skill points per turn (SP/T)."""
 
     print_char_info(stats, user_input)
+    print_search_warning(aggregators)
 
-    best_rotation = min(all_rotations, key=_get_best_rotation_sorting_key)
+    best_rotation = aggregators.get("best")
     print_rotation_info("Best rotation", best_rotation)
 
-    print_dhil_rotation(all_rotations, sp_cost_per_turn=0)
-    print_dhil_rotation(all_rotations, sp_cost_per_turn=-0.5)
-    print_dhil_rotation(all_rotations, sp_cost_per_turn=-1.25)
-    print_dhil_rotation(all_rotations, sp_cost_per_turn=-1.5)
-    print_dhil_rotation(all_rotations, sp_cost_per_turn=-2)
-    print_dhil_rotation(all_rotations, sp_cost_per_turn=-2.33)
+    print_dhil_rotation(aggregators, sp_cost_per_turn=0)
+    print_dhil_rotation(aggregators, sp_cost_per_turn=-0.5)
+    print_dhil_rotation(aggregators, sp_cost_per_turn=-1.25)
+    print_dhil_rotation(aggregators, sp_cost_per_turn=-1.5)
+    print_dhil_rotation(aggregators, sp_cost_per_turn=-2)
+    print_dhil_rotation(aggregators, sp_cost_per_turn=-2.33)
 
     print("\n")
 
@@ -78,12 +50,10 @@ def print_results_dhil(stats: CharStats, user_input: UserInput,
         print_detailed_breakdown(stats, user_input, best_rotation)
 
 
-def print_dhil_rotation(all_rotations: RotationList, sp_cost_per_turn: float) -> None:
+def print_dhil_rotation(aggregators: RotationAggregators, sp_cost_per_turn: float) -> None:
     """Prints the best DHIL's rotation with the specified Skill Point cost per turn, or less."""
 
-    rotation = min((r for r in all_rotations
-                    if r.sp_cost_per_turn >= sp_cost_per_turn),
-                   key=lambda r: _get_best_general_sorting_key(r))
+    rotation = aggregators.get(f"sp_per_turn>={sp_cost_per_turn}")
 
     if sp_cost_per_turn == 0:
         rotation_name = "Neutral rotation"
@@ -100,8 +70,8 @@ def _get_best_rotation_sorting_key(rotation: Rotation) -> tuple:
     that still favours damage potential where possible."""
 
     sorting_key = (rotation.num_turns, -rotation.sp_cost_per_turn,
-                   -rotation.turns.count("EB3"), -rotation.turns.count("EB2"),
-                   -rotation.turns.count("EB1"), -rotation.turns.count("BASIC"))
+                   -rotation.e_basic_3_count, -rotation.e_basic_2_count,
+                   -rotation.e_basic_count, -rotation.basic_count)
 
     return sorting_key
 
@@ -114,7 +84,7 @@ def _get_best_general_sorting_key(rotation: Rotation) -> tuple:
     This is important as DHIL's damage output scales very well with SP usage."""
 
     sorting_key = (rotation.num_turns,
-                   -rotation.turns.count("EB3"), -rotation.turns.count("EB2"),
-                   -rotation.turns.count("EB1"), -rotation.turns.count("BASIC"))
+                   -rotation.e_basic_3_count, -rotation.e_basic_2_count,
+                   -rotation.e_basic_count, -rotation.basic_count)
 
     return sorting_key
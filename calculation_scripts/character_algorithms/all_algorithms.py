@@ -1,62 +1,121 @@
 """Module used for selecting and applying the correct character algorithm."""
 
-from typing import Callable
+from copy import copy
+from typing import Callable, Optional
 from character_utils.characters import CharStats
 from gui_scripts.user_input import UserInput
 from calculation_scripts.rotation import RotationList
-from .default_algorithm import dfs_algorithm_default, print_results_default
-from .argenti_algorithm import dfs_algorithm_argenti, print_results_argenti
-from .arlan_algorithm import dfs_algorithm_arlan
-from .blade_algorithm import dfs_algorithm_blade, print_results_blade
-from .DHIL_algorithm import dfs_algorithm_dhil, print_results_dhil
-from .fu_xuan_algorithm import dfs_algorithm_fx
-from .jingliu_algorithm import dfs_algorithm_jingliu
-from .luka_algorithm import dfs_algorithm_luka
-from .topaz_algorithm import dfs_algorithm_topaz
-from .fire_mc_algorithm import dfs_algorithm_fire_mc
-
-
-def apply_correct_algorithm(stats: CharStats, user_input: UserInput) -> RotationList:
-    """Applies the correct Depth-First Search algorithm, that is,
-    certain characters have their own customized algorithms,
-    others use the default one.
-    And returns all rotations found by the algorithm."""
-
-    specific_algorithms = {
-        "Argenti": dfs_algorithm_argenti,
-        "Arlan": dfs_algorithm_arlan,
-        "Blade": dfs_algorithm_blade,
-        "Dan Heng IL": dfs_algorithm_dhil,
-        "Fu Xuan": dfs_algorithm_fx,
-        "Jingliu": dfs_algorithm_jingliu,
-        "Luka": dfs_algorithm_luka,
-        "Topaz": dfs_algorithm_topaz,
-        "Trailblazer (Preservation)": dfs_algorithm_fire_mc
-    }
-
-    user_input.cache("before-calculation")
-    algorithm = specific_algorithms.get(user_input.char_name,
-                                        dfs_algorithm_default)
-    user_input.retrieve_cache("before-calculation")
-
-    unique_rotations = algorithm(stats, user_input)
+from calculation_scripts.rotation_aggregators import RotationAggregators, TopRotationsAggregator
+from calculation_scripts.rotation_scores import create_weighted_score
+from calculation_scripts.calculations_utils import (create_default_aggregators, print_top_rotations,
+                                                    print_value_rotation)
+from calculation_scripts.search_bound import get_queries
+from character_utils.mechanics import get_mechanics
+from .mechanics_algorithm import dfs_algorithm_mechanics, value_algorithm_mechanics
+from .default_algorithm import print_results_default
+from .argenti_algorithm import print_results_argenti
+from .blade_algorithm import print_results_blade
+from .DHIL_algorithm import create_dhil_aggregators, print_results_dhil
+
+# Search modes that find every rotation, rather than skipping the ones that can't be the shortest
+FULL_SEARCH_MODES = ("exhaustive", "frontier")
+
+
+def apply_correct_algorithm(stats: CharStats, user_input: UserInput,
+                            aggregators: Optional[RotationAggregators] = None
+                            ) -> RotationList | RotationAggregators:
+    """Applies the Depth-First Search algorithm to the character's mechanics, that is,
+    certain characters have their own mechanics (stacks, enhanced attacks, etc.),
+    others use the default ones.
+    And returns all rotations found by the algorithm.
+
+    If aggregators are given, rotations are streamed into them instead,
+    and the aggregators are returned, see "create_aggregators"."""
+
+    mechanics = get_mechanics(user_input.char_name)
+
+    if aggregators is not None:
+        return dfs_algorithm_mechanics(stats, user_input, mechanics, aggregators)
+
+    unique_rotations = dfs_algorithm_mechanics(stats, user_input, mechanics)
     unique_rotations.process_rotation_data(user_input.char_name)
 
     return unique_rotations
 
 
-def print_results(stats: CharStats, user_input: UserInput, all_rotations: RotationList,
-                  algorithm: Callable[[CharStats, UserInput], RotationList]) -> None:
+def apply_value_algorithm(stats: CharStats, user_input: UserInput) -> RotationList:
+    """Finds the rotation with the highest value within the selected number of turns
+    and skill point budget, see "value_algorithm"."""
+
+    return value_algorithm_mechanics(stats, user_input, get_mechanics(user_input.char_name))
+
+
+def apply_top_rotations_algorithm(stats: CharStats, user_input: UserInput) -> RotationAggregators:
+    """Ranks the top rotations out of all rotations, found by the exhaustive search,
+    for search modes that skip rotations which can't be the shortest ones."""
+
+    exhaustive_input = copy(user_input)
+    exhaustive_input.search_mode = "exhaustive"
+
+    return apply_correct_algorithm(
+        stats, exhaustive_input,
+        RotationAggregators({"top": _create_top_aggregator(user_input)}, user_input.char_name))
+
+
+def create_aggregators(user_input: UserInput) -> RotationAggregators:
+    """Creates aggregators for all categories of rotations the character's print function uses.
+    If the user asked for the top rotations, and the selected search mode finds every rotation,
+    they are ranked by their weighted score as well, see "apply_top_rotations_algorithm"."""
+
+    if user_input.char_name == "Dan Heng IL":
+        aggregators = create_dhil_aggregators()
+    else:
+        aggregators = create_default_aggregators(get_queries(user_input.char_name),
+                                                 user_input.char_name)
+
+    if user_input.num_top_rotations > 0 and user_input.search_mode in FULL_SEARCH_MODES:
+        aggregators.aggregators["top"] = _create_top_aggregator(user_input)
+
+    return aggregators
+
+
+def _create_top_aggregator(user_input: UserInput) -> TopRotationsAggregator:
+    return TopRotationsAggregator(lambda rotation: True,
+                                  create_weighted_score(user_input.score_weights),
+                                  user_input.num_top_rotations)
+
+
+def print_results(stats: CharStats, user_input: UserInput, aggregators: RotationAggregators,
+                  algorithm: Callable[..., RotationList | RotationAggregators]) -> None:
     """Prints calculation results for the given character. 
     If the character has a custom print function, that function will be used. 
-    Otherwise, a default print function will be applied instead."""
+    Otherwise, a default print function will be applied instead.
+
+    The top and the highest value rotations are found before any print function is applied,
+    as print functions can change the character's stats, e.g., to find ER breakpoints."""
+
+    top_aggregators = None
+    if "top" in aggregators.aggregators:
+        top_aggregators = aggregators
+    elif user_input.num_top_rotations > 0:
+        top_aggregators = apply_top_rotations_algorithm(stats, user_input)
+
+    value_rotations = None
+    if user_input.max_value_turns > 0:
+        value_rotations = apply_value_algorithm(stats, user_input)
 
     match user_input.char_name:
         case "Argenti":
-            print_results_argenti(stats, user_input, all_rotations, algorithm)
+            print_results_argenti(stats, user_input, aggregators, algorithm)
         case "Blade":
-            print_results_blade(stats, user_input, all_rotations, algorithm)
+            print_results_blade(stats, user_input, aggregators, algorithm)
         case "Dan Heng IL":
-            print_results_dhil(stats, user_input, all_rotations)
+            print_results_dhil(stats, user_input, aggregators)
         case _:
-            print_results_default(stats, user_input, all_rotations, algorithm)
+            print_results_default(stats, user_input, aggregators, algorithm)
+
+    if top_aggregators is not None:
+        print_top_rotations(top_aggregators)
+
+    if value_rotations is not None:
+        print_value_rotation(value_rotations, user_input)
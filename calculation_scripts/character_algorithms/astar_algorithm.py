@@ -0,0 +1,144 @@
+"""This module contains the A* search algorithm, used by the A* search mode.
+
+Rotations are explored in the order of the lowest number of turns they can possibly take,
+estimated by the search bound (remaining energy divided by the highest energy a turn can generate),
+with higher skill point balance breaking ties.
+Once the shortest rotation of a category is found, only branches that can still
+take as few turns are explored, the rest of the search space is never enumerated.
+
+Every category (best, neutral, etc.) is searched separately, and the results are merged
+in the order the Depth-First Search would have found them in, see frontier_algorithm."""
+
+from heapq import heappop, heappush
+from itertools import count
+from math import inf
+from typing import TYPE_CHECKING, Optional
+from character_utils.characters import CharStats
+from calculation_scripts.rotation import (RotationList, get_action_bit, get_action_count,
+                                          get_num_turns)
+from calculation_scripts.search_bound import SearchBound, can_match_query, matches_query
+from calculation_scripts.search_budget import SearchBudget
+from calculation_scripts.turn_effects import TurnEffects
+from .frontier_algorithm import create_rotation_list, get_digit, store_leaf
+
+if TYPE_CHECKING:
+    from .mechanics_algorithm import CompiledAction
+
+
+def astar_algorithm(stats: CharStats, turn_effects: TurnEffects, init_energy: float,
+                    initial_resources: tuple[int, ...],
+                    turn_start_actions: list["CompiledAction"],
+                    actions: list["CompiledAction"], bound: SearchBound,
+                    stored_energy: tuple[int, float],
+                    budget: Optional[SearchBudget] = None) -> RotationList:
+    """Finds the shortest rotations of every category the search bound was created for.
+    All rotations as short as the shortest one are kept,
+    so that ties are resolved the same way as with the exhaustive search.
+    The budget, if any, is shared by the searches of all categories."""
+
+    action_names = list(dict.fromkeys(action.name for action in actions
+                                      if action.kind == "action"))
+    leaves: dict[tuple[int, ...], tuple[int, int, float, int]] = {}
+    is_complete = True
+
+    for query in bound.queries:
+        is_complete = _search_query(query, stats, turn_effects, init_energy, initial_resources,
+                                    turn_start_actions, actions, bound, stored_energy,
+                                    action_names, leaves, budget)
+        if not is_complete:
+            break
+
+    all_rotations = create_rotation_list(leaves, action_names, len(actions) + 1)
+    all_rotations.is_complete = is_complete
+
+    return all_rotations
+
+
+def _search_query(query: str, stats: CharStats, turn_effects: TurnEffects, init_energy: float,
+                  initial_resources: tuple[int, ...],
+                  turn_start_actions: list["CompiledAction"],
+                  actions: list["CompiledAction"], bound: SearchBound,
+                  stored_energy: tuple[int, float], action_names: list[str],
+                  leaves: dict[tuple[int, ...], tuple[int, int, float, int]],
+                  budget: Optional[SearchBudget]) -> bool:
+    """A* search for the shortest rotations of a single category.
+    Search stops once every branch left could only lead to longer rotations.
+    Returns False if it was stopped by the budget instead.
+
+    Identical states lead to identical rotations, so a state is only expanded again
+    if it's reached by a branch the Depth-First Search would have explored first."""
+
+    stored_energy_index, energy_per_unit = stored_energy
+    base = len(actions) + 1
+    action_bits = [get_action_bit(action.name) if action.kind == "action" else 0
+                   for action in actions]
+    tie_breaker = count()
+    expanded: dict[tuple, int] = {}
+    shortest = inf
+    next_check = budget.next_check(budget.num_nodes) if budget else inf
+
+    def push(curr_energy, rotation_key, skill_points_generated, resources, order, depth):
+        if not can_match_query(query, rotation_key):
+            return
+
+        estimate = curr_energy
+        if stored_energy_index != -1:
+            estimate += resources[stored_energy_index] * energy_per_unit
+
+        min_turns = bound.min_turns(query, estimate, rotation_key)
+        if min_turns <= shortest:
+            heappush(heap, (min_turns, -skill_points_generated, next(tie_breaker),
+                            (curr_energy, rotation_key, skill_points_generated, resources,
+                             order, depth)))
+
+    heap = []
+    push(init_energy, 0, stats.init_sp, initial_resources, 0, 0)
+
+    while heap:
+        min_turns, _, _, state = heappop(heap)
+        if min_turns > shortest:
+            break
+
+        curr_energy, rotation_key, skill_points_generated, resources, order, depth = state
+
+        if curr_energy >= stats.ult_cost:
+            if matches_query(query, rotation_key, skill_points_generated):
+                shortest = min(shortest, max(get_num_turns(rotation_key), 1))
+                key = tuple(get_action_count(rotation_key, name) for name in action_names)
+                store_leaf(leaves, key, order, depth, curr_energy, skill_points_generated, base)
+            continue
+
+        # Every expanded state starts a turn, so the depth is the index of the turn
+        turn = min(depth, turn_effects.last_turn)
+        state_key = (rotation_key, curr_energy, skill_points_generated, resources, turn)
+        if expanded.get(state_key, inf) <= order:
+            continue
+        expanded[state_key] = order
+
+        if budget:
+            budget.num_nodes += 1
+            if budget.num_nodes >= next_check:
+                if budget.check(budget.num_nodes):
+                    return False
+                next_check = budget.next_check(budget.num_nodes)
+
+        hits_taken = turn_effects.get_hits_taken(turn)
+
+        for action in turn_start_actions:
+            if action.is_available(resources):
+                resources = action.apply(resources, hits_taken)
+                curr_energy += action.energy[0]
+
+        curr_energy, _, turn_stats = turn_effects.start_turn(stats, curr_energy, turn)
+        is_buffed = turn_stats is not stats
+
+        for i, action in enumerate(actions):
+            if not action.is_available(resources):
+                continue
+
+            push(curr_energy + action.energy[is_buffed], rotation_key + action_bits[i],
+                 skill_points_generated + action.skill_points,
+                 action.apply(resources, hits_taken),
+                 order * base + get_digit(i, len(actions)), depth + 1)
+
+    return True
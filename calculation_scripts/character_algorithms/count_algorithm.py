@@ -0,0 +1,126 @@
+"""This module contains a count-vector enumeration algorithm,
+used in place of the Depth-First Search for characters whose actions
+do not depend on the order in which they are used."""
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Optional
+from character_utils.characters import CharStats
+from gui_scripts.user_input import UserInput
+from calculation_scripts.rotation import RotationList, create_rotation_key
+from calculation_scripts.search_budget import SearchBudget
+from calculation_scripts.turn_effects import create_turn_effects
+from calculation_scripts.search_bound import (can_improve_answers, get_shortest_first_queries,
+                                              update_answers)
+
+
+@dataclass(slots=True, frozen=True)
+class Action:
+    """Class representing a single action a character can take during their turn.
+    It's attributes include:
+    - the name the action is displayed with
+    - the energy it generates
+    - its skill point cost (negative if it consumes skill points)"""
+
+    name: str
+    energy: float
+    skill_points: int
+
+
+def is_order_independent(user_input: UserInput) -> bool:
+    """Checks whether the energy generated at the start of each turn
+    is the same for every turn, i.e., whether the rotation depends
+    only on the number of each action used and not on their order.
+
+    This is not the case if there are any counters with a limited number of triggers
+    or triggers given turn by turn, or if there is a support Light Cone that has any triggers."""
+
+    if (user_input.support_light_cone
+            and user_input.support_light_cone.trigger.num_triggers > 0):
+        return False
+
+    return not any(counter.get_num_changing_turns() > 0 and counter.energy != 0
+                   for counter in user_input.counters.values())
+
+
+def count_algorithm(stats: CharStats, user_input: UserInput, actions: tuple[Action, ...],
+                    budget: Optional[SearchBudget] = None) -> RotationList:
+    """Enumerates rotations as counts of each action, e.g. (n_basic, n_skill),
+    instead of walking every possible ordering of those actions.
+    This yields the same unique rotations as the Depth-First Search,
+    but the number of explored states grows polynomially
+    instead of exponentially with the length of the rotation.
+
+    Should only be used when the energy generated each turn
+    does not depend on the order of actions, see "is_order_independent".
+
+    In the shortest-first search mode, rotations are enumerated one turn at a time,
+    until the shortest rotations of every requested category are found.
+    The budget, if any, is checked once per turn, every state counting as a single node."""
+
+    turn_energy, _, _ = create_turn_effects(stats, user_input).start_turn(stats, 0, 0)
+
+    return count_rotations(stats.init_energy, stats.init_sp, stats.ult_cost, turn_energy,
+                           actions, get_shortest_first_queries(user_input), budget)
+
+
+def count_rotations(init_energy: float, init_sp: int, ult_cost: float, turn_energy: float,
+                    actions: tuple[Action, ...], queries: tuple[str, ...] = (),
+                    budget: Optional[SearchBudget] = None) -> RotationList:
+    """Enumerates rotations as counts of each action, given the energy gained
+    at the start of every turn, see "count_algorithm".
+    If any queries are given, enumeration stops once their shortest rotations are found."""
+
+    all_rotations = RotationList()
+    action_names = [action.name for action in actions]
+
+    if init_energy >= ult_cost:
+        all_rotations.add_rotation(init_energy,
+                                   create_rotation_key(action_names, (0,) * len(actions)),
+                                   init_sp)
+        return all_rotations
+
+    answers: dict[str, int] = {}
+    leaves: dict[tuple[int, ...], tuple[float, int]] = {}
+    frontier = {(0,) * len(actions): (init_energy, init_sp)}
+    num_nodes = 0
+
+    while frontier:
+        num_nodes += len(frontier)
+        if budget and budget.check(num_nodes):
+            all_rotations.is_complete = False
+            break
+
+        next_frontier: dict[tuple[int, ...], tuple[float, int]] = {}
+        num_leaves = len(leaves)
+
+        for counts, (curr_energy, skill_points_generated) in frontier.items():
+            curr_energy += turn_energy
+
+            for i, action in enumerate(actions):
+                new_counts = counts[:i] + (counts[i] + 1,) + counts[i + 1:]
+                new_state = (curr_energy + action.energy,
+                             skill_points_generated + action.skill_points)
+
+                if new_state[0] >= ult_cost:
+                    leaves.setdefault(new_counts, new_state)
+                else:
+                    next_frontier.setdefault(new_counts, new_state)
+
+        frontier = next_frontier
+
+        if queries:
+            for counts, (_, skill_points_generated) in islice(leaves.items(), num_leaves, None):
+                update_answers(answers, queries, create_rotation_key(action_names, counts),
+                               skill_points_generated)
+
+            frontier = {counts: state for counts, state in frontier.items()
+                        if can_improve_answers(answers, queries,
+                                               create_rotation_key(action_names, counts),
+                                               sum(counts) + 1)}
+
+    for counts, (energy, skill_points_generated) in leaves.items():
+        all_rotations.add_rotation(energy, create_rotation_key(action_names, counts),
+                                   skill_points_generated)
+
+    return all_rotations
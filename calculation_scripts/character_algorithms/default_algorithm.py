@@ -1,54 +1,16 @@
-"""This module contains a default Depth-First Search algorithm
+"""This module contains the default print function
 for characters that do not have a specialized one."""
 
 from typing import Callable
 from character_utils.characters import CharStats
 from ..detailed_breakdown import print_detailed_breakdown
 from gui_scripts.user_input import UserInput
-from equipment_utils.support_light_cones import apply_support_lcs
-from calculation_scripts.rotation import RotationList
+from calculation_scripts.rotation_aggregators import RotationAggregators
 from calculation_scripts.calculations_utils import (
-    calculate_turn_energy, find_basic_only_rotation,
-    find_best_rotation,
-    find_neutral_rotation, find_one_skill_rotation,
-    find_skill_only_rotation, print_char_info,
-    print_rotation_info, print_er_breakpoint)
+    print_char_info, print_rotation_info, print_er_breakpoint, print_search_warning)
 
 
-def dfs_algorithm_default(stats: CharStats, user_input: UserInput) -> RotationList:
-    """Default Depth-First Search algorithm that determines
-    the shortest and most skill-point positive rotation.
-    Positive rotations are defined as those that use more basic attacks than skills,
-    as the former generate skill points, and the latter consume them."""
-
-    all_rotations = RotationList()
-    stack = [(stats.init_energy, [], stats.init_sp)]
-
-    while stack:
-        curr_energy, turns, skill_points_generated = stack.pop()
-
-        if curr_energy >= stats.ult_cost:
-            all_rotations.add_rotation(curr_energy, turns,
-                                       skill_points_generated)
-            continue
-
-        curr_energy = apply_support_lcs(stats, user_input, curr_energy)
-        curr_energy += calculate_turn_energy(user_input)
-
-        # Character uses Basic Attack
-        stack.append((curr_energy + stats.basic,
-                     turns + ["BASIC"],
-                     skill_points_generated + 1))
-
-        # Character uses Skill
-        stack.append((curr_energy + stats.skill,
-                     turns + ["SKILL"],
-                     skill_points_generated - 1))
-
-    return all_rotations
-
-
-def print_results_default(stats: CharStats, user_input: UserInput, all_rotations: RotationList, algorithm: Callable):
+def print_results_default(stats: CharStats, user_input: UserInput, aggregators: RotationAggregators, algorithm: Callable):
     """Prints various rotation results, for example, the following:
         - character info: their name, energy recharge,
         Light Cone that's equipped and its superimposition
@@ -60,41 +22,38 @@ def print_results_default(stats: CharStats, user_input: UserInput, all_rotations
         useful for buffers/debuffers to see if rotation coincides with buff/debuff duration
         - Shortest, most skill-positive rotation, i.e.,
         it prioritizes rotations with the lowest skill point cost
-        if multiple rotations are eligible."""
+        if multiple rotations are eligible.
+    All of these rotations are taken from the aggregators the algorithm was run with."""
 
     print_char_info(stats, user_input)
+    print_search_warning(aggregators)
 
-    best_rotation = find_best_rotation(all_rotations)
+    best_rotation = aggregators.get("best")
     print_rotation_info("Most optimal rotation", best_rotation)
-    print_er_breakpoint(find_best_rotation, algorithm, all_rotations,
-                        best_rotation, stats, user_input,
-                        stats.energy_recharge)
+    print_er_breakpoint("best", algorithm, best_rotation, stats, user_input,
+                        stats.energy_recharge, is_complete=aggregators.is_complete)
 
-    neutral_rotation = find_neutral_rotation(all_rotations)
+    neutral_rotation = aggregators.get("neutral")
     print_rotation_info("Neutral rotation", neutral_rotation)
-    print_er_breakpoint(find_neutral_rotation, algorithm, all_rotations,
-                        neutral_rotation, stats, user_input,
-                        stats.energy_recharge)
+    print_er_breakpoint("neutral", algorithm, neutral_rotation, stats, user_input,
+                        stats.energy_recharge, is_complete=aggregators.is_complete)
 
-    basic_only_rot = find_basic_only_rotation(all_rotations)
+    basic_only_rot = aggregators.get("basic_only")
     if basic_only_rot:
         print_rotation_info("Basic only rotation", basic_only_rot)
-        print_er_breakpoint(find_basic_only_rotation, algorithm, all_rotations,
-                            basic_only_rot, stats, user_input,
-                            stats.energy_recharge)
+        print_er_breakpoint("basic_only", algorithm, basic_only_rot, stats, user_input,
+                            stats.energy_recharge, is_complete=aggregators.is_complete)
 
-    skill_only_rot = find_skill_only_rotation(all_rotations)
+    skill_only_rot = aggregators.get("skill_only")
     if skill_only_rot:
         print_rotation_info("Skill only rotation", skill_only_rot)
-        print_er_breakpoint(find_skill_only_rotation, algorithm, all_rotations,
-                            skill_only_rot, stats, user_input,
-                            stats.energy_recharge)
+        print_er_breakpoint("skill_only", algorithm, skill_only_rot, stats, user_input,
+                            stats.energy_recharge, is_complete=aggregators.is_complete)
 
-    one_skill_rot = find_one_skill_rotation(all_rotations)
+    one_skill_rot = aggregators.get("one_skill")
     print_rotation_info("One skill rotation", one_skill_rot)
-    print_er_breakpoint(find_one_skill_rotation, algorithm, all_rotations,
-                        one_skill_rot, stats, user_input,
-                        stats.energy_recharge)
+    print_er_breakpoint("one_skill", algorithm, one_skill_rot, stats, user_input,
+                        stats.energy_recharge, is_complete=aggregators.is_complete)
 
     print("\n")
 
@@ -0,0 +1,362 @@
+"""This module contains a level-synchronous search algorithm,
+an alternative to the Depth-First Search kernels that uses NumPy.
+
+Instead of expanding one state at a time, the whole frontier of states at the same depth
+is stored in arrays (energy, skill points, action counts, resources),
+and every action is applied to all the states it's available in at once.
+All states at the same depth start the same turn, so they share a single entry of the schedule
+of counters and support Light Cones (see turn_effects).
+
+The Depth-First Search keeps the first rotation it finds for every unique combination of actions,
+so every state also stores its position in the search order,
+encoded as a number whose digits are the actions taken (see "get_digit").
+This way the same rotations are found, in the same order."""
+
+from dataclasses import dataclass
+from math import inf
+from typing import TYPE_CHECKING, Optional
+import numpy as np
+from character_utils.characters import CharStats
+from calculation_scripts.rotation import RotationList, create_rotation_key
+from calculation_scripts.search_budget import SearchBudget
+from calculation_scripts.turn_effects import TurnEffects
+from calculation_scripts.search_bound import (BASICS, SKILLS, depends_on_skill_points,
+                                              update_answers)
+
+if TYPE_CHECKING:
+    from .mechanics_algorithm import CompiledAction
+
+# Orders are stored as 64-bit integers until they could overflow,
+# after which they are stored as Python integers
+MAX_ORDER = 2 ** 62
+
+
+@dataclass(slots=True)
+class Frontier:
+    """All states at the same depth of the search. Its attributes include:
+    - energy and skill points generated in every state
+    - number of every action used so far
+    - resources (stacks, charges, etc.)
+    - order in which the Depth-First Search would reach every state
+    - whether the energy is a float, as the Depth-First Search keeps whole numbers as integers"""
+
+    energy: np.ndarray
+    skill_points: np.ndarray
+    counts: np.ndarray
+    resources: np.ndarray
+    order: np.ndarray
+    is_float: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.energy)
+
+    def select(self, mask: np.ndarray) -> "Frontier":
+        return Frontier(self.energy[mask], self.skill_points[mask], self.counts[mask],
+                        self.resources[mask], self.order[mask], self.is_float[mask])
+
+
+def frontier_algorithm(stats: CharStats, turn_effects: TurnEffects, init_energy: float,
+                       initial_resources: tuple[int, ...],
+                       turn_start_actions: list["CompiledAction"],
+                       actions: list["CompiledAction"],
+                       queries: tuple[str, ...] = (),
+                       budget: Optional[SearchBudget] = None) -> RotationList:
+    """Finds the same rotations as the Depth-First Search, one depth at a time.
+
+    Every depth consists of the following steps:
+    - states that reached the Ultimate cost are collected as rotations
+    - duplicate states are collapsed, keeping the one reached first
+    - turn start actions, counters, and support Light Cones are applied
+    - every action is applied to the states it's available in
+
+    If any queries are specified (shortest-first search mode), states that can no longer
+    be one of the shortest rotations of any requested category are not expanded,
+    so the search stops once the shortest rotations of every category are found.
+    The budget, if any, is checked once per depth, every state counting as a single node."""
+
+    action_names = list(dict.fromkeys(action.name for action in actions
+                                      if action.kind == "action"))
+    base = len(actions) + 1
+    frontier = Frontier(np.array([init_energy], dtype=float),
+                        np.array([stats.init_sp], dtype=np.int64),
+                        np.zeros((1, len(action_names)), dtype=np.int64),
+                        np.array([initial_resources], dtype=np.int64).reshape(1, -1),
+                        np.zeros(1, dtype=np.int64),
+                        np.array([isinstance(init_energy, float)]))
+
+    # Rotation key -> (order, depth, energy, skill points) of the first rotation found
+    leaves: dict[tuple[int, ...], tuple[int, int, float, int]] = {}
+    answers: dict[str, int] = {}
+    has_free_actions = any(action.kind == "free_action" for action in actions)
+    if skill_points_depend_on_order(actions):
+        queries_answered = tuple(query for query in queries
+                                 if not depends_on_skill_points(query))
+    else:
+        queries_answered = queries
+    depth = num_nodes = 0
+    is_complete = True
+
+    while len(frontier):
+        is_leaf = frontier.energy >= stats.ult_cost
+        _collect_leaves(leaves, frontier.select(is_leaf), depth, base)
+
+        frontier = _collapse_duplicates(frontier.select(~is_leaf))
+
+        if queries:
+            for key, (_, leaf_depth, _, skill_points) in leaves.items():
+                if leaf_depth == depth:
+                    update_answers(answers, queries_answered,
+                                   create_rotation_key(action_names, key), skill_points)
+
+            frontier = frontier.select(_can_improve_answers(frontier, answers, queries,
+                                                            action_names, has_free_actions))
+
+        if not len(frontier):
+            break
+
+        num_nodes += len(frontier)
+        if budget and budget.check(num_nodes):
+            is_complete = False
+            break
+
+        if frontier.order.dtype != object and base ** (depth + 1) >= MAX_ORDER:
+            frontier.order = frontier.order.astype(object)
+
+        turn = min(depth, turn_effects.last_turn)
+        hits_taken = turn_effects.get_hits_taken(turn)
+        for action in turn_start_actions:
+            mask = _is_available(action, frontier.resources)
+            frontier.resources[mask] = _apply(action, frontier.resources[mask], hits_taken)
+            frontier.energy[mask] += action.energy[0]
+            frontier.is_float[mask] |= isinstance(action.energy[0], float)
+
+        is_buffed = _start_turn(turn_effects, stats, frontier, turn)
+
+        frontier = _expand(frontier, actions, action_names, hits_taken, is_buffed, base)
+        depth += 1
+
+    all_rotations = create_rotation_list(leaves, action_names, base)
+    all_rotations.is_complete = is_complete
+
+    return all_rotations
+
+
+def get_digit(i: int, num_actions: int) -> int:
+    """The Depth-First Search explores the last action pushed onto the stack first,
+    so later actions get lower digits. Digits start at 1, so that orders of different depths
+    can be compared by truncating the longer one."""
+
+    return num_actions - i
+
+
+def _collect_leaves(leaves: dict[tuple[int, ...], tuple[int, int, float, int]],
+                    frontier: Frontier, depth: int, base: int) -> None:
+    """Stores the first rotation reached for every unique combination of actions.
+    A leaf is never a prefix of another one, so truncating the order of the deeper one
+    to the depth of the shallower one is enough to tell which comes first."""
+
+    if not len(frontier):
+        return
+
+    by_order = np.argsort(frontier.order, kind="stable")
+    _, first = np.unique(frontier.counts[by_order], axis=0, return_index=True)
+
+    for i in by_order[first]:
+        energy = frontier.energy[i].item()
+        if not frontier.is_float[i]:
+            energy = int(energy)
+
+        store_leaf(leaves, tuple(int(count) for count in frontier.counts[i]),
+                   int(frontier.order[i]), depth, energy, int(frontier.skill_points[i]), base)
+
+
+def store_leaf(leaves: dict[tuple[int, ...], tuple[int, int, float, int]],
+               key: tuple[int, ...], order: int, depth: int, energy: float,
+               skill_points: int, base: int) -> None:
+    """Stores the rotation, unless a rotation with the same actions comes before it
+    in the Depth-First Search order."""
+
+    if key in leaves:
+        best_order, best_depth, _, _ = leaves[key]
+
+        if depth >= best_depth:
+            is_first = order // base ** (depth - best_depth) < best_order
+        else:
+            is_first = order < best_order // base ** (best_depth - depth)
+
+        if not is_first:
+            return
+
+    leaves[key] = (order, depth, energy, skill_points)
+
+
+def skill_points_depend_on_order(actions: list["CompiledAction"]) -> bool:
+    """Checks whether rotations with the same actions can have different skill point costs,
+    i.e., if free actions generate skill points, or actions with the same name
+    generate different amounts of them (e.g. Blade's Enhanced Basic attacks)."""
+
+    skill_points: dict[str, int] = {}
+
+    for action in actions:
+        if action.kind == "free_action" and action.skill_points != 0:
+            return True
+        if skill_points.setdefault(action.name, action.skill_points) != action.skill_points:
+            return True
+
+    return False
+
+
+def _can_improve_answers(frontier: Frontier, answers: dict[str, int], queries: tuple[str, ...],
+                         action_names: list[str], has_free_actions: bool) -> np.ndarray:
+    """Vectorized version of search_bound.can_improve_answers.
+    Actions take up a turn, so only free actions can finish a rotation without adding a turn."""
+
+    num_turns = frontier.counts.sum(axis=1)
+    min_turns = num_turns if has_free_actions else num_turns + 1
+    num_skills = frontier.counts[:, [i for i, name in enumerate(action_names)
+                                     if name in SKILLS]].sum(axis=1)
+    num_basics = frontier.counts[:, [i for i, name in enumerate(action_names)
+                                     if name in BASICS]].sum(axis=1)
+    mask = np.zeros(len(frontier), dtype=bool)
+
+    for query in queries:
+        match query:
+            case "basic_only":
+                can_match = num_skills == 0
+            case "skill_only":
+                can_match = num_basics == 0
+            case "one_skill":
+                can_match = num_skills <= 1
+            case _:
+                can_match = True
+
+        mask |= can_match & (min_turns <= answers.get(query, inf))
+
+    return mask
+
+
+def _collapse_duplicates(frontier: Frontier) -> Frontier:
+    """Identical states lead to identical rotations, so only the one reached first is kept,
+    the same way the transposition table skips states that were already expanded."""
+
+    if len(frontier) < 2:
+        return frontier
+
+    by_order = np.argsort(frontier.order, kind="stable")
+    frontier = frontier.select(by_order)
+    states = np.column_stack((frontier.energy, frontier.skill_points, frontier.counts,
+                              frontier.resources))
+    _, first = np.unique(states, axis=0, return_index=True)
+
+    return frontier.select(np.sort(first))
+
+
+def _start_turn(turn_effects: TurnEffects, stats: CharStats, frontier: Frontier,
+                turn: int) -> bool:
+    """Vectorized version of TurnEffects.start_turn, changes the frontier in place.
+    Returns whether the buffed stats should be used this turn."""
+
+    entry = turn_effects.schedule[turn]
+    support_light_cone = turn_effects.support_light_cone
+
+    if entry.support_light_cone_triggers:
+        is_float = isinstance(support_light_cone.bonus, float)
+        for _ in range(entry.support_light_cone_triggers):
+            match support_light_cone.recharge_type:
+                case "bonus_energy":
+                    frontier.energy += support_light_cone.bonus
+                    frontier.is_float |= is_float
+                case "quid_pro_quo":
+                    mask = frontier.energy <= stats.ult_cost / 2
+                    frontier.energy[mask] += support_light_cone.bonus
+                    frontier.is_float[mask] |= is_float
+
+    for counter, energy in zip(turn_effects.counters, entry.energies):
+        frontier.energy += energy
+        frontier.is_float |= isinstance(counter.energy, float)
+
+    return entry.is_buffed
+
+
+def _is_available(action: "CompiledAction", resources: np.ndarray) -> np.ndarray:
+    mask = np.ones(len(resources), dtype=bool)
+
+    for index, operator, value in action.conditions:
+        match operator:
+            case "==":
+                mask &= resources[:, index] == value
+            case "!=":
+                mask &= resources[:, index] != value
+            case ">=":
+                mask &= resources[:, index] >= value
+            case "<=":
+                mask &= resources[:, index] <= value
+            case ">":
+                mask &= resources[:, index] > value
+            case "<":
+                mask &= resources[:, index] < value
+
+    return mask
+
+
+def _apply(action: "CompiledAction", resources: np.ndarray, hits_taken: int) -> np.ndarray:
+    new_resources = resources.copy()
+
+    for index, operator, amount in action.effects:
+        if amount is None:
+            amount = hits_taken
+
+        match operator:
+            case "+=":
+                new_resources[:, index] += amount
+            case "-=":
+                new_resources[:, index] -= amount
+            case "=":
+                new_resources[:, index] = amount
+
+    return new_resources
+
+
+def _expand(frontier: Frontier, actions: list["CompiledAction"], action_names: list[str],
+            hits_taken: int, is_buffed: bool, base: int) -> Frontier:
+    """Applies every available action to every state, and returns the next frontier."""
+
+    children = []
+
+    for i, action in enumerate(actions):
+        mask = _is_available(action, frontier.resources)
+        if not mask.any():
+            continue
+
+        energy = action.energy[is_buffed]
+        counts = frontier.counts[mask]
+        if action.kind == "action":
+            counts[:, action_names.index(action.name)] += 1
+
+        children.append(Frontier(
+            frontier.energy[mask] + energy,
+            frontier.skill_points[mask] + action.skill_points,
+            counts,
+            _apply(action, frontier.resources[mask], hits_taken),
+            frontier.order[mask] * base + get_digit(i, len(actions)),
+            frontier.is_float[mask] | isinstance(energy, float)))
+
+    if not children:
+        return frontier.select(np.zeros(len(frontier), dtype=bool))
+
+    return Frontier(*(np.concatenate([getattr(child, name) for child in children])
+                      for name in Frontier.__slots__))
+
+
+def create_rotation_list(leaves: dict[tuple[int, ...], tuple[int, int, float, int]],
+                          action_names: list[str], base: int) -> RotationList:
+    """Adds the rotations in the order the Depth-First Search would have found them in."""
+
+    all_rotations = RotationList()
+    max_depth = max((depth for _, depth, _, _ in leaves.values()), default=0)
+
+    for key, (_, _, energy, skill_points) in sorted(
+            leaves.items(), key=lambda leaf: leaf[1][0] * base ** (max_depth - leaf[1][1])):
+        all_rotations.add_rotation(energy, create_rotation_key(action_names, key), skill_points)
+
+    return all_rotations
@@ -0,0 +1,357 @@
+"""This module generates search kernels specialized for a single configuration,
+i.e., for the character's compiled mechanics and the user's inputs.
+
+Features that are not used by the configuration (counters, support Light Cones, search bound,
+dominance filter, transposition table, search budget, hits taken)
+are left out of the generated code entirely,
+while costs, conditions, and effects of actions are folded in as literals.
+Resources (stacks, charges, etc.) are kept in separate variables instead of a tuple,
+and actions used so far are kept as a packed rotation key (see rotation.get_rotation_key),
+so using an action is a single integer addition, and no list of turns is ever copied.
+
+Energy values depend on the character's energy recharge, so they are not written into the code.
+Instead, every generated kernel is created by a factory that binds them,
+and factories are cached by the kernel's signature, so that repeated calculations,
+as well as ER breakpoint searches, reuse them."""
+
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional
+from character_utils.characters import CharStats
+from calculation_scripts.rotation import get_action_bit, get_actions_mask, get_num_turns
+from calculation_scripts.search_bound import BASICS, SKILLS, SearchBound
+from calculation_scripts.dominance_filter import DominanceFilter
+from calculation_scripts.turn_effects import TurnEffects
+from equipment_utils.support_light_cones import apply_support_lc
+
+if TYPE_CHECKING:
+    from .mechanics_algorithm import CompiledAction
+
+KERNEL_CACHE_SIZE = 256
+
+# Turn effect modes, from the fastest to the slowest
+NO_TURN_EFFECTS = "none"
+CONSTANT_TURN_EFFECTS = "constant"
+DYNAMIC_TURN_EFFECTS = "dynamic"
+
+
+@dataclass(slots=True, frozen=True)
+class KernelSignature:
+    """Everything that determines the source code of a generated kernel.
+
+    Its attributes include:
+    - ult_cost, init_sp, initial_resources: values folded in as literals
+    - turn_start_actions, actions: compiled character mechanics, without their energy
+    - turn_mode: whether counters and support Light Cones are not active,
+    generate the same energy every turn, or have to be looked up in the schedule every turn
+    - num_counters: number of counters
+    - hits_per_turn: hits taken every turn, used by the constant turn mode
+    - last_turn: index of the schedule's last entry, used by the dynamic turn mode
+    - use_support_light_cone: whether a support Light Cone has any triggers
+    - use_buffed_stats: whether a temporary energy recharge buff can be active
+    - use_bound: whether the search bound is used
+    - stored_energy_index: index of the resource that stores energy for the search bound
+    - use_dominance: whether the dominance filter is used
+    - dominance_groups: groups of actions, whether a rotation contains any action of a group
+    determines the categories it can belong to, and is a part of the dominance filter's state
+    - use_table: whether the transposition table is used
+    - use_budget: whether the search budget is checked"""
+
+    ult_cost: float
+    init_sp: int
+    initial_resources: tuple[int, ...]
+    turn_start_actions: tuple["CompiledAction", ...]
+    actions: tuple["CompiledAction", ...]
+    turn_mode: str = NO_TURN_EFFECTS
+    num_counters: int = 0
+    hits_per_turn: int = 0
+    last_turn: int = 0
+    use_support_light_cone: bool = False
+    use_buffed_stats: bool = False
+    use_bound: bool = False
+    stored_energy_index: int = -1
+    use_dominance: bool = False
+    dominance_groups: tuple[tuple[str, ...], ...] = ()
+    use_table: bool = False
+    use_budget: bool = False
+
+
+def create_kernel(stats: CharStats, turn_effects: TurnEffects, init_energy: float,
+                  initial_resources: tuple[int, ...],
+                  turn_start_actions: list["CompiledAction"], actions: list["CompiledAction"],
+                  bound: Optional[SearchBound], stored_energy: tuple[int, float],
+                  dominance: Optional[DominanceFilter], use_table: bool,
+                  use_budget: bool) -> Callable:
+    """Returns the search kernel for the given configuration.
+    Kernels are called with the following arguments:
+    all_rotations, bound, table, dominance, budget, turn_effects, stats."""
+
+    stored_energy_index, energy_per_unit = stored_energy
+    turn_mode = get_turn_mode(turn_effects)
+
+    signature = KernelSignature(
+        stats.ult_cost, stats.init_sp, initial_resources,
+        tuple(replace(action, energy=(0, 0)) for action in turn_start_actions),
+        tuple(replace(action, energy=(0, 0)) for action in actions),
+        turn_mode, len(turn_effects.counters), turn_effects.get_hits_taken(0),
+        turn_effects.last_turn, turn_effects.support_light_cone is not None,
+        turn_effects.buffed_stats is not None, bound is not None,
+        stored_energy_index, dominance is not None,
+        _get_dominance_groups(bound, actions) if dominance else (), use_table, use_budget)
+
+    factory = get_kernel_factory(signature)
+
+    return factory(init_energy, energy_per_unit,
+                   tuple(action.energy[0] for action in turn_start_actions),
+                   tuple(action.energy for action in actions),
+                   turn_effects.schedule[0].energies)
+
+
+def get_turn_mode(turn_effects: TurnEffects) -> str:
+    """Determines how the kernel should apply energy gained at the start of every turn."""
+
+    if not turn_effects.counters and not turn_effects.support_light_cone:
+        return NO_TURN_EFFECTS
+
+    if not turn_effects.support_light_cone and turn_effects.last_turn == 0:
+        return CONSTANT_TURN_EFFECTS
+
+    return DYNAMIC_TURN_EFFECTS
+
+
+def _get_dominance_groups(bound: Optional[SearchBound],
+                          actions: list["CompiledAction"]) -> tuple[tuple[str, ...], ...]:
+    """Basic only rotations cannot contain any skills, and skill only ones any basic attacks."""
+
+    names = {action.name for action in actions if action.kind == "action"}
+    groups = []
+
+    if bound and "basic_only" in bound.queries:
+        groups.append(tuple(name for name in SKILLS if name in names))
+    if bound and "skill_only" in bound.queries:
+        groups.append(tuple(name for name in BASICS if name in names))
+
+    return tuple(groups)
+
+
+@lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_kernel_factory(signature: KernelSignature) -> Callable:
+    """Returns the kernel factory for the given signature, generating it if necessary.
+    Factories are called with the following arguments:
+    init_energy, energy_per_unit, turn start action energies,
+    action energies (regular and buffed), counter energies of the first turn."""
+
+    namespace = {"get_num_turns": get_num_turns, "apply_support_lc": apply_support_lc}
+    source = generate_kernel_source(signature)
+    exec(compile(source, "<generated search kernel>", "exec"), namespace)
+
+    return namespace["make_kernel"]
+
+
+def generate_kernel_source(signature: KernelSignature) -> str:
+    """Generates the source code of a Depth-First Search kernel factory.
+    The kernel behaves the same as the general search, but only for the given configuration."""
+
+    resources = [f"r{i}" for i in range(len(signature.initial_resources))]
+    dynamic = signature.turn_mode == DYNAMIC_TURN_EFFECTS
+    entry = ", ".join(["curr_energy", "rotation_key", "skill_points_generated"] + resources
+                      + (["turn"] if dynamic else []))
+    hits_taken = _get_hits_taken_source(signature)
+
+    initial_entry = ", ".join(["init_energy", "0", repr(signature.init_sp)]
+                              + [repr(value) for value in signature.initial_resources]
+                              + (["0"] if dynamic else []))
+
+    lines = ["def make_kernel(init_energy, energy_per_unit, "
+             "turn_start_energies, action_energies, counter_energies):"]
+    lines += [f"    s{i} = turn_start_energies[{i}]"
+              for i in range(len(signature.turn_start_actions))]
+    lines += [f"    e{i}, b{i} = action_energies[{i}]"
+              for i in range(len(signature.actions))]
+    if signature.turn_mode == CONSTANT_TURN_EFFECTS:
+        lines += [f"    c{i} = counter_energies[{i}]" for i in range(signature.num_counters)]
+
+    lines += ["",
+              "    def kernel(all_rotations, bound, table, dominance, budget, turn_effects, stats):",
+              "        add_rotation = all_rotations.add_rotation",
+              f"        stack = [({initial_entry})]",
+              "        push = stack.append",
+              "        pop = stack.pop"]
+
+    if dynamic:
+        lines.append("        schedule = turn_effects.schedule")
+    if dynamic and signature.use_support_light_cone:
+        lines.append("        support_light_cone = turn_effects.support_light_cone")
+
+    if signature.use_budget:
+        lines += ["        num_nodes = 0",
+                  "        next_check = budget.next_check(num_nodes)"]
+
+    lines += ["",
+              "        while stack:",
+              f"            {entry} = pop()",
+              "",
+              f"            if curr_energy >= {signature.ult_cost!r}:",
+              "                add_rotation(curr_energy, rotation_key, skill_points_generated)"]
+
+    if signature.use_bound:
+        lines.append("                bound.update(rotation_key, skill_points_generated)")
+    lines.append("                continue")
+
+    if signature.use_bound:
+        stored_energy = ""
+        if signature.stored_energy_index != -1:
+            stored_energy = f" + r{signature.stored_energy_index} * energy_per_unit"
+
+        lines += ["",
+                  f"            if bound.can_prune(curr_energy{stored_energy}, rotation_key):",
+                  "                continue"]
+
+    if signature.use_dominance:
+        state = ", ".join(["get_num_turns(rotation_key)"] + resources
+                          + (["turn"] if dynamic else [])
+                          + [f"(rotation_key & {get_actions_mask(group)}) != 0"
+                             for group in signature.dominance_groups])
+        lines += ["",
+                  f"            if dominance.is_dominated(({state},), "
+                  "curr_energy, skill_points_generated):",
+                  "                continue"]
+
+    if signature.use_table:
+        state = ", ".join(["rotation_key", "curr_energy", "skill_points_generated",
+                           f"({', '.join(resources)},)"]
+                          + (["turn"] if dynamic else []))
+        lines += ["",
+                  f"            if table.visit(({state})):",
+                  "                continue"]
+
+    if signature.use_budget:
+        lines += ["",
+                  "            num_nodes += 1",
+                  "            if num_nodes >= next_check:",
+                  "                if budget.check(num_nodes):",
+                  "                    all_rotations.is_complete = False",
+                  "                    break",
+                  "                next_check = budget.next_check(num_nodes)"]
+
+    lines.append("")
+    if dynamic:
+        lines.append("            entry = schedule[turn]")
+    if dynamic and hits_taken == "hits_taken":
+        lines.append("            hits_taken = entry.hits_taken")
+
+    for i, action in enumerate(signature.turn_start_actions):
+        lines += _get_turn_start_source(i, action, hits_taken)
+
+    lines += _get_turn_effects_source(signature)
+
+    for i, action in enumerate(signature.actions):
+        lines += _get_action_source(i, action, resources, hits_taken, dynamic,
+                                    signature.use_buffed_stats)
+
+    lines += ["", "    return kernel"]
+
+    return "\n".join(lines) + "\n"
+
+
+def _get_hits_taken_source(signature: KernelSignature) -> str:
+    """Returns the expression for the number of hits taken during a turn,
+    if it's used by any of the actions."""
+
+    uses_hits_taken = any(amount is None
+                          for action in signature.turn_start_actions + signature.actions
+                          for _, _, amount in action.effects)
+
+    if not uses_hits_taken or signature.turn_mode == NO_TURN_EFFECTS:
+        return "0"
+
+    if signature.turn_mode == CONSTANT_TURN_EFFECTS:
+        return repr(signature.hits_per_turn)
+
+    return "hits_taken"
+
+
+def _get_condition_source(action: "CompiledAction") -> str:
+    return " and ".join(f"r{index} {operator} {value!r}"
+                        for index, operator, value in action.conditions)
+
+
+def _get_turn_start_source(i: int, action: "CompiledAction", hits_taken: str) -> list[str]:
+    """Turn start actions change the resources in place, before any other action."""
+
+    condition = _get_condition_source(action)
+    indent = "            "
+    lines = []
+
+    if condition:
+        lines.append(f"{indent}if {condition}:")
+        indent += "    "
+
+    for index, operator, amount in action.effects:
+        amount = hits_taken if amount is None else repr(amount)
+        lines.append(f"{indent}r{index} {operator} {amount}")
+
+    lines.append(f"{indent}curr_energy += s{i}")
+
+    return lines
+
+
+def _get_turn_effects_source(signature: KernelSignature) -> list[str]:
+    """Counters that repeat every turn always generate the same energy,
+    so it's added directly, one counter at a time, the same way start_turn does.
+    Otherwise, the turn's entry is looked up in the schedule, and applied the same way."""
+
+    if signature.turn_mode == CONSTANT_TURN_EFFECTS:
+        return [f"            curr_energy += c{i}" for i in range(signature.num_counters)]
+
+    if signature.turn_mode != DYNAMIC_TURN_EFFECTS:
+        return []
+
+    lines = []
+    if signature.use_support_light_cone:
+        lines += ["            if entry.support_light_cone_triggers:",
+                  "                curr_energy = apply_support_lc(",
+                  f"                    support_light_cone, {signature.ult_cost!r}, curr_energy,",
+                  "                    entry.support_light_cone_triggers)"]
+    if signature.num_counters:
+        lines.append("            energies = entry.energies")
+        lines += [f"            curr_energy += energies[{i}]"
+                  for i in range(signature.num_counters)]
+    if signature.use_buffed_stats:
+        lines.append("            is_buffed = entry.is_buffed")
+
+    last_turn = signature.last_turn
+    lines.append(f"            turn = turn + 1 if turn < {last_turn} else {last_turn}")
+
+    return lines
+
+
+def _get_action_source(i: int, action: "CompiledAction", resources: list[str],
+                       hits_taken: str, dynamic: bool, use_buffed_stats: bool) -> list[str]:
+    """Returns the code that pushes the action onto the stack, if it's available."""
+
+    new_resources = list(resources)
+    for index, operator, amount in action.effects:
+        amount = hits_taken if amount is None else repr(amount)
+        match operator:
+            case "+=":
+                new_resources[index] = f"{new_resources[index]} + {amount}"
+            case "-=":
+                new_resources[index] = f"{new_resources[index]} - {amount}"
+            case "=":
+                new_resources[index] = amount
+
+    energy = f"(b{i} if is_buffed else e{i})" if use_buffed_stats and dynamic else f"e{i}"
+    rotation_key = "rotation_key"
+    if action.kind == "action":
+        rotation_key += f" + {get_action_bit(action.name)}"
+
+    entry = ", ".join([f"curr_energy + {energy}", rotation_key,
+                       f"skill_points_generated + {action.skill_points!r}"]
+                      + new_resources + (["turn"] if dynamic else []))
+
+    condition = _get_condition_source(action)
+    if not condition:
+        return ["", f"            push(({entry}))"]
+
+    return ["", f"            if {condition}:", f"                push(({entry}))"]
@@ -0,0 +1,322 @@
+"""This module contains the Depth-First Search algorithm shared by all characters.
+
+Character-specific behaviour, such as stacks, charges, or enhanced attacks,
+is described by the character's mechanics (see character_utils.mechanics),
+which are compiled into a list of actions with index-based conditions and effects
+before the search starts. The search itself is run by a kernel generated
+specifically for the compiled actions and user's inputs (see kernel_generator)."""
+
+from dataclasses import dataclass
+from typing import Optional
+from character_utils.characters import CharStats
+from character_utils.mechanics import (HITS_TAKEN, OPERATORS, Mechanics,
+                                       evaluate, resolve_value)
+from gui_scripts.user_input import UserInput
+from calculation_scripts.turn_effects import TurnEffects, create_turn_effects
+from calculation_scripts.rotation import RotationList
+from calculation_scripts.rotation_aggregators import RotationAggregators, stream_rotations
+from calculation_scripts.transposition_table import TranspositionTable
+from calculation_scripts.dominance_filter import DominanceFilter, supports_queries
+from calculation_scripts.fixed_point import (from_fixed_point_rotations, to_fixed,
+                                             to_fixed_point_actions, to_fixed_point_input,
+                                             to_fixed_point_stats)
+from calculation_scripts.search_budget import SearchBudget, create_search_budget
+from calculation_scripts.search_bound import (SearchBound, create_search_bound,
+                                              get_queries, get_shortest_first_queries,
+                                              max_turn_energy)
+from .count_algorithm import Action, count_algorithm, is_order_independent
+from .kernel_generator import create_kernel
+from .frontier_algorithm import frontier_algorithm
+from .astar_algorithm import astar_algorithm
+from .value_algorithm import value_algorithm
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledAction:
+    """Character's action with all parameters resolved.
+    Conditions and effects refer to resources by their index in the state,
+    conditions keep the operator's symbol, so that they can be written into generated kernels.
+    Effects whose amount is None use the number of hits taken during the turn.
+
+    Energy holds the energy the action generates with regular stats,
+    and with stats buffed by support Light Cone's temporary energy recharge."""
+
+    kind: str
+    name: str
+    energy: tuple[float, float]
+    skill_points: int
+    conditions: tuple[tuple[int, str, float], ...]
+    effects: tuple[tuple[int, str, Optional[float]], ...]
+
+    def is_available(self, resources: tuple[int, ...]) -> bool:
+        for index, operator, value in self.conditions:
+            if not OPERATORS[operator](resources[index], value):
+                return False
+
+        return True
+
+    def apply(self, resources: tuple[int, ...], hits_taken: int) -> tuple[int, ...]:
+        if not self.effects:
+            return resources
+
+        new_resources = list(resources)
+
+        for index, operator, amount in self.effects:
+            if amount is None:
+                amount = hits_taken
+
+            match operator:
+                case "+=":
+                    new_resources[index] += amount
+                case "-=":
+                    new_resources[index] -= amount
+                case "=":
+                    new_resources[index] = amount
+
+        return tuple(new_resources)
+
+
+def compile_actions(mechanics: Mechanics, stats: CharStats,
+                    buffed_stats: Optional[CharStats],
+                    parameters: dict[str, float]) -> list[CompiledAction]:
+    """Resolves all parameters and character stats used by the character's actions."""
+
+    indices = {resource: i for i, resource in enumerate(mechanics.resources)}
+    compiled_actions = []
+
+    for action in mechanics.actions:
+        energy = evaluate(action.energy, stats, parameters)
+        buffed_energy = (evaluate(action.energy, buffed_stats, parameters)
+                         if buffed_stats else energy)
+
+        conditions = tuple((indices[condition.name], condition.operator,
+                            resolve_value(condition.value, parameters))
+                           for condition in action.conditions)
+        effects = tuple((indices[effect.name], effect.operator,
+                         None if effect.value == HITS_TAKEN
+                         else int(resolve_value(effect.value, parameters)))
+                        for effect in action.effects)
+
+        compiled_actions.append(CompiledAction(action.kind, action.name,
+                                               (energy, buffed_energy), action.skill_points,
+                                               conditions, effects))
+
+    return compiled_actions
+
+
+def dfs_algorithm_mechanics(stats: CharStats, user_input: UserInput, mechanics: Mechanics,
+                            aggregators: Optional[RotationAggregators] = None
+                            ) -> RotationList | RotationAggregators:
+    """Depth-First Search algorithm that finds all unique rotations
+    for the character described by the given mechanics.
+
+    At the start of every turn, turn start actions are applied,
+    followed by energy from counters and support Light Cones.
+    Then every available action is explored,
+    free actions (e.g. Blade's follow-up attacks) do not take up a turn.
+
+    Parameters and actions are always compiled from the regular stats,
+    in the fixed-point energy mode they are converted afterwards (see fixed_point).
+    If aggregators are given, rotations are added to them instead of a new RotationList.
+    If the search is limited (see search_budget) and runs out of its budget,
+    the rotations found so far are returned, marked as incomplete."""
+
+    parameters = mechanics.get_parameters(stats, user_input)
+    init_energy = stats.init_energy + parameters.get("init_energy", 0)
+    turn_effects = create_turn_effects(stats, user_input)
+    actions = compile_actions(mechanics, stats, turn_effects.buffed_stats, parameters)
+    budget = create_search_budget(user_input)
+
+    if not user_input.fixed_point_energy:
+        return _find_rotations(stats, user_input, mechanics, parameters,
+                               init_energy, turn_effects, actions, budget, aggregators)
+
+    fixed_stats = to_fixed_point_stats(stats)
+    fixed_input = to_fixed_point_input(user_input)
+    all_rotations = _find_rotations(fixed_stats, fixed_input, mechanics, parameters,
+                                    to_fixed(init_energy),
+                                    create_turn_effects(fixed_stats, fixed_input),
+                                    to_fixed_point_actions(actions), budget)
+    from_fixed_point_rotations(all_rotations)
+
+    return stream_rotations(all_rotations, aggregators)
+
+
+def get_count_actions(stats: CharStats, user_input: UserInput,
+                      mechanics: Mechanics) -> Optional[tuple[Action, ...]]:
+    """Returns the actions the count-vector enumeration is run with for the character,
+    or None if the order of the character's actions matters, see "count_algorithm"."""
+
+    if mechanics.resources or not is_order_independent(user_input):
+        return None
+
+    parameters = mechanics.get_parameters(stats, user_input)
+    return _to_count_actions(compile_actions(mechanics, stats, None, parameters))
+
+
+def value_algorithm_mechanics(stats: CharStats, user_input: UserInput,
+                              mechanics: Mechanics) -> RotationList:
+    """Finds the rotation with the highest value, by the user's score weights,
+    that takes at most the selected number of turns and stays within the skill point budget,
+    for the character described by the given mechanics (see value_algorithm).
+    Returns a RotationList with that rotation, or an empty one, if there is no such rotation."""
+
+    parameters = mechanics.get_parameters(stats, user_input)
+    init_energy = stats.init_energy + parameters.get("init_energy", 0)
+    turn_effects = create_turn_effects(stats, user_input)
+    actions = compile_actions(mechanics, stats, turn_effects.buffed_stats, parameters)
+
+    if user_input.fixed_point_energy:
+        stats = to_fixed_point_stats(stats)
+        init_energy = to_fixed(init_energy)
+        turn_effects = create_turn_effects(stats, to_fixed_point_input(user_input))
+        actions = to_fixed_point_actions(actions)
+
+    initial_resources = tuple(int(parameters.get(resource, 0))
+                              for resource in mechanics.resources)
+
+    all_rotations = RotationList()
+    value_algorithm(all_rotations, stats, turn_effects, init_energy, initial_resources,
+                    [action for action in actions if action.kind == "turn_start"],
+                    [action for action in actions if action.kind != "turn_start"],
+                    user_input.score_weights, user_input.max_value_turns,
+                    user_input.sp_budget, create_search_budget(user_input))
+
+    if user_input.fixed_point_energy:
+        from_fixed_point_rotations(all_rotations)
+
+    all_rotations.process_rotation_data(user_input.char_name)
+
+    return all_rotations
+
+
+def _find_rotations(stats: CharStats, user_input: UserInput, mechanics: Mechanics,
+                    parameters: dict[str, float], init_energy: float,
+                    turn_effects: TurnEffects, actions: list[CompiledAction],
+                    budget: Optional[SearchBudget] = None,
+                    aggregators: Optional[RotationAggregators] = None
+                    ) -> RotationList | RotationAggregators:
+    """Runs the search selected by the user for the already compiled actions.
+    In the fixed-point energy mode, all energy values passed in are already converted.
+    Only the generated kernels add rotations to the aggregators as they find them,
+    other algorithms collect them first."""
+
+    if not mechanics.resources and is_order_independent(user_input):
+        return stream_rotations(count_algorithm(stats, user_input, _to_count_actions(actions),
+                                                budget), aggregators)
+
+    turn_start_actions = [action for action in actions if action.kind == "turn_start"]
+    actions = [action for action in actions if action.kind != "turn_start"]
+
+    initial_resources = tuple(int(parameters.get(resource, 0))
+                              for resource in mechanics.resources)
+
+    if user_input.search_mode in ("frontier", "shortest"):
+        return stream_rotations(
+            frontier_algorithm(stats, turn_effects, init_energy, initial_resources,
+                               turn_start_actions, actions,
+                               get_shortest_first_queries(user_input), budget), aggregators)
+
+    bound, stored_energy_index, energy_per_unit = _create_search_bound(stats, user_input,
+                                                                       actions,
+                                                                       turn_start_actions)
+    if user_input.search_mode == "astar" and bound:
+        return stream_rotations(
+            astar_algorithm(stats, turn_effects, init_energy, initial_resources,
+                            turn_start_actions, actions, bound,
+                            (stored_energy_index, energy_per_unit), budget), aggregators)
+
+    all_rotations = RotationList() if aggregators is None else aggregators
+    table = None
+    if mechanics.resources:
+        table = TranspositionTable(user_input.transposition_table_size)
+        all_rotations.transposition_table = table
+
+    dominance = _create_dominance_filter(user_input, actions, bound)
+    kernel = create_kernel(stats, turn_effects, init_energy, initial_resources,
+                           turn_start_actions, actions, bound,
+                           (stored_energy_index, energy_per_unit), dominance,
+                           table is not None, budget is not None)
+    kernel(all_rotations, bound, table, dominance, budget, turn_effects, stats)
+
+    return all_rotations
+
+
+def _to_count_actions(actions: list[CompiledAction]) -> tuple[Action, ...]:
+    return tuple(Action(action.name, action.energy[0], action.skill_points) for action in actions)
+
+
+def _create_search_bound(stats: CharStats, user_input: UserInput,
+                         actions: list[CompiledAction],
+                         turn_start_actions: list[CompiledAction]
+                         ) -> tuple[Optional[SearchBound], int, float]:
+    """Creates the search bound from the highest energy every action can generate.
+
+    Free actions do not take up a turn, so their energy is spread over the resource
+    needed to trigger them, e.g. Blade's follow-up attacks over his stacks.
+    As every free action re-triggers the start of the turn,
+    hits taken reduce the net amount of the resource a free action costs.
+    Returns the search bound, the index of such a resource (-1 if there is none),
+    and the highest amount of energy a single unit of it can yield."""
+
+    turn_energy = sum(max(action.energy[0], 0) for action in turn_start_actions)
+    free_actions = [action for action in actions if action.kind == "free_action"]
+    resource_index, energy_per_unit, hits_per_turn = -1, 0, 0
+
+    if free_actions:
+        resource_index, _, cost = free_actions[0].conditions[0]
+
+        if any(index == resource_index and amount is None
+               for action in turn_start_actions for index, _, amount in action.effects):
+            hits_per_turn = _get_hits_per_turn(user_input)
+
+        net_cost = cost - hits_per_turn
+        if net_cost <= 0:
+            return None, -1, 0
+
+        energy_per_unit = ((free_actions[0].energy[0] + turn_energy
+                            + max_turn_energy(user_input)) / net_cost)
+
+    action_energies: dict[str, float] = {}
+
+    for action in actions:
+        if action.kind != "action":
+            continue
+
+        gain = sum(amount for index, operator, amount in action.effects
+                   if index == resource_index and operator == "+=" and amount is not None)
+        energy = action.energy[0] + energy_per_unit * (gain + hits_per_turn)
+        action_energies[action.name] = max(energy, action_energies.get(action.name, 0))
+
+    bound = create_search_bound(stats.ult_cost, user_input, action_energies,
+                                get_queries(user_input.char_name), turn_energy)
+
+    return bound, resource_index, energy_per_unit
+
+
+def _create_dominance_filter(user_input: UserInput, actions: list[CompiledAction],
+                             bound: Optional[SearchBound]) -> Optional[DominanceFilter]:
+    """Creates the dominance filter for the bounded search mode,
+    if dominated states can be skipped for all the categories the bound was created for.
+
+    A rotation that ends sooner must not lose skill points, so free actions cannot generate them,
+    and the energy actions generate must not depend on the current energy,
+    which is not the case with the Quid Pro Quo Light Cone."""
+
+    if user_input.search_mode != "bounded" or not bound or not supports_queries(bound.queries):
+        return None
+
+    if any(action.kind == "free_action" and action.skill_points > 0 for action in actions):
+        return None
+
+    support_light_cone = user_input.support_light_cone
+    if support_light_cone and support_light_cone.recharge_type == "quid_pro_quo":
+        return None
+
+    return DominanceFilter()
+
+
+def _get_hits_per_turn(user_input: UserInput) -> int:
+    """Returns the highest number of hits taken during a single turn."""
+
+    return user_input.hits_taken.get_max_triggers()
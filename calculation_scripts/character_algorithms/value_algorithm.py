@@ -0,0 +1,133 @@
+"""This module contains the highest value rotation algorithm.
+
+Instead of the shortest rotations, it looks for the rotation with the highest total value
+that still reaches the Ultimate within a given number of turns,
+while spending at most a given number of skill points.
+Every action is worth the weight the user gave it (see rotation_scores),
+and every skill point generated is worth the weight of "SP/T",
+so the value of a rotation is its weighted score multiplied by its number of turns.
+
+The search is a dynamic program over turns, similar to solving a knapsack problem:
+states of every turn that share their energy, skill points, resources, and turn effects
+can finish the same way, so only the most valuable of them is kept.
+The number of states per turn is therefore limited by the number of distinct energy amounts,
+rather than by the number of rotations, which keeps the search fast enough for the GUI."""
+
+from typing import TYPE_CHECKING, Optional
+from character_utils.characters import CharStats
+from calculation_scripts.rotation import RotationList, get_action_bit
+from calculation_scripts.rotation_scores import SP_PER_TURN
+from calculation_scripts.search_budget import SearchBudget
+from calculation_scripts.turn_effects import TurnEffects
+
+if TYPE_CHECKING:
+    from .mechanics_algorithm import CompiledAction
+
+# Energy is rounded to this many decimals before states are merged,
+# so that amounts which only differ by floating point errors are treated as equal
+ENERGY_DECIMALS = 6
+
+
+def value_algorithm(all_rotations: RotationList, stats: CharStats,
+                    turn_effects: TurnEffects, init_energy: float,
+                    initial_resources: tuple[int, ...],
+                    turn_start_actions: list["CompiledAction"],
+                    actions: list["CompiledAction"], weights: dict[str, float],
+                    max_turns: int, sp_budget: int,
+                    budget: Optional[SearchBudget] = None) -> None:
+    """Adds the rotation with the highest value to all_rotations, if any rotation
+    takes at most max_turns turns and generates at least -sp_budget skill points.
+    Of rotations with equal values, the one with the fewest turns is added.
+
+    Free actions do not take up a turn, so they are explored within the same turn,
+    and re-trigger the start of the turn, the same way they do in the other searches."""
+
+    action_bits = [get_action_bit(action.name) if action.kind == "action" else 0
+                   for action in actions]
+    action_values = [weights.get(action.name, 0) if action.kind == "action" else 0
+                     for action in actions]
+    sp_weight = weights.get(SP_PER_TURN, 0)
+    max_sp_gain = _get_max_sp_gain(actions)
+
+    best: Optional[tuple[float, float, int, float]] = None
+    next_check = budget.next_check(budget.num_nodes) if budget else 0
+    layer = {(round(init_energy, ENERGY_DECIMALS), stats.init_sp, initial_resources, 0):
+             (0, init_energy, 0)}
+
+    for num_turns in range(max_turns + 1):
+        next_layer: dict[tuple, tuple[float, float, int]] = {}
+        stack = [(*state_value, *state[1:]) for state, state_value in layer.items()]
+
+        while stack:
+            value, curr_energy, rotation_key, skill_points_generated, resources, turn = stack.pop()
+
+            if curr_energy >= stats.ult_cost:
+                total_value = value + sp_weight * skill_points_generated
+                if (skill_points_generated >= -sp_budget
+                        and (best is None or total_value > best[0])):
+                    best = (total_value, curr_energy, rotation_key, skill_points_generated)
+                continue
+
+            if (max_sp_gain is not None and skill_points_generated
+                    + max_sp_gain * (max_turns - num_turns) < -sp_budget):
+                continue
+
+            if budget:
+                budget.num_nodes += 1
+                if budget.num_nodes >= next_check:
+                    if budget.check(budget.num_nodes):
+                        all_rotations.is_complete = False
+                        break
+                    next_check = budget.next_check(budget.num_nodes)
+
+            hits_taken = turn_effects.get_hits_taken(turn)
+
+            for action in turn_start_actions:
+                if action.is_available(resources):
+                    resources = action.apply(resources, hits_taken)
+                    curr_energy += action.energy[0]
+
+            curr_energy, next_turn, turn_stats = turn_effects.start_turn(stats, curr_energy, turn)
+            is_buffed = turn_stats is not stats
+
+            for i, action in enumerate(actions):
+                if not action.is_available(resources):
+                    continue
+
+                new_energy = curr_energy + action.energy[is_buffed]
+                new_skill_points = skill_points_generated + action.skill_points
+                new_resources = action.apply(resources, hits_taken)
+
+                if action.kind != "action":
+                    stack.append((value, new_energy, rotation_key, new_skill_points,
+                                  new_resources, next_turn))
+                    continue
+
+                if num_turns == max_turns:
+                    continue
+
+                state = (round(new_energy, ENERGY_DECIMALS), new_skill_points,
+                         new_resources, next_turn)
+                new_value = value + action_values[i]
+                if state not in next_layer or new_value > next_layer[state][0]:
+                    next_layer[state] = (new_value, new_energy, rotation_key + action_bits[i])
+
+        if not all_rotations.is_complete:
+            break
+
+        layer = next_layer
+
+    if best is not None:
+        _, energy_generated, rotation_key, skill_points_generated = best
+        all_rotations.add_rotation(energy_generated, rotation_key, skill_points_generated)
+
+
+def _get_max_sp_gain(actions: list["CompiledAction"]) -> Optional[int]:
+    """Returns the highest number of skill points a single turn can generate,
+    or None if free actions generate them, as any number of free actions can be used per turn."""
+
+    if any(action.kind != "action" and action.skill_points > 0 for action in actions):
+        return None
+
+    return max((action.skill_points for action in actions if action.kind == "action"),
+               default=0)
@@ -8,8 +8,6 @@ from gui_scripts.counter import Counter
 def print_detailed_breakdown(stats: CharStats, user_input: UserInput, rotation: Rotation) -> None:
     """Lists all the energy sources and the amount of energy they have generated."""
 
-    user_input.retrieve_cache("before-calculation")
-
     print(colored("Detailed energy breakdown "
                   f"({stats.ult_cost} ult cost):", "green"))
 
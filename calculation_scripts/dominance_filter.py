@@ -0,0 +1,54 @@
+"""Module containing the DominanceFilter class, used by the bounded search mode.
+
+Two states with the same number of turns, resources (stacks, charges, etc.),
+and remaining triggers allow for exactly the same actions, which generate the same energy.
+If one of them has at least as much energy and at least as many skill points as the other,
+every rotation continuing from the other one is either matched or beaten
+by a rotation continuing from the first one, which is also found first.
+
+This only holds for categories that any shorter part of a rotation also belongs to,
+i.e., the best, basic only, and skill only rotations.
+A neutral or one skill rotation can be beaten by a shorter rotation that is neither,
+and the Quid Pro Quo Light Cone grants energy only while the current energy is low."""
+
+from dataclasses import dataclass, field
+from typing import Hashable
+
+# Categories for which dominated states can be skipped
+DOMINANCE_QUERIES = ("best", "basic_only", "skill_only")
+
+
+@dataclass(slots=True)
+class DominanceFilter:
+    """Class that stores, for every combination of turns, resources, and remaining triggers,
+    energy and skill points of the states that are not dominated by any other state.
+
+    Its attributes include:
+    - num_pruned: number of states that were skipped, as they were dominated"""
+
+    num_pruned: int = 0
+    _fronts: dict[Hashable, list[tuple[float, float]]] = field(init=False, default_factory=dict)
+
+    def is_dominated(self, state: Hashable, energy: float, skill_points: float) -> bool:
+        """Checks whether a state that was already expanded dominates this one,
+        if not, the state is stored in place of the ones it dominates."""
+
+        front = self._fronts.setdefault(state, [])
+
+        for other_energy, other_skill_points in front:
+            if other_energy >= energy and other_skill_points >= skill_points:
+                self.num_pruned += 1
+                return True
+
+        front[:] = [(other_energy, other_skill_points)
+                    for other_energy, other_skill_points in front
+                    if other_energy > energy or other_skill_points > skill_points]
+        front.append((energy, skill_points))
+
+        return False
+
+
+def supports_queries(queries: tuple[str, ...]) -> bool:
+    """Checks whether dominated states can be skipped for all the requested categories."""
+
+    return all(query in DOMINANCE_QUERIES for query in queries)
@@ -0,0 +1,279 @@
+"""Module for finding Energy Recharge (ER) breakpoints without searching at every ER value.
+
+Energy of every source is either scaled by ER (actions, kills, hits taken, etc.),
+or added after ER is applied (e.g. Tingyun's and HuoHuo's Ultimates),
+so the energy of a rotation is a linear function of ER.
+If the order of the character's actions does not matter (see count_algorithm),
+rotations only depend on which of their sub-rotations reach the Ultimate cost,
+and every rotation of n turns reaches it at a single ER value, which can be computed directly.
+Found rotations can therefore only change at those ER values,
+and anywhere in between them they are found without searching, from the linear energies.
+Every candidate rotation is a vector of action counts, so the energy of all of them
+at many ER values at once is a single matrix product (see EnergyModel.find_best_rotations).
+
+Characters whose actions depend on their order, e.g. through stacks or enhanced attacks,
+still need a search at every ER value, see calculations_utils.print_er_breakpoint."""
+
+from dataclasses import dataclass, replace
+from itertools import combinations_with_replacement
+from typing import Any, Callable, Optional
+import numpy as np
+from character_utils.characters import CharStats
+from character_utils.mechanics import get_mechanics
+from gui_scripts.user_input import UserInput
+from .rotation import Rotation, RotationList, create_rotation_key, get_num_turns
+from .rotation_aggregators import RotationAggregator
+from .turn_effects import create_turn_effects
+from .character_algorithms.count_algorithm import Action, count_rotations
+from .character_algorithms.mechanics_algorithm import get_count_actions
+
+# Highest difference between the energy the linear model expects and the actual energy,
+# any higher and energy is not treated as linear in ER
+LINEARITY_TOLERANCE = 1e-6
+
+
+@dataclass(slots=True, frozen=True)
+class EnergyComponents:
+    """Class representing all the energy a character can generate at a single ER value.
+    It's attributes include:
+    - energy character starts with
+    - energy gained at the start of every turn
+    - actions, with the energy each of them generates"""
+
+    init_energy: float
+    turn_energy: float
+    actions: tuple[Action, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class LinearEnergy:
+    """Energy that changes linearly with ER, i.e., constant + per_er * ER."""
+
+    constant: float
+    per_er: float
+
+    def at(self, energy_recharge: float) -> float:
+        return self.constant + self.per_er * energy_recharge
+
+
+@dataclass(slots=True, frozen=True)
+class CandidateRotations:
+    """Class representing rotations as count vectors, with their energy as linear functions of ER.
+    It's attributes include:
+    - number of times every action of the model is used, one row per rotation
+    - energy every rotation generates, as constant + per_er * ER
+    - skill points every rotation generates
+    - rotation keys (see rotation.get_rotation_key)"""
+
+    counts: np.ndarray
+    constant: np.ndarray
+    per_er: np.ndarray
+    skill_points: np.ndarray
+    rotation_keys: list[int]
+
+
+@dataclass(slots=True, frozen=True)
+class EnergyModel:
+    """Class representing all the energy a character can generate as linear functions of ER.
+    It's attributes include:
+    - the Ultimate cost, and skill points character starts with
+    - energy character starts with, and energy gained at the start of every turn
+    - actions, with the energy each of them generates"""
+
+    ult_cost: float
+    init_sp: int
+    init_energy: LinearEnergy
+    turn_energy: LinearEnergy
+    actions: tuple[tuple[Action, LinearEnergy], ...]
+
+    def find_rotations(self, energy_recharge: float) -> RotationList:
+        """Returns the rotations found at the given ER, in the order the search finds them."""
+
+        return count_rotations(self.init_energy.at(energy_recharge), self.init_sp,
+                               self.ult_cost, self.turn_energy.at(energy_recharge),
+                               tuple(replace(action, energy=energy.at(energy_recharge))
+                                     for action, energy in self.actions))
+
+    def get_candidates(self, max_turns: int) -> CandidateRotations:
+        """Returns every rotation of at most max_turns turns, whether it's ever found or not."""
+
+        counts = np.array([[actions.count(i) for i in range(len(self.actions))]
+                           for num_turns in range(max_turns + 1)
+                           for actions in combinations_with_replacement(
+                               range(len(self.actions)), num_turns)],
+                          dtype=np.int64).reshape(-1, len(self.actions))
+        num_turns = counts.sum(axis=1)
+
+        constants = np.array([energy.constant for _, energy in self.actions])
+        per_ers = np.array([energy.per_er for _, energy in self.actions])
+        skill_points = np.array([action.skill_points for action, _ in self.actions],
+                                dtype=np.int64)
+
+        return CandidateRotations(
+            counts,
+            self.init_energy.constant + num_turns * self.turn_energy.constant
+            + counts @ constants,
+            self.init_energy.per_er + num_turns * self.turn_energy.per_er + counts @ per_ers,
+            self.init_sp + counts @ skill_points,
+            [create_rotation_key([action.name for action, _ in self.actions], tuple(row))
+             for row in counts.tolist()])
+
+    def get_critical_ers(self, candidates: CandidateRotations, lower_bound: float,
+                         upper_bound: float) -> list[float]:
+        """Returns the ER values in (lower_bound, upper_bound], from the lowest,
+        at which any of the candidate rotations generates exactly the Ultimate cost.
+        Found rotations can only change at these values."""
+
+        increasing = candidates.per_er > 0
+        energy_recharges = ((self.ult_cost - candidates.constant[increasing])
+                            / candidates.per_er[increasing])
+        in_range = (energy_recharges > lower_bound) & (energy_recharges <= upper_bound)
+
+        return sorted(set(energy_recharges[in_range].tolist()))
+
+    def find_leaves(self, candidates: CandidateRotations,
+                    energy_recharges: np.ndarray) -> Optional[np.ndarray]:
+        """Returns which candidate rotations are found at every ER value,
+        as an array with a row for every rotation and a column for every ER value.
+
+        A rotation is found if it reaches the Ultimate cost, while the rotation without
+        one of its actions (and the turn it was used in) does not.
+        That only holds if every turn generates energy, otherwise None is returned."""
+
+        turn_energies = self.turn_energy.at(energy_recharges)
+        action_energies = [energy.at(energy_recharges) for _, energy in self.actions]
+
+        if any(np.any(turn_energies + action_energy <= 0) for action_energy in action_energies):
+            return None
+
+        energies = (candidates.constant[:, np.newaxis]
+                    + np.outer(candidates.per_er, energy_recharges))
+        reaches_ult = energies >= self.ult_cost
+
+        if not len(self.actions):
+            return reaches_ult
+
+        prefix_below_ult = np.zeros_like(reaches_ult)
+        for i, action_energy in enumerate(action_energies):
+            prefix_below_ult |= ((candidates.counts[:, i, np.newaxis] > 0)
+                                 & (energies - turn_energies - action_energy < self.ult_cost))
+
+        is_empty = candidates.counts.sum(axis=1) == 0
+
+        return reaches_ult & (prefix_below_ult | is_empty[:, np.newaxis])
+
+    def find_best_rotations(self, candidates: CandidateRotations,
+                            energy_recharges: list[float],
+                            matches: Callable[[Rotation], bool],
+                            sorting_key: Callable[[Rotation], Any],
+                            char_name: Optional[str] = None) -> list[Optional[Rotation]]:
+        """Returns the best rotation of a category at every ER value, if there is any,
+        chosen the same way as by a RotationAggregator with the given filter and sorting key.
+        All ER values are evaluated at once, every candidate's energy being a dot product
+        of its action counts and the energy of every action.
+
+        Found rotations whose sorting keys are equal are resolved in the order
+        the search finds them in, so at such ER values, and if "find_leaves" can't be used,
+        rotations are found one ER value at a time (see "find_rotations")."""
+
+        leaves = self.find_leaves(candidates, np.array(energy_recharges, dtype=float))
+        if leaves is None:
+            return [self._find_best_rotation(energy_recharge, matches, sorting_key, char_name)
+                    for energy_recharge in energy_recharges]
+
+        rotations = [Rotation(0, rotation_key, skill_points_generated)
+                     for rotation_key, skill_points_generated
+                     in zip(candidates.rotation_keys, candidates.skill_points.tolist())]
+        for rotation in rotations:
+            rotation.process_rotation_data(char_name)
+
+        indices = sorted((i for i, rotation in enumerate(rotations) if matches(rotation)),
+                         key=lambda i: sorting_key(rotations[i]))
+        if not indices:
+            return [None] * len(energy_recharges)
+
+        sorting_keys = [sorting_key(rotations[i]) for i in indices]
+        key_ids = np.cumsum([0] + [int(key != previous_key) for previous_key, key
+                                   in zip(sorting_keys, sorting_keys[1:])])
+
+        category_leaves = leaves[indices]
+        is_found = category_leaves.any(axis=0)
+        first = category_leaves.argmax(axis=0)
+        num_tied = ((key_ids[:, np.newaxis] == key_ids[first]) & category_leaves).sum(axis=0)
+
+        best_rotations = []
+        for column, energy_recharge in enumerate(energy_recharges):
+            if not is_found[column]:
+                best_rotations.append(None)
+            elif num_tied[column] > 1:
+                best_rotations.append(self._find_best_rotation(energy_recharge, matches,
+                                                               sorting_key, char_name))
+            else:
+                i = indices[first[column]]
+                best_rotations.append(replace(
+                    rotations[i], energy_generated=round(
+                        float(candidates.constant[i] + candidates.per_er[i] * energy_recharge),
+                        3)))
+
+        return best_rotations
+
+    def _find_best_rotation(self, energy_recharge: float, matches: Callable[[Rotation], bool],
+                            sorting_key: Callable[[Rotation], Any],
+                            char_name: Optional[str]) -> Optional[Rotation]:
+        aggregator = RotationAggregator(matches, sorting_key)
+
+        for rotation in self.find_rotations(energy_recharge):
+            rotation.process_rotation_data(char_name)
+            aggregator.add(rotation)
+
+        return aggregator.rotation
+
+    def get_max_turns(self, energy_recharge: float) -> int:
+        """Returns the number of turns of the longest rotation found at the given ER.
+        No rotation found at a higher ER can be longer."""
+
+        return max((get_num_turns(rotation.rotation_key)
+                    for rotation in self.find_rotations(energy_recharge)), default=0)
+
+
+def get_energy_components(stats: CharStats,
+                          user_input: UserInput) -> Optional[EnergyComponents]:
+    """Returns all the energy the character generates with the current stats,
+    or None if the order of the character's actions matters."""
+
+    actions = get_count_actions(stats, user_input, get_mechanics(user_input.char_name))
+    if actions is None:
+        return None
+
+    turn_energy, _, _ = create_turn_effects(stats, user_input).start_turn(stats, 0, 0)
+
+    return EnergyComponents(stats.init_energy, turn_energy, actions)
+
+
+def create_energy_model(stats: CharStats, at_zero: EnergyComponents, at_one: EnergyComponents,
+                        current: EnergyComponents) -> Optional[EnergyModel]:
+    """Creates the model from the energy components at 0% and 100% ER,
+    as long as it matches the components at the current ER, otherwise returns None."""
+
+    def linear(energy_at_zero: float, energy_at_one: float) -> LinearEnergy:
+        return LinearEnergy(energy_at_zero, energy_at_one - energy_at_zero)
+
+    model = EnergyModel(stats.ult_cost, stats.init_sp,
+                        linear(at_zero.init_energy, at_one.init_energy),
+                        linear(at_zero.turn_energy, at_one.turn_energy),
+                        tuple((action, linear(action.energy, action_at_one.energy))
+                              for action, action_at_one in zip(at_zero.actions, at_one.actions)))
+
+    energy_recharge = stats.energy_recharge
+    expected = ([model.init_energy.at(energy_recharge), model.turn_energy.at(energy_recharge)]
+                + [energy.at(energy_recharge) for _, energy in model.actions])
+    actual = ([current.init_energy, current.turn_energy]
+              + [action.energy for action in current.actions])
+
+    if len(expected) != len(actual) or any(abs(expected_energy - actual_energy)
+                                           > LINEARITY_TOLERANCE
+                                           for expected_energy, actual_energy
+                                           in zip(expected, actual)):
+        return None
+
+    return model
@@ -0,0 +1,80 @@
+"""Module for the fixed-point energy mode.
+
+Energy values are floats scaled by energy recharge, so the same amount of energy
+can be reached with slightly different values, depending on the order it was added in.
+In the fixed-point mode, every energy value used by the search (character stats, counters,
+support Light Cones, and actions) is converted to an integer number of millionths of energy
+before the search starts, so that search states can be compared and stored exactly.
+Energy of the found rotations is converted back afterwards."""
+
+from copy import copy
+from dataclasses import fields, replace
+from typing import TYPE_CHECKING
+from character_utils.characters import CharStats
+from gui_scripts.counter import Counter
+from gui_scripts.user_input import UserInput
+from .rotation import RotationList
+
+if TYPE_CHECKING:
+    from .character_algorithms.mechanics_algorithm import CompiledAction
+
+# Number of units a single point of energy is divided into
+ENERGY_SCALE = 10 ** 6
+
+
+def to_fixed(energy: float) -> int:
+    return round(energy * ENERGY_SCALE)
+
+
+def from_fixed(energy: int) -> float:
+    return energy / ENERGY_SCALE
+
+
+def to_fixed_point_stats(stats: CharStats) -> CharStats:
+    """Returns a copy of the character stats with all energy values converted,
+    including the Ultimate cost. Cached stats are shared with the original ones,
+    so that energy recharge can still be applied to them."""
+
+    fixed_stats = copy(stats)
+
+    for stat in fields(stats):
+        if stat.type == float and stat.name != "energy_recharge":
+            setattr(fixed_stats, stat.name, to_fixed(getattr(stats, stat.name)))
+
+    return fixed_stats
+
+
+def to_fixed_point_input(user_input: UserInput) -> UserInput:
+    """Returns a copy of the user's inputs with the energy of all counters
+    and the bonus of energy-granting support Light Cones converted.
+    Only the converted values are copied, everything else is shared with the original inputs."""
+
+    fixed_input = copy(user_input)
+
+    for name, value in vars(user_input).items():
+        if isinstance(value, Counter):
+            setattr(fixed_input, name, replace(value, energy=to_fixed(value.energy)))
+
+    fixed_input.counters = {name: getattr(fixed_input, name) for name in user_input.counters}
+
+    support_light_cone = user_input.support_light_cone
+    if support_light_cone and support_light_cone.recharge_type in ("bonus_energy",
+                                                                   "quid_pro_quo"):
+        fixed_input.support_light_cone = copy(support_light_cone)
+        fixed_input.support_light_cone.bonus = to_fixed(support_light_cone.bonus)
+
+    return fixed_input
+
+
+def to_fixed_point_actions(actions: list["CompiledAction"]) -> list["CompiledAction"]:
+    """Returns the compiled actions with their regular and buffed energy converted."""
+
+    return [replace(action, energy=(to_fixed(action.energy[0]), to_fixed(action.energy[1])))
+            for action in actions]
+
+
+def from_fixed_point_rotations(all_rotations: RotationList) -> None:
+    """Converts the energy generated by every rotation back, in place."""
+
+    for rotation in all_rotations:
+        rotation.energy_generated = from_fixed(rotation.energy_generated)
@@ -2,67 +2,103 @@
 used for storing character's rotation data."""
 
 from dataclasses import dataclass, field
-from typing import Optional
-from rbloom import Bloom
+from sys import getsizeof
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .transposition_table import TranspositionTable
+
+# All actions that can be a part of a rotation,
+# their order determines the layout of rotation keys
+ACTION_NAMES = ("BASIC", "SKILL", "E. BASIC", "EB1", "EB2", "EB3", "E. SKILL")
+_ACTION_INDICES = {name: i for i, name in enumerate(ACTION_NAMES)}
+
+# Number of bits every action's count takes up in a rotation key,
+# rotations never get anywhere near 2 ** ACTION_BITS uses of a single action
+ACTION_BITS = 8
+_ACTION_MASK = (1 << ACTION_BITS) - 1
 
 
 @dataclass(slots=True)
 class Rotation:
     """Class representing a character rotation. It's attributes include:
     - the energy generated during it
-    - turns that constitute it
+    - its rotation key, i.e., the number of times every action was used (see get_rotation_key)
     - its skill point cost
-    - counters for all various attacks (basics, skills, enhanced basics etc.)"""
+    - its length and skill point cost per turn
+
+    Counters for all various attacks (basics, skills, enhanced basics etc.),
+    as well as the turns that constitute the rotation, are decoded from the rotation key
+    when they are needed, instead of being stored."""
 
     energy_generated: float = 0
-    turns: list[str] = field(default_factory=lambda: [])
+    rotation_key: int = 0
     skill_points_generated: int = 0
     num_turns: int = 0
     sp_cost_per_turn: float = 0
-    basic_count: int = 0
-    skill_count: int = 0
-    e_basic_count: int = 0
-    e_basic_2_count: int = 0
-    e_basic_3_count: int = 0
-    e_skill_count: int = 0
-    all_basics_count: int = 0
-    all_skills_count: int = 0
-    turn_sequence: str = ""
-
-    def __post_init__(self):
-        """Sorts turns and joins them into a temporary turn sequence
-        for easier and faster filtering later on."""
-
-        self.turns.sort()
-        self.turn_sequence = " ".join(self.turns)
+    char_name: Optional[str] = None
+
+    @property
+    def basic_count(self) -> int:
+        return get_action_count(self.rotation_key, "BASIC")
+
+    @property
+    def skill_count(self) -> int:
+        return get_action_count(self.rotation_key, "SKILL")
+
+    @property
+    def e_basic_count(self) -> int:
+        return (get_action_count(self.rotation_key, "E. BASIC")
+                + get_action_count(self.rotation_key, "EB1"))
+
+    @property
+    def e_basic_2_count(self) -> int:
+        return get_action_count(self.rotation_key, "EB2")
+
+    @property
+    def e_basic_3_count(self) -> int:
+        return get_action_count(self.rotation_key, "EB3")
+
+    @property
+    def e_skill_count(self) -> int:
+        return get_action_count(self.rotation_key, "E. SKILL")
+
+    @property
+    def all_basics_count(self) -> int:
+        return (self.basic_count + self.e_basic_count +
+                self.e_basic_2_count + self.e_basic_3_count)
+
+    @property
+    def all_skills_count(self) -> int:
+        return self.skill_count + self.e_skill_count
+
+    @property
+    def turns(self) -> list[str]:
+        """Returns all turns that constitute the rotation, sorted alphabetically."""
+
+        return sorted(name for name in ACTION_NAMES
+                      for _ in range(get_action_count(self.rotation_key, name)))
+
+    @property
+    def turn_sequence(self) -> str:
+        """Returns the turns in the order they are displayed in, see "_order_turns"."""
+
+        if self.char_name == "Dan Heng IL":
+            return self._order_turns_dhil()
+
+        return self._order_turns()
 
     def process_rotation_data(self, char_name: Optional[str] = None) -> None:
         """Processes and computes attributes of the rotation.
 
-        This method calculates and updates various attributes of the rotation,
-        including the number of turns, energy generated,
-        skill point cost per turn, and various attack counts.
-        It also orders the rotation turns for easier analysis and filtering."""
+        This method calculates and updates the number of turns, energy generated,
+        and skill point cost per turn of the rotation."""
 
-        self.num_turns = max(len(self.turns), 1)
+        self.num_turns = max(get_num_turns(self.rotation_key), 1)
         self.energy_generated = round(self.energy_generated, 3)
         self.sp_cost_per_turn = round(
             self.skill_points_generated / self.num_turns, 3)
-        self.basic_count = self.turns.count("BASIC")
-        self.skill_count = self.turns.count("SKILL")
-        self.e_basic_count = (self.turns.count("E. BASIC")
-                              + self.turns.count("EB1"))
-        self.e_basic_2_count = self.turns.count("EB2")
-        self.e_basic_3_count = self.turns.count("EB3")
-        self.e_skill_count = self.turns.count("E. SKILL")
-        self.all_basics_count = (self.basic_count + self.e_basic_count +
-                                 self.e_basic_2_count + self.e_basic_3_count)
-        self.all_skills_count = self.skill_count + self.e_skill_count
-
-        if char_name == "Dan Heng IL":
-            self.turn_sequence = self._order_turns_dhil()
-        else:
-            self.turn_sequence = self._order_turns()
+        self.char_name = char_name
 
     def _order_turns(self) -> str:
         """Returns the list of turns in the following format:
@@ -127,34 +163,88 @@ class Rotation:
         return " > ".join(sequence)
 
 
+def get_rotation_key(turns: list[str]) -> int:
+    """Returns the number of occurrences of every action found in ACTION_NAMES,
+    packed into a single integer, ACTION_BITS bits per action, in the order of ACTION_NAMES.
+    Permutations of the same rotation share the same key."""
+
+    rotation_key = 0
+    for turn in turns:
+        rotation_key += get_action_bit(turn)
+
+    return rotation_key
+
+
+def create_rotation_key(action_names: list[str], counts: tuple[int, ...]) -> int:
+    """Returns the rotation key for the given number of times every action was used."""
+
+    return sum(count * get_action_bit(name) for name, count in zip(action_names, counts))
+
+
+def get_action_bit(action_name: str) -> int:
+    """Returns the amount a rotation key increases by when the action is used."""
+
+    return 1 << (ACTION_BITS * _ACTION_INDICES[action_name])
+
+
+def get_actions_mask(action_names: tuple[str, ...]) -> int:
+    """Returns the mask of the bits that store the counts of the given actions."""
+
+    return sum(_ACTION_MASK * get_action_bit(name) for name in action_names)
+
+
+def get_action_count(rotation_key: int, action_name: str) -> int:
+    """Returns the number of times the action was used."""
+
+    return (rotation_key >> (ACTION_BITS * _ACTION_INDICES[action_name])) & _ACTION_MASK
+
+
+def get_num_turns(rotation_key: int) -> int:
+    """Returns the number of times any action was used."""
+
+    num_turns = 0
+    while rotation_key:
+        num_turns += rotation_key & _ACTION_MASK
+        rotation_key >>= ACTION_BITS
+
+    return num_turns
+
+
 @dataclass(slots=True)
 class RotationList(list[Rotation]):
     """Custom class representing a list[Rotation].
     Mimics all built-in methods of a regular list class,
     with the added "add_rotation" which checks whether a rotation is unique,
-    and if it is adds it to the RotationList itself."""
-
-    bloom_filter = Bloom(1000, 0.001)
+    and if it is adds it to the RotationList itself.
 
-    def __post_init__(self):
-        """Clears the Bloom Filter before every individual calculation.
-        Otherwise the filter would get filled and no new rotations could be added,
-        resulting in no results at all, and calculator failing."""
+    Uniqueness is checked exactly, against the keys of the rotations
+    this particular list has already stored.
+    Algorithms that use a transposition table store it alongside the rotations,
+    so that its hit and miss counters can be inspected.
+    If the search was stopped early (see search_budget), the list is marked as incomplete."""
 
-        self.bloom_filter.clear()
+    _rotation_keys: set[int] = field(init=False, default_factory=set)
+    transposition_table: Optional["TranspositionTable"] = field(init=False, default=None)
+    is_complete: bool = field(init=False, default=True)
 
-    def add_rotation(self, energy_generated: float, turns: list[str],
+    def add_rotation(self, energy_generated: float, rotation_key: int,
                      skill_points_generated: float) -> None:
         """Checks if the rotation is unique, i.e., not a permutation of another one.
-        If so, Rotation dataclass is created and appended."""
-
-        turn_sequence = " ".join(sorted(turns))
+        If so, Rotation dataclass is created and appended.
+        Rotations are passed as their rotation keys, see get_rotation_key."""
 
-        if turn_sequence not in self.bloom_filter:
-            self.bloom_filter.add(turn_sequence)
-            self.append(Rotation(energy_generated, turns,
+        if rotation_key not in self._rotation_keys:
+            self._rotation_keys.add(rotation_key)
+            self.append(Rotation(energy_generated, rotation_key,
                                  skill_points_generated))
 
+    def dedup_memory_usage(self) -> int:
+        """Returns the approximate number of bytes
+        used for storing the keys of unique rotations."""
+
+        return (getsizeof(self._rotation_keys)
+                + sum(getsizeof(key) for key in self._rotation_keys))
+
     def process_rotation_data(self, char_name: Optional[str] = None) -> None:
         """Processes and computes attributes of all stored rotations."""
 
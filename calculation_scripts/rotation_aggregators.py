@@ -0,0 +1,143 @@
+"""Module containing RotationAggregator and RotationAggregators dataclasses,
+used for finding the printed rotations without storing all the rotations found.
+
+Every printed rotation is the best rotation of a single category (query),
+e.g., the shortest basic only rotation, so instead of collecting all rotations in a RotationList,
+the algorithms can add them one at a time to an aggregator per query,
+each keeping only the best rotation it has seen so far.
+Apart from the keys of the rotations already seen, which are single integers,
+memory used therefore depends only on the number of queries, not on the size of the search.
+
+A category can also keep its k best rotations by a score (see rotation_scores),
+in which case a heap of at most k rotations is kept instead of a single one."""
+
+from dataclasses import dataclass, field
+from heapq import heappush, heapreplace
+from itertools import count
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+from .rotation import Rotation, RotationList
+
+if TYPE_CHECKING:
+    from .transposition_table import TranspositionTable
+
+
+@dataclass(slots=True)
+class RotationAggregator:
+    """Class that keeps the best rotation of a single category. It's attributes include:
+    - matches: checks whether a rotation belongs to the category
+    - sorting_key: the best rotation is the one with the lowest sorting key
+    - rotation: the best rotation added so far, if any
+
+    Rotations with equal sorting keys do not replace each other,
+    so the first one added is kept, the same way "min" would pick it."""
+
+    matches: Callable[[Rotation], bool]
+    sorting_key: Callable[[Rotation], Any]
+    rotation: Optional[Rotation] = None
+    _best_key: Any = field(init=False, default=None)
+
+    def add(self, rotation: Rotation) -> None:
+        if not self.matches(rotation):
+            return
+
+        sorting_key = self.sorting_key(rotation)
+        if self.rotation is None or sorting_key < self._best_key:
+            self.rotation, self._best_key = rotation, sorting_key
+
+
+@dataclass(slots=True)
+class TopRotationsAggregator:
+    """Class that keeps the k rotations of a single category with the highest scores.
+    It's attributes include:
+    - matches: checks whether a rotation belongs to the category
+    - score: the higher the score, the better the rotation
+    - k: number of rotations kept
+
+    Rotations are kept in a min-heap, so the lowest scoring one is replaced
+    once a better one is added. Rotations with equal scores rank in the order they were added,
+    so a rotation never replaces one with an equal score."""
+
+    matches: Callable[[Rotation], bool]
+    score: Callable[[Rotation], float]
+    k: int = 10
+    _heap: list[tuple[float, int, Rotation]] = field(init=False, default_factory=list)
+    _order: Iterator[int] = field(init=False, default_factory=count)
+
+    @property
+    def rotation(self) -> Optional[Rotation]:
+        """Returns the rotation with the highest score, if any."""
+
+        ranking = self.get_ranking()
+        return ranking[0][1] if ranking else None
+
+    def add(self, rotation: Rotation) -> None:
+        if self.k <= 0 or not self.matches(rotation):
+            return
+
+        entry = (self.score(rotation), -next(self._order), rotation)
+
+        if len(self._heap) < self.k:
+            heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapreplace(self._heap, entry)
+
+    def get_ranking(self) -> list[tuple[float, Rotation]]:
+        """Returns the kept rotations and their scores, from the highest score."""
+
+        return [(score, rotation) for score, _, rotation in sorted(self._heap, reverse=True)]
+
+
+@dataclass(slots=True)
+class RotationAggregators:
+    """Class that can be used by the algorithms in place of a RotationList.
+    Every unique rotation is processed straight away and passed on to all the aggregators,
+    after which it's discarded, unless it's the best rotation of any category.
+
+    Only the keys of the rotations are stored, so that permutations of a rotation
+    that was already added are skipped, the same way RotationList skips them.
+    If the search was stopped early, the aggregators are marked as incomplete."""
+
+    aggregators: dict[str, RotationAggregator | TopRotationsAggregator]
+    char_name: Optional[str] = None
+    transposition_table: Optional["TranspositionTable"] = field(init=False, default=None)
+    is_complete: bool = field(init=False, default=True)
+    _rotation_keys: set[int] = field(init=False, default_factory=set)
+
+    def add_rotation(self, energy_generated: float, rotation_key: int,
+                     skill_points_generated: float) -> None:
+        if rotation_key in self._rotation_keys:
+            return
+
+        self._rotation_keys.add(rotation_key)
+        rotation = Rotation(energy_generated, rotation_key, skill_points_generated)
+        rotation.process_rotation_data(self.char_name)
+
+        for aggregator in self.aggregators.values():
+            aggregator.add(rotation)
+
+    def get(self, query: str) -> Optional[Rotation]:
+        """Returns the best rotation of the specified category, if any was found."""
+
+        return self.aggregators[query].rotation
+
+    def get_ranking(self, query: str) -> list[tuple[float, Rotation]]:
+        """Returns the top rotations of the specified category and their scores,
+        see TopRotationsAggregator."""
+
+        return self.aggregators[query].get_ranking()
+
+
+def stream_rotations(all_rotations: RotationList, aggregators: Optional[RotationAggregators]
+                     ) -> RotationList | RotationAggregators:
+    """Adds the rotations found by an algorithm that collects them itself to the aggregators,
+    in the order they were found in. Returns the rotations if there are no aggregators."""
+
+    if aggregators is None:
+        return all_rotations
+
+    aggregators.is_complete = aggregators.is_complete and all_rotations.is_complete
+    for rotation in all_rotations:
+        aggregators.add_rotation(rotation.energy_generated, rotation.rotation_key,
+                                 rotation.skill_points_generated)
+
+    return aggregators
@@ -0,0 +1,56 @@
+"""Module for scoring rotations, used to rank the top rotations of a character
+(see rotation_aggregators.TopRotationsAggregator).
+
+Any function that takes a rotation and returns a number can be used as a score.
+The weighted score gives every action a weight, e.g., how much damage it deals,
+and adds the skill point cost per turn, weighted as well, to its average weight per turn."""
+
+from typing import Callable
+from .rotation import ACTION_NAMES, Rotation, get_action_count
+
+# Name of the weight of the skill point cost per turn
+SP_PER_TURN = "SP/T"
+
+
+def parse_score_weights(text: str) -> dict[str, float]:
+    """Returns the weights written as "EB3 = 3.2, BASIC = 1.0, SP/T = 0.5".
+    Names are the names of actions (see rotation.ACTION_NAMES) or "SP/T", in any case.
+    Actions that are not listed have a weight of 0."""
+
+    names = {name.upper(): name for name in ACTION_NAMES + (SP_PER_TURN,)}
+    weights = {}
+
+    for part in filter(None, (part.strip() for part in text.split(","))):
+        name, _, weight = part.partition("=")
+
+        try:
+            weights[names[name.strip().upper()]] = float(weight)
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid weight: {part}") from None
+
+    return weights
+
+
+def create_weighted_score(weights: dict[str, float]) -> Callable[[Rotation], float]:
+    """Returns the score that sums the weights of all actions of a rotation,
+    divides them by the number of its turns, and adds its weighted skill point cost per turn."""
+
+    action_weights = {name: weight for name, weight in weights.items() if name != SP_PER_TURN}
+    sp_weight = weights.get(SP_PER_TURN, 0)
+
+    def score(rotation: Rotation) -> float:
+        action_score = sum(weight * get_action_count(rotation.rotation_key, name)
+                           for name, weight in action_weights.items())
+
+        return action_score / rotation.num_turns + sp_weight * rotation.sp_cost_per_turn
+
+    return score
+
+
+def get_total_value(rotation: Rotation, weights: dict[str, float]) -> float:
+    """Returns the weighted score of a rotation multiplied by its number of turns,
+    i.e., the sum of the weights of all its actions and of all skill points it generates."""
+
+    return (sum(weight * get_action_count(rotation.rotation_key, name)
+                for name, weight in weights.items() if name != SP_PER_TURN)
+            + weights.get(SP_PER_TURN, 0) * rotation.skill_points_generated)
@@ -0,0 +1,256 @@
+"""Module containing the SearchBound class used by the bounded search mode.
+
+In this mode the algorithms keep track of the shortest rotation found so far
+for every requested category (e.g. basic only rotation, neutral rotation, etc.),
+and stop expanding branches that can no longer match or beat any of them.
+Rotations, finished or not, are passed as their rotation keys (see rotation.get_rotation_key).
+
+The shortest-first search mode uses the same categories, but explores rotations
+one turn at a time, and stops once the shortest rotations of every category are found."""
+
+from dataclasses import dataclass, field
+from math import ceil, inf
+from typing import Optional
+from gui_scripts.user_input import UserInput
+from .rotation import get_action_count, get_num_turns
+
+SKILLS = ("SKILL", "E. SKILL")
+BASICS = ("BASIC", "E. BASIC", "EB1", "EB2", "EB3")
+
+# Categories used by the default print function
+DEFAULT_QUERIES = ("best", "neutral", "basic_only", "skill_only", "one_skill")
+# Dan Heng IL's rotations are filtered by their skill point cost per turn instead
+DHIL_QUERIES = ("best", "sp_per_turn>=0", "sp_per_turn>=-0.5", "sp_per_turn>=-1.25",
+                "sp_per_turn>=-1.5", "sp_per_turn>=-2", "sp_per_turn>=-2.33")
+# Characters whose print functions use categories other than the default ones
+CHARACTER_QUERIES = {
+    "Blade": ("best",),
+    "Dan Heng IL": DHIL_QUERIES
+}
+
+
+def _count_skills(rotation_key: int) -> int:
+    return sum(get_action_count(rotation_key, name) for name in SKILLS)
+
+
+def _count_basics(rotation_key: int) -> int:
+    return sum(get_action_count(rotation_key, name) for name in BASICS)
+
+
+def matches_query(query: str, rotation_key: int,
+                  skill_points_generated: float) -> bool:
+    """Checks whether a finished rotation belongs to the specified category."""
+
+    match query:
+        case "best":
+            return True
+        case "neutral":
+            return skill_points_generated == 0
+        case "basic_only":
+            return _count_skills(rotation_key) == 0
+        case "skill_only":
+            return _count_basics(rotation_key) == 0
+        case "one_skill":
+            return _count_skills(rotation_key) == 1
+
+    sp_cost_per_turn = float(query.split(">=")[1])
+    num_turns = max(get_num_turns(rotation_key), 1)
+    return round(skill_points_generated / num_turns, 3) >= sp_cost_per_turn
+
+
+def can_match_query(query: str, rotation_key: int) -> bool:
+    """Checks whether an unfinished rotation can still end up in the specified category.
+    Categories based on skill points can always be reached, as far as the bound is concerned."""
+
+    match query:
+        case "basic_only":
+            return _count_skills(rotation_key) == 0
+        case "skill_only":
+            return _count_basics(rotation_key) == 0
+        case "one_skill":
+            return _count_skills(rotation_key) <= 1
+
+    return True
+
+
+def _can_use_action(query: str, action: str) -> bool:
+    """Checks whether the action can be a part of a rotation of the specified category."""
+
+    match query:
+        case "basic_only":
+            return action in BASICS
+        case "skill_only":
+            return action in SKILLS
+
+    return True
+
+
+@dataclass(slots=True)
+class SearchBound:
+    """Class that stores the number of turns of the shortest rotation found so far
+    for each of the requested categories (queries).
+
+    Its attributes include:
+    - ult_cost: amount of energy rotation needs to generate
+    - action_energies: highest amount of energy each action can generate
+    - turn_energy: highest amount of energy gained at the start of a single turn
+    - queries: categories of rotations that are requested
+    - incumbents: number of turns of the shortest rotation found in each category
+    - num_pruned: number of branches that were not expanded"""
+
+    ult_cost: float
+    action_energies: dict[str, float]
+    turn_energy: float = 0
+    queries: tuple[str, ...] = DEFAULT_QUERIES
+    incumbents: dict[str, int] = field(default_factory=dict)
+    num_pruned: int = 0
+    _max_turn_gains: dict[str, float] = field(init=False, default_factory=dict)
+
+    def __post_init__(self):
+        """Determines the highest amount of energy a single turn can generate
+        for each category, using only the actions that category allows."""
+
+        for query in self.queries:
+            allowed_energies = [energy for action, energy in self.action_energies.items()
+                                if _can_use_action(query, action)]
+            self._max_turn_gains[query] = max(allowed_energies, default=0) + self.turn_energy
+
+    def update(self, rotation_key: int, skill_points_generated: float) -> None:
+        """Updates the incumbents with a newly found rotation."""
+
+        num_turns = max(get_num_turns(rotation_key), 1)
+
+        if (len(self.incumbents) == len(self.queries)
+                and num_turns >= max(self.incumbents.values())):
+            return
+
+        for query in self.queries:
+            if (num_turns < self.incumbents.get(query, inf)
+                    and matches_query(query, rotation_key, skill_points_generated)):
+                self.incumbents[query] = num_turns
+
+    def min_turns(self, query: str, curr_energy: float,
+                  rotation_key: int) -> float:
+        """Returns the lower bound on the number of turns any rotation
+        of the specified category, continuing from this branch, can have."""
+
+        energy_needed = self.ult_cost - curr_energy
+        if energy_needed <= 0:
+            return get_num_turns(rotation_key)
+
+        max_turn_gain = self._max_turn_gains[query]
+        if max_turn_gain <= 0:
+            return inf
+
+        # small tolerance guards against floating point errors
+        return get_num_turns(rotation_key) + ceil(energy_needed / max_turn_gain - 1e-9)
+
+    def can_prune(self, curr_energy: float, rotation_key: int) -> bool:
+        """Checks whether this branch can be skipped, i.e.,
+        whether it cannot produce a rotation as short as the current best
+        in any of the categories it could still belong to.
+
+        Note that curr_energy should be an optimistic estimate,
+        e.g., it should include energy from any stored follow-up attacks."""
+
+        if len(self.incumbents) < len(self.queries):
+            return False
+
+        for query in self.queries:
+            if (self.min_turns(query, curr_energy, rotation_key) <= self.incumbents[query]
+                    and can_match_query(query, rotation_key)):
+                return False
+
+        self.num_pruned += 1
+        return True
+
+
+def get_queries(char_name: str) -> tuple[str, ...]:
+    """Returns the categories of rotations printed for the character."""
+
+    return CHARACTER_QUERIES.get(char_name, DEFAULT_QUERIES)
+
+
+def get_shortest_first_queries(user_input: UserInput) -> tuple[str, ...]:
+    """Returns the categories of rotations the shortest-first search mode stops on,
+    or an empty tuple if another search mode was selected."""
+
+    if user_input.search_mode != "shortest":
+        return ()
+
+    return get_queries(user_input.char_name)
+
+
+def depends_on_skill_points(query: str) -> bool:
+    """Checks whether rotations of the specified category are determined
+    by their skill point cost, rather than by the actions they contain."""
+
+    return query == "neutral" or query.startswith("sp_per_turn")
+
+
+def update_answers(answers: dict[str, int], queries: tuple[str, ...],
+                   rotation_key: int, skill_points_generated: float) -> None:
+    """Stores the number of turns of the shortest rotation found so far in every category."""
+
+    num_turns = max(get_num_turns(rotation_key), 1)
+
+    for query in queries:
+        if (num_turns < answers.get(query, inf)
+                and matches_query(query, rotation_key, skill_points_generated)):
+            answers[query] = num_turns
+
+
+def can_improve_answers(answers: dict[str, int], queries: tuple[str, ...],
+                        rotation_key: int, min_turns: int) -> bool:
+    """Checks whether an unfinished rotation, which will take at least min_turns turns,
+    can still be one of the shortest rotations in any of the categories.
+    Rotations as long as the shortest one are kept, so that ties are resolved the same way."""
+
+    return any(min_turns <= answers.get(query, inf) and can_match_query(query, rotation_key)
+               for query in queries)
+
+
+def create_search_bound(ult_cost: float, user_input: UserInput,
+                        action_energies: dict[str, float],
+                        queries: tuple[str, ...] = DEFAULT_QUERIES,
+                        turn_energy: float = 0) -> Optional[SearchBound]:
+    """Creates a SearchBound if the bounded or the A* search mode was selected,
+    otherwise returns None. The A* search uses it only as its heuristic.
+    Highest energy gained at the start of a turn includes the specified turn energy,
+    as well as the highest energy that can be gained from counters and support Light Cones."""
+
+    if user_input.search_mode not in ("bounded", "astar"):
+        return None
+
+    turn_energy += max_turn_energy(user_input)
+    if turn_energy == inf:
+        return None
+
+    return SearchBound(ult_cost, action_energies, turn_energy, queries)
+
+
+def max_turn_energy(user_input: UserInput) -> float:
+    """Returns the highest amount of energy that can be generated at the start of a single turn,
+    i.e., energy from counters (kills, hits taken, etc.) and support Light Cones."""
+
+    turn_energy = 0
+
+    for counter in user_input.counters.values():
+        turn_energy += max(counter.energy, 0) * counter.get_max_triggers()
+
+    support_light_cone = user_input.support_light_cone
+    if not support_light_cone or support_light_cone.trigger.num_triggers == 0:
+        return turn_energy
+
+    num_applications = support_light_cone.trigger.get_max_triggers()
+
+    match support_light_cone.recharge_type:
+        case "bonus_energy":
+            turn_energy += support_light_cone.bonus * num_applications
+        case "quid_pro_quo":
+            turn_energy += support_light_cone.bonus * num_applications
+        case "temp_energy_recharge":
+            # energy recharge buffs increase the energy of all actions
+            return inf
+
+    return turn_energy
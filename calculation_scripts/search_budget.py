@@ -0,0 +1,84 @@
+"""Module containing the SearchBudget class, which limits how long a single search can run.
+
+A search can be limited by the number of states it expands, by the time it takes,
+and it can be stopped at any time through a cancellation token, e.g., from another thread.
+Searches check their budget every so often, and once it's spent,
+they stop and return the rotations found so far, marked as incomplete.
+
+The time limit applies to the whole calculation, rather than to each of its searches,
+as a single calculation can run many of them, e.g., while ER breakpoints are found.
+Every search the calculation runs stops at the same deadline, see "start_search_deadline"."""
+
+from dataclasses import dataclass
+from threading import Event
+from time import perf_counter
+from typing import Optional
+from gui_scripts.user_input import UserInput
+
+# Highest number of states expanded between two checks of the clock and the cancellation token
+CHECK_INTERVAL = 1024
+
+
+@dataclass(slots=True)
+class SearchBudget:
+    """Class that keeps track of the states expanded by a single search.
+
+    Its attributes include:
+    - max_nodes: highest number of states the search can expand, 0 for no limit
+    - deadline: time (see time.perf_counter) at which the search stops, 0 for no limit
+    - cancellation_token: once it's set, the search stops
+    - num_nodes: number of states expanded as of the last check
+    - is_spent: whether the search was stopped before it could finish"""
+
+    max_nodes: int = 0
+    deadline: float = 0
+    cancellation_token: Optional[Event] = None
+    num_nodes: int = 0
+    is_spent: bool = False
+
+    def check(self, num_nodes: int) -> bool:
+        """Stores the number of states expanded so far,
+        and checks whether the search should stop."""
+
+        self.num_nodes = num_nodes
+
+        if ((self.max_nodes and num_nodes >= self.max_nodes)
+                or (self.deadline and perf_counter() >= self.deadline)
+                or (self.cancellation_token and self.cancellation_token.is_set())):
+            self.is_spent = True
+
+        return self.is_spent
+
+    def next_check(self, num_nodes: int) -> int:
+        """Returns the number of expanded states at which the budget should be checked next."""
+
+        if self.max_nodes:
+            return min(num_nodes + CHECK_INTERVAL, self.max_nodes)
+
+        return num_nodes + CHECK_INTERVAL
+
+
+def start_search_deadline(user_input: UserInput) -> None:
+    """Starts the time limit of a calculation, which every search it runs stops at,
+    so that searches run after the first one don't get the whole time limit again."""
+
+    if user_input.max_search_seconds > 0:
+        user_input.search_deadline = perf_counter() + user_input.max_search_seconds
+    else:
+        user_input.search_deadline = 0
+
+
+def create_search_budget(user_input: UserInput) -> Optional[SearchBudget]:
+    """Creates a new budget for a single search,
+    or returns None if the search is neither limited nor can be cancelled.
+    Searches run without a started deadline, i.e., outside of a calculation,
+    get the whole time limit each."""
+
+    deadline = user_input.search_deadline
+    if not deadline and user_input.max_search_seconds > 0:
+        deadline = perf_counter() + user_input.max_search_seconds
+
+    if not user_input.max_search_nodes and not deadline and user_input.cancellation_token is None:
+        return None
+
+    return SearchBudget(user_input.max_search_nodes, deadline, user_input.cancellation_token)
@@ -0,0 +1,86 @@
+"""Module containing the SearchCache class,
+used for reusing searches while ER breakpoints are found.
+
+Finding a breakpoint runs a full search at every ER value a Binary Search Algorithm tries
+(see calculations_utils._bisect_breakpoint), and every category of rotations does so separately,
+starting from the same bounds. The same ER values are therefore searched over and over again,
+even though a single search finds the best rotations of every category at once.
+
+Searches are stored under the signature of everything they depend on apart from ER,
+along with the ER they were run at, rounded so that values which only differ
+by floating point errors are treated as equal. Only the most recent searches are kept."""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from pickle import dumps
+from typing import Callable, Hashable, Optional
+from character_utils.characters import CharStats
+from gui_scripts.counter import Counter
+from gui_scripts.user_input import UserInput
+from .rotation import Rotation
+
+# ER is rounded to this many decimals, far more than the breakpoints are printed with,
+# so that only searches that would find the same rotations share their results
+ER_DECIMALS = 9
+
+
+@dataclass(slots=True)
+class SearchCache:
+    """Class that stores the best rotation of every category found by the most recent searches.
+    Once the maximum size is reached, the least recently used search is evicted.
+
+    Its attributes include:
+    - max_size: maximum number of stored searches, 0 disables the cache
+    - hits: number of searches that were reused
+    - misses: number of searches that had to be run"""
+
+    max_size: int = 256
+    hits: int = 0
+    misses: int = 0
+    _searches: OrderedDict[Hashable, dict[str, Optional[Rotation]]] = field(
+        init=False, default_factory=OrderedDict)
+
+    def get(self, key: Hashable) -> Optional[dict[str, Optional[Rotation]]]:
+        """Returns the best rotation of every category found by the search, if it's stored."""
+
+        if key in self._searches:
+            self._searches.move_to_end(key)
+            self.hits += 1
+            return self._searches[key]
+
+        self.misses += 1
+        return None
+
+    def add(self, key: Hashable, rotations: dict[str, Optional[Rotation]]) -> None:
+        if self.max_size > 0:
+            self._searches[key] = rotations
+            self._searches.move_to_end(key)
+            if len(self._searches) > self.max_size:
+                self._searches.popitem(last=False)
+
+
+# Searches run while ER breakpoints are found, shared by all categories and calculations
+SEARCH_CACHE = SearchCache()
+
+
+def get_search_key(stats: CharStats, user_input: UserInput, algorithm: Callable) -> Hashable:
+    """Returns the key a search is stored under, i.e., the ER it's run at, and the algorithm,
+    stats before ER was applied, and user input, without the energy of the counters,
+    which is determined from the stats after ER is applied (see calculations_utils)."""
+
+    def get_value(value):
+        if isinstance(value, Counter):
+            return value.num_triggers, value.repeat_every_turn, value.turns
+        return value
+
+    before_er = stats.get_cache("before-er-application")
+    inputs = [(user_field.name, get_value(getattr(user_input, user_field.name)))
+              for user_field in fields(user_input)
+              if user_field.name not in ("cancellation_token", "search_deadline", "counters")]
+
+    signature = dumps((algorithm.__module__, algorithm.__qualname__,
+                       sorted((name, value) for name, value in before_er.items()
+                              if not name.startswith("_")),
+                       inputs))
+
+    return signature, round(stats.energy_recharge, ER_DECIMALS)
@@ -0,0 +1,51 @@
+"""Module containing the TranspositionTable class,
+used by algorithms of characters whose state includes stacks, charges, etc.
+
+Such characters reach the same state (actions used, energy, stacks, remaining triggers)
+through many different orderings of their actions.
+Every branch continuing from such a state yields the same rotations,
+so the state only needs to be expanded once."""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Hashable
+
+
+@dataclass(slots=True)
+class TranspositionTable:
+    """Class that stores the most recently expanded search states.
+    Once the maximum size is reached, the least recently visited state is evicted.
+
+    Its attributes include:
+    - max_size: maximum number of stored states, 0 disables the table
+    - hits: number of states that were skipped, as they have already been expanded
+    - misses: number of states that had to be expanded"""
+
+    max_size: int = 2 ** 16
+    hits: int = 0
+    misses: int = 0
+    _states: OrderedDict[Hashable, None] = field(init=False, default_factory=OrderedDict)
+
+    def visit(self, state: Hashable) -> bool:
+        """Checks whether the state has already been expanded,
+        if it hasn't, it's stored so that it's skipped the next time it's reached."""
+
+        if state in self._states:
+            self._states.move_to_end(state)
+            self.hits += 1
+            return True
+
+        self.misses += 1
+
+        if self.max_size > 0:
+            self._states[state] = None
+            if len(self._states) > self.max_size:
+                self._states.popitem(last=False)
+
+        return False
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the share of visited states that were skipped."""
+
+        return self.hits / max(self.hits + self.misses, 1)
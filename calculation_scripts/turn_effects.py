@@ -0,0 +1,119 @@
+"""Module responsible for the energy gained at the start of every turn,
+i.e., energy from counters (kills, hits taken, etc.) and support Light Cones.
+
+Counters are triggered during the first turns of a rotation (or every turn, see Counter),
+so the effects of every turn depend only on its index, not on the actions used before it.
+They are therefore computed once per search, as a schedule of turn entries,
+and every branch of the search only keeps the index of its next turn.
+This keeps the search a pure function of the character's stats and user's inputs."""
+
+from dataclasses import dataclass
+from typing import Optional
+from character_utils.characters import CharStats
+from equipment_utils.light_cone import LightCone
+from equipment_utils.support_light_cones import apply_support_lc, get_temp_er_stats
+from gui_scripts.counter import Counter
+from gui_scripts.user_input import UserInput
+
+
+@dataclass(slots=True, frozen=True)
+class TurnEntry:
+    """Class representing the effects applied at the start of a single turn.
+    It's attributes include:
+    - energy generated by every counter, in the order of the counters
+    - number of support Light Cone triggers
+    - whether support Light Cone's temporary energy recharge buff is active
+    - number of hits taken, used by characters that gain stacks when hit"""
+
+    energies: tuple[float, ...] = ()
+    support_light_cone_triggers: int = 0
+    is_buffed: bool = False
+    hits_taken: int = 0
+
+
+@dataclass(slots=True, frozen=True)
+class TurnEffects:
+    """Class representing all the effects applied at the start of every turn.
+    It's attributes include:
+    - counters that have any triggers
+    - support Light Cone, if it has any triggers
+    - stats with support Light Cone's temporary energy recharge buff applied, if applicable
+    - schedule of the effects of every turn, the last entry is repeated for all later turns"""
+
+    counters: tuple[Counter, ...] = ()
+    support_light_cone: Optional[LightCone] = None
+    buffed_stats: Optional[CharStats] = None
+    schedule: tuple[TurnEntry, ...] = (TurnEntry(),)
+
+    @property
+    def last_turn(self) -> int:
+        """Returns the index of the entry used by all turns from then on."""
+
+        return len(self.schedule) - 1
+
+    def start_turn(self, stats: CharStats, curr_energy: float,
+                   turn: int) -> tuple[float, int, CharStats]:
+        """Applies all the effects for a single turn, by the turn's index in the schedule.
+        Returns the new current energy, the index of the next turn,
+        and the stats that should be used for the character's action this turn."""
+
+        entry = self.schedule[turn]
+
+        if entry.support_light_cone_triggers:
+            curr_energy = apply_support_lc(self.support_light_cone, stats.ult_cost,
+                                           curr_energy, entry.support_light_cone_triggers)
+
+        for energy in entry.energies:
+            curr_energy += energy
+
+        turn_stats = self.buffed_stats if entry.is_buffed else stats
+
+        return curr_energy, min(turn + 1, self.last_turn), turn_stats
+
+    def get_hits_taken(self, turn: int) -> int:
+        """Returns the number of hits taken during the turn."""
+
+        return self.schedule[turn].hits_taken
+
+
+def create_turn_effects(stats: CharStats, user_input: UserInput) -> TurnEffects:
+    """Collects all counters and the support Light Cone that have any triggers,
+    and schedules their effects, up to the turn after which they no longer change."""
+
+    counters = tuple(counter for counter in user_input.counters.values()
+                     if counter.num_triggers > 0)
+    triggers = list(counters)
+
+    support_light_cone = user_input.support_light_cone
+    if not support_light_cone or support_light_cone.trigger.num_triggers == 0:
+        support_light_cone = None
+    else:
+        triggers.append(support_light_cone.trigger)
+
+    if not triggers:
+        return TurnEffects()
+
+    buffed_stats = None
+    if support_light_cone and support_light_cone.recharge_type == "temp_energy_recharge":
+        buffed_stats = get_temp_er_stats(stats, support_light_cone)
+
+    num_turns = max(trigger.get_num_changing_turns() for trigger in triggers)
+    schedule = tuple(_create_turn_entry(counters, support_light_cone, buffed_stats,
+                                        user_input.hits_taken, turn)
+                     for turn in range(num_turns + 1))
+
+    return TurnEffects(counters, support_light_cone, buffed_stats, schedule)
+
+
+def _create_turn_entry(counters: tuple[Counter, ...], support_light_cone: Optional[LightCone],
+                       buffed_stats: Optional[CharStats], hits_taken: Counter,
+                       turn: int) -> TurnEntry:
+    support_light_cone_triggers = 0
+    if support_light_cone:
+        support_light_cone_triggers = support_light_cone.trigger.get_num_triggers(turn)
+
+    return TurnEntry(tuple(counter.energy * counter.get_num_triggers(turn)
+                           for counter in counters),
+                     support_light_cone_triggers,
+                     support_light_cone_triggers > 0 and buffed_stats is not None,
+                     hits_taken.get_num_triggers(turn))
@@ -59,6 +59,12 @@ class CharStats:
         if cache_name not in self._caches:
             self._caches[cache_name] = self.__dict__.copy()
 
+    def get_cache(self, cache_name: str) -> dict:
+        """Returns the stored character stats,
+        or the current ones if they haven't been stored."""
+
+        return self._caches.get(cache_name, self.__dict__)
+
     def retrieve_cache(self, cache_name: str, delete_cache: bool = True) -> None:
         """Retrieves the stored character stats.
         Useful for taking away temporary buffs."""
@@ -0,0 +1,269 @@
+"""Module for handling character mechanics.
+
+This module reads a declarative description of every character's mechanics from CSV files,
+i.e., the actions they can take, their energy and skill point values,
+resources such as stacks or charges, and the conditions and effects of those actions.
+Characters that are not described use the default mechanics (Basic attack and Skill).
+
+Values and conditions are written as simple expressions:
+    - energy and parameter values: terms joined by " + ", factors joined by " * ",
+    where every factor is a number, a parameter, or a character stat, e.g. "skill + 3 * energy_recharge"
+    - conditions: comparisons joined by " and ", e.g. "stacks>=2 and buffed==0",
+    or just a name, which is then checked for being truthy
+    - effects: assignments joined by "; ", e.g. "charges=3; stacks+=2",
+    where the number of hits taken during the turn is available as "hits_taken"."""
+
+import re
+from operator import eq, ge, gt, le, lt, ne
+from dataclasses import dataclass, field
+from csv import DictReader
+from typing import Any, Callable, Optional
+from gui_scripts.user_input import UserInput
+from .characters import CharStats
+
+ACTIONS_CSV = "data/mechanics/actions.csv"
+PARAMETERS_CSV = "data/mechanics/parameters.csv"
+
+DEFAULT_MECHANICS = "default"
+# Name of the value that holds the number of hits taken during the current turn
+HITS_TAKEN = "hits_taken"
+
+_CONDITION_PATTERN = re.compile(r"(\w+)\s*(==|!=|>=|<=|>|<)\s*(\w+)")
+_EFFECT_PATTERN = re.compile(r"(\w+)\s*(\+=|-=|=)\s*(\w+)")
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": eq, "!=": ne, ">=": ge, "<=": le, ">": gt, "<": lt
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Condition:
+    """Comparison of a named value (resource, user input, etc.) to a number or a parameter.
+    Conditions without an operator check whether the named value is truthy."""
+
+    name: str
+    operator: str = ""
+    value: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class Effect:
+    """Change of a resource by a number, a parameter, or the number of hits taken."""
+
+    name: str
+    operator: str
+    value: str
+
+
+@dataclass(slots=True, frozen=True)
+class MechanicsAction:
+    """Dataclass that represents a single row of a character's mechanics.
+
+    Attributes:
+        - kind: "action" takes up a turn, "free_action" does not,
+        and "turn_start" is applied at the start of every turn, before any actions.
+        - name: Name the action is displayed with in rotations.
+        - energy: Expression for the energy the action generates.
+        - skill_points: Skill points the action generates (negative if it consumes them).
+        - conditions: All of them must be met for the action to be available.
+        - effects: Changes to the character's resources."""
+
+    kind: str
+    name: str
+    energy: str
+    skill_points: int
+    conditions: tuple[Condition, ...] = ()
+    effects: tuple[Effect, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class MechanicsParameter:
+    """Dataclass that represents a parameter of a character's mechanics,
+    e.g. the initial number of stacks or the cost of a follow-up attack.
+    Parameter's value is added to its total if all the conditions,
+    based on the user's inputs, are met."""
+
+    name: str
+    value: str
+    conditions: tuple[Condition, ...] = ()
+
+
+@dataclass(slots=True)
+class Mechanics:
+    """Dataclass that represents all mechanics of a single character.
+
+    Attributes:
+        - char_name: Name of the character, or "default".
+        - actions: All actions in the order they are explored in.
+        - parameters: Parameters in the order they are evaluated in.
+        - resources: Names of the values that make up character's state,
+        such as stacks, charges, matrix duration, etc."""
+
+    char_name: str
+    actions: list[MechanicsAction] = field(default_factory=list)
+    parameters: list[MechanicsParameter] = field(default_factory=list)
+    resources: tuple[str, ...] = ()
+
+    def get_parameters(self, stats: CharStats, user_input: UserInput) -> dict[str, float]:
+        """Evaluates all parameters for the given character stats and user's inputs.
+        Parameters whose conditions are never met are 0."""
+
+        parameters: dict[str, float] = {parameter.name: 0 for parameter in self.parameters}
+
+        for parameter in self.parameters:
+            if check_conditions(parameter.conditions,
+                                lambda name: getattr(user_input, name)):
+                value = evaluate(parameter.value, stats, parameters)
+                parameters[parameter.name] += value
+
+        return parameters
+
+
+def evaluate(expression: str, stats: CharStats, parameters: dict[str, float]) -> float:
+    """Evaluates an expression made up of numbers, parameters, and character stats."""
+
+    if not expression:
+        return 0
+
+    total = 0
+    for term in expression.split(" + "):
+        product = 1
+        for factor in term.split(" * "):
+            product *= _resolve(factor, stats, parameters)
+        total += product
+
+    return total
+
+
+def _resolve(name: str, stats: CharStats, parameters: dict[str, float]) -> float:
+    """Returns the value of a number, a parameter, or a character stat."""
+
+    number = _parse_number(name)
+    if number is not None:
+        return number
+
+    if name in parameters:
+        return parameters[name]
+
+    return getattr(stats, name)
+
+
+def check_conditions(conditions: tuple[Condition, ...], get_value: Callable[[str], Any],
+                     parameters: Optional[dict[str, float]] = None) -> bool:
+    """Checks whether all the conditions are met,
+    where named values are returned by get_value,
+    and values they are compared to can be numbers or parameters."""
+
+    for condition in conditions:
+        value = get_value(condition.name)
+
+        if not condition.operator:
+            if not value:
+                return False
+            continue
+
+        if not OPERATORS[condition.operator](value,
+                                             resolve_value(condition.value, parameters or {})):
+            return False
+
+    return True
+
+
+def resolve_value(value: str, parameters: dict[str, float]) -> float:
+    """Returns the value of a number or a parameter, missing parameters are 0."""
+
+    number = _parse_number(value)
+    if number is not None:
+        return number
+
+    return parameters.get(value, 0)
+
+
+def _parse_number(text: str) -> Optional[float]:
+    """Returns the number written in the text, or None if it isn't one.
+    Whole numbers are kept as integers, as character stats are."""
+
+    for number_type in (int, float):
+        try:
+            return number_type(text)
+        except ValueError:
+            pass
+
+    return None
+
+
+def _parse_conditions(text: str) -> tuple[Condition, ...]:
+    conditions = []
+
+    for part in filter(None, (part.strip() for part in text.split(" and "))):
+        match = _CONDITION_PATTERN.fullmatch(part)
+        conditions.append(Condition(*match.groups()) if match else Condition(part))
+
+    return tuple(conditions)
+
+
+def _parse_effects(text: str) -> tuple[Effect, ...]:
+    effects = []
+
+    for part in filter(None, (part.strip() for part in text.split(";"))):
+        match = _EFFECT_PATTERN.fullmatch(part)
+        if not match:
+            raise ValueError(f"Invalid effect: {part}")
+        effects.append(Effect(*match.groups()))
+
+    return tuple(effects)
+
+
+def _find_resources(actions: list[MechanicsAction]) -> tuple[str, ...]:
+    """Returns the names of all values that are changed by actions,
+    in the order they first appear in."""
+
+    resources: dict[str, None] = {}
+
+    for action in actions:
+        for effect in action.effects:
+            resources[effect.name] = None
+
+    return tuple(resources)
+
+
+def _read_mechanics() -> dict[str, Mechanics]:
+    """Reads the character mechanics from the CSV files and returns them as a dictionary.
+
+    Returns:
+        - Dictionary of mechanics, where the keys are character names,
+        and the values are their mechanics."""
+
+    mechanics: dict[str, Mechanics] = {}
+
+    with open(ACTIONS_CSV, "r", encoding="utf-8") as file:
+        reader = DictReader(file)
+        for row in reader:
+            char_name = row["char_name"]
+            action = MechanicsAction(row["kind"], row["action"], row["energy"],
+                                     int(row["skill_points"]),
+                                     _parse_conditions(row["condition"]),
+                                     _parse_effects(row["effect"]))
+
+            mechanics.setdefault(char_name, Mechanics(char_name)).actions.append(action)
+
+    with open(PARAMETERS_CSV, "r", encoding="utf-8") as file:
+        reader = DictReader(file)
+        for row in reader:
+            parameter = MechanicsParameter(row["parameter"], row["value"],
+                                           _parse_conditions(row["condition"]))
+            mechanics[row["char_name"]].parameters.append(parameter)
+
+    for char_mechanics in mechanics.values():
+        char_mechanics.resources = _find_resources(char_mechanics.actions)
+
+    return mechanics
+
+
+def get_mechanics(char_name: str) -> Mechanics:
+    """Returns the mechanics of the character, or the default ones if they have none."""
+
+    return MECHANICS.get(char_name, MECHANICS[DEFAULT_MECHANICS])
+
+
+MECHANICS = _read_mechanics()
@@ -23,7 +23,6 @@ class LightCone:
     superimposition: int = 0
     bonus: float = 0
     energy_values: list[float] = field(default_factory=lambda: [])
-    triggered: bool = False
     trigger: Counter = field(default_factory=Counter)
 
     def update_lc_bonus(self) -> None:
@@ -1,69 +1,40 @@
 """Module for handling support Light Cones, that is,
 Light Cones that can be equipped on another character and still provide their bonuses."""
 
-
-from gui_scripts.user_input import UserInput
+from copy import deepcopy
 from character_utils.characters import CharStats
 from .light_cone import LightCone
 
 
-def apply_support_lcs(stats: CharStats,
-                      user_input: UserInput, curr_energy: float) -> float:
-    """Applies various support LC bonuses,
-    raging from temporary energy recharge boosts to bonus energy generation.
-    After which it returns the new current energy value."""
-
-    if (not user_input.support_light_cone
-            or user_input.support_light_cone.trigger.num_triggers == 0):
-        return curr_energy
-
-    num_triggers = user_input.support_light_cone.trigger.num_triggers
-
-    if user_input.support_light_cone.trigger.repeat_every_turn:
-        for _ in range(num_triggers):
-            curr_energy = apply_support_lc(stats, user_input.support_light_cone,
-                                           curr_energy, num_triggers)
-    elif num_triggers > 0:
-        curr_energy = apply_support_lc(stats, user_input.support_light_cone,
-                                       curr_energy, num_triggers)
-        user_input.support_light_cone.trigger.num_triggers -= 1
-
-    return curr_energy
-
-
-def apply_support_lc(stats: CharStats, support_light_cone: LightCone,
+def apply_support_lc(support_light_cone: LightCone, ult_cost: float,
                      curr_energy: float, num_triggers: int) -> float:
-    """Applies Support Light Cone's bonus."""
-
-    match support_light_cone.recharge_type:
-        case "bonus_energy":
-            curr_energy += support_light_cone.bonus * num_triggers
-        case "temp_energy_recharge":
-            apply_temp_er_support_lc(stats, support_light_cone, num_triggers)
-        case "quid_pro_quo":
-            curr_energy += apply_quid_pro_quo_lc(stats.ult_cost, curr_energy,
-                                                 support_light_cone)
+    """Applies Support Light Cone's bonus once for every time it was triggered this turn,
+    after which it returns the new current energy value.
+    Temporary energy recharge boosts are not applied here, see "get_temp_er_stats"."""
+
+    for _ in range(num_triggers):
+        match support_light_cone.recharge_type:
+            case "bonus_energy":
+                curr_energy += support_light_cone.bonus
+            case "quid_pro_quo":
+                curr_energy += apply_quid_pro_quo_lc(ult_cost, curr_energy,
+                                                     support_light_cone)
 
     return curr_energy
 
 
-def apply_temp_er_support_lc(stats: CharStats,
-                             support_light_cone: LightCone, num_triggers: int) -> None:
+def get_temp_er_stats(stats: CharStats, support_light_cone: LightCone) -> CharStats:
     """Allows for the application of Light Cones that give temporary boosts to energy recharge.
-    This is achieved by cache the stat values before the application,
-    then retrieving those after the buff wears off.
-    This is done in such a way because of how computers interpret float values."""
-
-    lc_bonus = support_light_cone.bonus / 100
+    Returns a copy of the character stats with the boost applied,
+    which are used during the turns the Light Cone is triggered.
+    Energy recharge is applied to the stats cached before its application,
+    because of how computers interpret float values."""
 
-    if not support_light_cone.triggered and num_triggers > 0:
-        stats.cache("before_carve_the_moon")
-        stats.apply_energy_recharge(stats.energy_recharge + lc_bonus)
-        support_light_cone.triggered = True
+    buffed_stats = deepcopy(stats)
+    buffed_stats.retrieve_cache("before-er-application", delete_cache=False)
+    buffed_stats.apply_energy_recharge(stats.energy_recharge + support_light_cone.bonus / 100)
 
-    elif support_light_cone.triggered and num_triggers == 0:
-        stats.retrieve_cache("before_carve_the_moon")
-        support_light_cone.triggered = False
+    return buffed_stats
 
 
 def apply_quid_pro_quo_lc(ult_cost: float, curr_energy: float,
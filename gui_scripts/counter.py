@@ -3,14 +3,40 @@ from dataclasses import dataclass
 
 @dataclass(slots=True)
 class Counter:
+    """Number of times something that generates energy (kills, hits taken, etc.) is triggered.
+    Triggers either repeat every turn, happen once per turn until they run out,
+    or, if turns are given (see event_script), follow them turn by turn."""
+
     num_triggers: int = 0
     repeat_every_turn: bool = False
     energy: float = 0
-    _original_num_triggers: int = 0
+    turns: tuple[int, ...] = ()
+
+    def get_num_triggers(self, turn: int) -> int:
+        """Returns the number of triggers during the given turn, counting from 0."""
+
+        if self.turns:
+            return self.turns[turn] if turn < len(self.turns) else 0
+
+        if self.repeat_every_turn:
+            return self.num_triggers
+
+        return 1 if turn < self.num_triggers else 0
+
+    def get_num_changing_turns(self) -> int:
+        """Returns the number of turns after which
+        the counter is triggered the same number of times every turn."""
+
+        if self.turns:
+            return len(self.turns)
+
+        if self.repeat_every_turn:
+            return 0
+
+        return self.num_triggers
 
-    def cache(self):
-        if self._original_num_triggers == 0:
-            self._original_num_triggers = self.num_triggers
+    def get_max_triggers(self) -> int:
+        """Returns the highest number of triggers during a single turn."""
 
-    def retrieve_cache(self):
-        self.num_triggers = self._original_num_triggers
+        return max(self.get_num_triggers(turn)
+                   for turn in range(self.get_num_changing_turns() + 1))
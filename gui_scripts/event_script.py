@@ -0,0 +1,76 @@
+"""Module for event scripts, i.e., lists of events that happen during specific turns,
+e.g., "turn 2: 1 kill, turn 3: 2 hits".
+
+Counters are normally triggered once per turn until they run out, or every turn.
+Events in a script are triggered exactly during the turns they are listed under instead,
+so counters mentioned in the script ignore their number of triggers and "Every Turn?" option."""
+
+import re
+from .counter import Counter
+from .user_input import UserInput
+
+# Events that can be used in a script, and the counters they trigger
+EVENT_COUNTERS = {
+    "kill": "kills",
+    "hit": "hits_taken",
+    "ally hit": "ally_hits_taken",
+    "follow up": "follow_ups",
+    "talent": "talent_triggers",
+    "relic": "relic_trigger"
+}
+SUPPORT_LIGHT_CONE_EVENT = "light cone"
+
+_SEPARATOR_PATTERN = re.compile(r"[,;\n]")
+_TURN_PATTERN = re.compile(r"turn\s*(\d+)\s*:(.*)", re.IGNORECASE)
+_EVENT_PATTERN = re.compile(r"(\d+)?\s*([a-z][a-z -]*?)s?", re.IGNORECASE)
+
+
+def parse_event_script(script: str) -> dict[str, tuple[int, ...]]:
+    """Returns the number of times every event is triggered during every turn.
+
+    Events are separated by commas, semicolons, or new lines,
+    and belong to the last turn written before them, e.g., "turn 1: 2 hits, kill; turn 3: kill".
+    Turns are counted from 1, and events are triggered once, if no number is given."""
+
+    events: dict[str, list[int]] = {}
+    turn = -1
+
+    for part in filter(None, (part.strip() for part in _SEPARATOR_PATTERN.split(script))):
+        turn_match = _TURN_PATTERN.fullmatch(part)
+        if turn_match:
+            turn = int(turn_match.group(1)) - 1
+            part = turn_match.group(2).strip()
+            if turn < 0:
+                raise ValueError(f"Invalid turn: {turn_match.group(1)}")
+            if not part:
+                continue
+
+        event_match = _EVENT_PATTERN.fullmatch(part)
+        if not event_match or turn == -1:
+            raise ValueError(f"Invalid event: {part}")
+
+        num_triggers, event = event_match.groups()
+        event = event.strip().lower().replace("-", " ")
+        if event not in EVENT_COUNTERS and event != SUPPORT_LIGHT_CONE_EVENT:
+            raise ValueError(f"Invalid event: {part}")
+
+        turns = events.setdefault(event, [])
+        turns.extend([0] * (turn + 1 - len(turns)))
+        turns[turn] += int(num_triggers or 1)
+
+    return {event: tuple(turns) for event, turns in events.items()}
+
+
+def apply_event_script(user_input: UserInput, script: str) -> None:
+    """Replaces the counters of all events in the script with ones that follow it.
+    Light Cone events trigger the support Light Cone, which has to be selected first."""
+
+    for event, turns in parse_event_script(script).items():
+        counter = Counter(sum(turns), turns=turns)
+
+        if event != SUPPORT_LIGHT_CONE_EVENT:
+            setattr(user_input, EVENT_COUNTERS[event], counter)
+        elif user_input.support_light_cone:
+            user_input.support_light_cone.trigger = counter
+        else:
+            raise ValueError("Light Cone events require a support Light Cone")
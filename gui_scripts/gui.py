@@ -11,6 +11,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QWidget, QDialog, QVBoxLayout, QLabel
 from .widgets import Combobox, TooltipCheckBox, CounterInput
 from .layouts.button_layout import ButtonLayout
+from .layouts.checkbox_options_layout import ER_SWEEP_LIMITS, SEARCH_MODES, SEARCH_TIME_LIMITS
 from .layouts.character_selector import CharacterSelectorLayout
 from .layouts.enemy_info_layout import EnemyInfoLayout
 from .layouts.light_cone_selection import LightConeSelectionLayout
@@ -20,6 +21,7 @@ from .layouts.support_light_cone_selection import SupportLightConeSelectionLayou
 from .gui_utils import get_int_from_selector
 from .user_input import UserInput
 from .counter import Counter
+from .event_script import apply_event_script
 from character_utils.characters import CharStats, CHARACTERS
 from character_utils.traces import TRACES
 from character_utils.talents import TALENTS
@@ -27,6 +29,7 @@ from equipment_utils.light_cones import LIGHT_CONES
 from equipment_utils.relic import Relic
 from equipment_utils.relics import ALL_RELICS
 from calculation_scripts.calculations import run_calculations
+from calculation_scripts.rotation_scores import parse_score_weights
 
 
 @dataclass
@@ -114,6 +117,9 @@ class MainWindowDemo(QDialog):
         for custom_widget in self.findChildren(CounterInput):
             custom_widget.reset_selection()
 
+        self.options_layout.combo_boxes.event_script_input.clear()
+        self.options_layout.combo_boxes.score_weights_input.clear()
+
         self.char_layout.char_selector.setEnabled(True)
 
     def enable_confirm_button(self) -> None:
@@ -122,7 +128,12 @@ class MainWindowDemo(QDialog):
     def confirm_selection(self) -> None:
         """Confirms all input parameters then runs all necessary calculations."""
 
-        self._collect_user_input()
+        try:
+            self._collect_user_input()
+        except ValueError as error:
+            print(error)
+            return
+
         char = CHARACTERS.get(self.user_input.char_name)
         if not char:
             return
@@ -187,13 +198,16 @@ class MainWindowDemo(QDialog):
 
     def _collect_combat_input(self) -> None:
         """Collects combat input, this includes the number of the following:
-        hits taken, kills, ultimate kills, and follow-up attacks."""
+        hits taken, kills, ultimate kills, and follow-up attacks,
+        as well as the event script, which replaces some of them (see event_script)."""
 
         self.user_input.hits_taken = self._get_hits_taken()
         self.user_input.ally_hits_taken = self._get_ally_hits_taken()
         self.user_input.kills = self._get_kills()
         self.user_input.num_ult_kills = self._get_ult_kills()
         self.user_input.follow_ups = self._get_num_follow_ups()
+        apply_event_script(self.user_input,
+                           self.options_layout.combo_boxes.event_script_input.text())
 
     def _collect_other_input(self) -> None:
         options = self.options_layout.check_boxes
@@ -203,10 +217,23 @@ class MainWindowDemo(QDialog):
         user_input.assume_tingyun_e6 = options.assume_tingyun_e6.checkbox.isChecked()
         user_input.detailed_breakdown = options.show_detailed_breakdown.checkbox.isChecked()
         user_input.show_er_breakpoints = options.show_er_breakpoints.checkbox.isChecked()
+        user_input.fixed_point_energy = options.fixed_point_energy.checkbox.isChecked()
         user_input.matching_enemy_weakness = (
             self.enemy_info_layout.enemy_weakness.checkbox.isChecked())
         user_input.enemy_count = self._get_enemy_count()
         user_input.huohuo_ult_level = self._get_huohuo_ult_level()
+        user_input.search_mode = SEARCH_MODES.get(options.search_mode.currentText(),
+                                                  "exhaustive")
+        user_input.max_search_seconds = SEARCH_TIME_LIMITS.get(
+            options.search_time_limit.currentText(), 0)
+        user_input.er_sweep_limit = ER_SWEEP_LIMITS.get(options.er_sweep_limit.currentText(), 0)
+        user_input.num_top_rotations = (
+            self.options_layout.combo_boxes.top_rotations_input.get_num_input())
+        user_input.score_weights = parse_score_weights(
+            self.options_layout.combo_boxes.score_weights_input.text())
+        user_input.max_value_turns = (
+            self.options_layout.combo_boxes.max_value_turns_input.get_num_input())
+        user_input.sp_budget = self.options_layout.combo_boxes.sp_budget_input.get_num_input()
 
     def _get_light_cone(self):
         light_cone_name = self.lc_layout.lc_selector.currentText()
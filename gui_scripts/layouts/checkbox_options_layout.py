@@ -1,6 +1,31 @@
 from dataclasses import dataclass
 from PyQt6.QtWidgets import QGridLayout
-from ..widgets import TooltipCheckBox
+from ..widgets import Combobox, TooltipCheckBox
+
+# Search modes offered to the user, and their internal names
+SEARCH_MODES = {
+    "Exhaustive search": "exhaustive",
+    "Bounded search": "bounded",
+    "Frontier search (NumPy)": "frontier",
+    "Shortest-first search": "shortest",
+    "A* search": "astar"
+}
+
+# Time limits offered to the user for all searches of a calculation, in seconds
+SEARCH_TIME_LIMITS = {
+    "No time limit": 0,
+    "10 seconds": 10,
+    "30 seconds": 30,
+    "60 seconds": 60
+}
+
+# Highest total energy recharge offered to the user for the ER breakpoint sweep
+ER_SWEEP_LIMITS = {
+    "Next breakpoint only": 0,
+    "All breakpoints up to 150% ER": 1.5,
+    "All breakpoints up to 200% ER": 2,
+    "All breakpoints up to 250% ER": 2.5
+}
 
 
 @dataclass
@@ -39,8 +64,43 @@ class CheckboxOptionsLayout(QGridLayout):
                           "Tested but might cause unintended problems. If so, please report them."),
             checked=True)
 
+        self.fixed_point_energy = TooltipCheckBox(
+            parent, label="Use fixed-point energy?",
+            tooltip_text=("Stores energy as whole numbers of millionths during the search, "
+                          "so that equal amounts of energy are always treated as equal."))
+
+        self.search_mode = Combobox(parent, text="--Search Mode--",
+                                   items=SEARCH_MODES.keys())
+        self.search_mode.setToolTip(
+            "Exhaustive search lists all rotations before picking the best ones.\n"
+            "Bounded search skips rotations that cannot be shorter "
+            "than the best ones found so far.\n"
+            "Frontier search lists the same rotations as the exhaustive search, "
+            "but explores all of them one turn at a time using NumPy.\n"
+            "Shortest-first search explores rotations one turn at a time, "
+            "and stops once the shortest ones are found.\n"
+            "A* search explores the most promising rotations first, "
+            "and finds the shortest ones without listing all the others.")
+
+        self.search_time_limit = Combobox(parent, text="--Time Limit--",
+                                          items=SEARCH_TIME_LIMITS.keys())
+        self.search_time_limit.setToolTip(
+            "Stops searching once the calculation takes longer than this, "
+            "and shows the best rotations found so far.\n"
+            "Such rotations are marked, as shorter ones may exist.")
+
+        self.er_sweep_limit = Combobox(parent, text="--ER Breakpoints--",
+                                       items=ER_SWEEP_LIMITS.keys())
+        self.er_sweep_limit.setToolTip(
+            "Shows every ER breakpoint up to the selected ER instead of only the next one, "
+            "along with the rotation that is used from each breakpoint on.")
+
         self.addWidget(self.assume_ult, 0, 0)
         self.addWidget(self.show_detailed_breakdown, 1, 0)
         self.addWidget(self.assume_tingyun_ult, 0, 1)
         self.addWidget(self.assume_tingyun_e6, 1, 1)
         self.addWidget(self.show_er_breakpoints, 2, 0)
+        self.addWidget(self.search_mode, 2, 1)
+        self.addWidget(self.fixed_point_energy, 3, 0)
+        self.addWidget(self.search_time_limit, 3, 1)
+        self.addWidget(self.er_sweep_limit, 4, 1)
@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QGridLayout, QWidget
+from PyQt6.QtWidgets import QGridLayout, QWidget, QLabel, QLineEdit
 from ..widgets import Tooltip, CounterInput
 
 
@@ -32,6 +32,35 @@ class ComboboxOptionsLayout(QGridLayout):
                                              show_checkbox=False, max=12)
         self.huohuo_ult_input.setEnabled(False)
 
+        self.event_script_label = QLabel("Event Script:")
+        self.event_script_input = QLineEdit(parent)
+        self.event_script_input.setPlaceholderText("e.g., turn 2: 1 kill, turn 3: 2 hits")
+        self.event_script_tooltip = Tooltip(
+            text=("Events that happen during specific turns. "
+                  "Available events: kill, hit, ally hit, follow-up, talent, relic, light cone. "
+                  "Counters used by the script ignore their number of triggers "
+                  "and the \"Every Turn?\" option."))
+
+        self.top_rotations_input = CounterInput("Top Rotations:     ", parent,
+                                                show_checkbox=False, max=50)
+        self.score_weights_input = QLineEdit(parent)
+        self.score_weights_input.setPlaceholderText("Score weights, e.g., EB3 = 3.2, BASIC = 1.0")
+        self.score_weights_tooltip = Tooltip(
+            text=("Ranks all rotations by their score, "
+                  "which is the sum of the weights of their actions per turn, "
+                  "plus their SP cost per turn times the weight of \"SP/T\". "
+                  "Actions without a weight are worth 0. "
+                  "Search modes that skip rotations run an exhaustive search for the ranking."))
+
+        self.max_value_turns_input = CounterInput("Max Turns:           ", parent,
+                                                  show_checkbox=False, max=20)
+        self.sp_budget_input = CounterInput("SP Budget:", parent, show_checkbox=False, max=20)
+        self.value_tooltip = Tooltip(
+            text=("Finds the rotation with the highest total value, by the score weights above, "
+                  "that reaches the Ultimate within the maximum number of turns, "
+                  "while spending at most the budgeted number of skill points. "
+                  "Set the maximum number of turns to 0 to skip it."))
+
         self.hits_taken_input = QGridLayout()
         self.hits_taken_input.addWidget(self.hits_taken_cb, 0, 0, 1, 1)
         self.hits_taken_input.addWidget(self.hits_taken_tooltip, 0, 1, 1, 1)
@@ -54,6 +83,18 @@ class ComboboxOptionsLayout(QGridLayout):
 
         self.addWidget(self.huohuo_ult_input, 2, 0, 1, 1)
 
+        self.addWidget(self.event_script_label, 3, 0, 1, 1)
+        self.addWidget(self.event_script_input, 3, 1, 1, 3)
+        self.addWidget(self.event_script_tooltip, 3, 4, 1, 1)
+
+        self.addWidget(self.top_rotations_input, 4, 0, 1, 1)
+        self.addWidget(self.score_weights_input, 4, 1, 1, 3)
+        self.addWidget(self.score_weights_tooltip, 4, 4, 1, 1)
+
+        self.addWidget(self.max_value_turns_input, 5, 0, 1, 1)
+        self.addWidget(self.sp_budget_input, 5, 1, 1, 1)
+        self.addWidget(self.value_tooltip, 5, 4, 1, 1)
+
         self.setColumnStretch(1, 1)
         self.setColumnStretch(4, 1)
 
@@ -1,6 +1,7 @@
 """Contains the UserInput dataclass, which store all user's GUI inputs."""
 
 from dataclasses import dataclass, field
+from threading import Event
 from typing import Optional
 from equipment_utils.light_cone import LightCone
 from equipment_utils.relic import Relic
@@ -37,26 +38,21 @@ class UserInput:
     matching_enemy_weakness: bool = False
     enemy_count: int = 1
     huohuo_ult_level: int = 0
+    search_mode: str = "exhaustive"
+    transposition_table_size: int = 2 ** 16
+    fixed_point_energy: bool = False
+    max_search_nodes: int = 0
+    max_search_seconds: float = 0
+    search_deadline: float = 0
+    cancellation_token: Optional[Event] = None
+    num_top_rotations: int = 0
+    score_weights: dict[str, float] = field(default_factory=dict)
+    max_value_turns: int = 0
+    sp_budget: int = 0
+    er_sweep_limit: float = 0
     counters: dict[str, Counter] = field(init=False, default_factory=dict)
     active_counters: bool | str = None
 
-    def cache(self, cache_name="") -> None:
-        """Stores the current values of various counters,
-        as they can get changed during calculation.\n
-        At the moment, cache_name is there only to explain
-        why counters are being cached."""
-
-        for counter in self.counters.values():
-            counter.cache()
-
-    def retrieve_cache(self, cache_name="") -> None:
-        """Retrieves the stored user's inputs.
-        Useful for reverting the changes made during the calculation,
-        especially changes to the various counters."""
-
-        for counter in self.counters.values():
-            counter.retrieve_cache()
-
     def check_for_active_counters(self) -> None:
         """Checks whether there are any active counters.
         This is done to ensure that certain checks are not needlessly performed
@@ -0,0 +1,72 @@
+"""Configurations the tests run the calculations with, i.e., every supported character
+with several combinations of the inputs the GUI offers, prepared the same way
+as before the first search (see calculations.run_calculations)."""
+
+from copy import deepcopy
+from character_utils.characters import CHARACTERS, CharStats
+from character_utils.traces import TRACES
+from equipment_utils.light_cones import LIGHT_CONES
+from equipment_utils.relics import ALL_RELICS
+from gui_scripts.counter import Counter
+from gui_scripts.user_input import UserInput
+from calculation_scripts.calculations import _apply_bonuses
+from calculation_scripts.calculations_utils import determine_counter_energy_values
+
+CHARACTER_NAMES = tuple(CHARACTERS)
+
+# Every variant changes a different set of inputs, see "create_configuration"
+VARIANTS = tuple(range(6))
+
+
+def create_configuration(char_name: str, variant: int,
+                         **options) -> tuple[CharStats, UserInput]:
+    """Returns the stats and user input of the character, with the inputs of the variant:
+    0. Ultimate and technique assumed, with a trace
+    1. nothing assumed, without a trace
+    2. Ultimate assumed, with a trace and a 5* Rope
+    3. Eidolon 6, with a trace, hits taken every turn, and two kills
+    4. Ultimate assumed, with a trace, a support Light Cone and a relic with triggers
+    5. Ultimate and Tingyun's Ultimate assumed, with a trace, a 4* Rope and two hits taken
+    Any other inputs can be set through the options."""
+
+    user_input = UserInput()
+    user_input.char_name = char_name
+    user_input.assume_ult = variant % 2 == 0
+    user_input.technique = variant % 3 == 0
+    user_input.eidolon_level = 6 if variant == 3 else 0
+
+    traces = [trace.name for trace in TRACES.values() if trace.char_name == char_name]
+    if traces and variant != 1:
+        user_input.trace = traces[0]
+
+    if variant == 2:
+        user_input.rope = "5* Rope"
+    elif variant == 3:
+        user_input.hits_taken = Counter(1, True)
+        user_input.kills = Counter(2, False)
+    elif variant == 4:
+        light_cone = deepcopy(LIGHT_CONES["Shared Feeling"])
+        light_cone.superimposition = 4
+        light_cone.update_lc_bonus()
+        light_cone.trigger = Counter(2, False)
+        user_input.support_light_cone = light_cone
+        user_input.relic = deepcopy(ALL_RELICS.get("Thief of Shooting Meteor"))
+        user_input.relic_trigger = Counter(1, True)
+    elif variant == 5:
+        user_input.assume_tingyun_ult = True
+        user_input.rope = "4* Rope"
+        user_input.hits_taken = Counter(2, False)
+
+    for name, value in options.items():
+        setattr(user_input, name, value)
+
+    character = CHARACTERS[char_name]
+    stats = CharStats(character.ult_cost)
+    stats.is_skill_attack = character.is_skill_attack
+    stats.is_ult_attack = character.is_ult_attack
+
+    _apply_bonuses(stats, user_input)
+    determine_counter_energy_values(stats, user_input)
+    user_input.check_for_active_counters()
+
+    return stats, user_input
@@ -0,0 +1,10 @@
+"""Shared setup of the tests. Data files are read relative to the root of the repository,
+the same way the calculator reads them, so the tests are run from there."""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
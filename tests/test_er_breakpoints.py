@@ -0,0 +1,99 @@
+"""ER breakpoints computed directly from the linear energy model (see er_breakpoints)
+have to match the ones a Binary Search Algorithm finds, by running the search at many ER values,
+up to the precision of the Binary Search.
+
+Energy is linear in ER for characters without resources (stacks, enhanced attacks, etc.),
+as long as counters repeat every turn and support Light Cones have no triggers.
+Energy added after ER is applied, i.e., Tingyun's and HuoHuo's Ultimates, keeps it linear too.
+Any other configuration has to be left to the Binary Search.
+Both the next breakpoint and every breakpoint of an ER sweep are compared."""
+
+import re
+import pytest
+from character_utils.mechanics import get_mechanics
+from gui_scripts.counter import Counter
+from calculation_scripts import calculations_utils
+from calculation_scripts.calculations_utils import get_energy_model, print_er_breakpoint
+from calculation_scripts.character_algorithms.all_algorithms import (apply_correct_algorithm,
+                                                                     create_aggregators)
+from configurations import CHARACTER_NAMES, VARIANTS, create_configuration
+
+LINEAR_CHARACTER_NAMES = tuple(name for name in CHARACTER_NAMES
+                               if not get_mechanics(name).resources)
+# Dan Heng IL's print function doesn't show ER breakpoints
+BREAKPOINT_CHARACTER_NAMES = tuple(name for name in LINEAR_CHARACTER_NAMES
+                                   if name != "Dan Heng IL")
+
+# Variants (see configurations.create_configuration) energy is linear in ER with
+LINEAR_VARIANTS = (0, 1, 2)
+
+# Inputs energy is linear in ER with, each on top of one of the variants
+LINEAR_INPUTS = {
+    "Ultimate and technique assumed": (0, lambda: {}),
+    "nothing assumed": (1, lambda: {}),
+    "5* Rope": (2, lambda: {}),
+    "counters every turn": (3, lambda: {"kills": Counter(2, True),
+                                        "ally_hits_taken": Counter(1, True)}),
+    "Tingyun's Ultimate": (5, lambda: {"hits_taken": Counter(2, True)}),
+    "HuoHuo's Ultimate": (0, lambda: {"huohuo_ult_level": 10,
+                                      "relic_trigger": Counter(1, True)}),
+}
+
+# Highest ER an ER sweep lists breakpoints up to, 0 prints only the next breakpoint
+ER_SWEEP_LIMITS = (0, 2.5)
+
+ER_PATTERN = re.compile(r"(\d+(?:\.\d+)?)%")
+# Printed ER values are rounded to 0.001%, as is the precision of the Binary Search
+PRINTED_ER_PRECISION = 0.002
+
+
+def _read_breakpoints(capsys) -> tuple[str, list[float]]:
+    """Returns the printed breakpoints without their ER values, and the ER values."""
+
+    output = capsys.readouterr().out
+
+    return (ER_PATTERN.sub("%", output),
+            [float(energy_recharge) for energy_recharge in ER_PATTERN.findall(output)])
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("char_name", CHARACTER_NAMES)
+def test_energy_model_is_only_created_for_linear_energy(char_name, variant):
+    stats, user_input = create_configuration(char_name, variant)
+
+    is_linear = char_name in LINEAR_CHARACTER_NAMES and variant in LINEAR_VARIANTS
+    model = get_energy_model(stats, user_input, stats.energy_recharge)
+
+    assert (model is not None) == is_linear
+
+
+@pytest.mark.parametrize("er_sweep_limit", ER_SWEEP_LIMITS)
+@pytest.mark.parametrize("inputs", LINEAR_INPUTS)
+@pytest.mark.parametrize("char_name", BREAKPOINT_CHARACTER_NAMES)
+def test_linear_breakpoints_match_bisection(char_name, inputs, er_sweep_limit,
+                                            monkeypatch, capsys):
+    variant, create_options = LINEAR_INPUTS[inputs]
+    stats, user_input = create_configuration(char_name, variant, er_sweep_limit=er_sweep_limit,
+                                             **create_options())
+    old_er = stats.energy_recharge
+
+    assert get_energy_model(stats, user_input, old_er) is not None
+
+    aggregators = apply_correct_algorithm(stats, user_input, create_aggregators(user_input))
+    rotations = {query: aggregators.get(query) for query in aggregators.aggregators}
+
+    linear_breakpoints = {}
+    for query, rotation in rotations.items():
+        print_er_breakpoint(query, apply_correct_algorithm, rotation, stats, user_input, old_er)
+        linear_breakpoints[query] = _read_breakpoints(capsys)
+
+    monkeypatch.setattr(calculations_utils, "get_energy_model", lambda *args: None)
+
+    for query, (breakpoints, energy_recharges) in linear_breakpoints.items():
+        print_er_breakpoint(query, apply_correct_algorithm, rotations[query], stats, user_input,
+                            old_er)
+        bisection_breakpoints, bisection_energy_recharges = _read_breakpoints(capsys)
+
+        assert bisection_breakpoints == breakpoints
+        assert bisection_energy_recharges == pytest.approx(energy_recharges,
+                                                           abs=PRINTED_ER_PRECISION)
@@ -0,0 +1,55 @@
+"""Characters' mechanics are described as data (see data/mechanics) and run on a single
+search kernel, so a changed row, or a change to the kernel, changes the rotations of every
+character at once. Every unique rotation of every character is therefore checked against
+the ones stored in data/unique_rotations.json, which were found by the searches written
+for every character, before the mechanics were described as data.
+
+If the rotations change on purpose, the stored ones can be updated by running this module:
+python tests/test_mechanics.py"""
+
+import json
+import os
+from functools import lru_cache
+import pytest
+
+if __name__ == "__main__":
+    import conftest  # noqa: F401, makes the calculator importable when run as a script
+
+from calculation_scripts.character_algorithms.all_algorithms import apply_correct_algorithm
+from configurations import CHARACTER_NAMES, VARIANTS, create_configuration
+
+UNIQUE_ROTATIONS_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     "data", "unique_rotations.json")
+
+
+def find_unique_rotations(char_name: str, variant: int) -> dict[str, list]:
+    """Returns the skill points and energy of every unique rotation,
+    found by the exhaustive search, by its turn sequence."""
+
+    stats, user_input = create_configuration(char_name, variant)
+
+    return {rotation.turn_sequence: [rotation.skill_points_generated,
+                                     round(rotation.energy_generated, 3)]
+            for rotation in apply_correct_algorithm(stats, user_input)}
+
+
+@lru_cache(maxsize=None)
+def _read_unique_rotations() -> dict[str, dict[str, list]]:
+    with open(UNIQUE_ROTATIONS_JSON, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("char_name", CHARACTER_NAMES)
+def test_unique_rotations_match_stored_rotations(char_name, variant):
+    expected = _read_unique_rotations()[f"{char_name} {variant}"]
+
+    assert find_unique_rotations(char_name, variant) == expected
+
+
+if __name__ == "__main__":
+    with open(UNIQUE_ROTATIONS_JSON, "w", encoding="utf-8") as file:
+        file.write("{\n" + ",\n".join(
+            f"  {json.dumps(f'{char_name} {variant}')}: "
+            f"{json.dumps(find_unique_rotations(char_name, variant))}"
+            for char_name in CHARACTER_NAMES for variant in VARIANTS) + "\n}\n")
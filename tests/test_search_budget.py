@@ -0,0 +1,44 @@
+"""Every search of a calculation has to stop at the same deadline (see search_budget),
+and rotations found by a search that was stopped early can't have their ER breakpoints
+searched for, as every one of those searches would be stopped early as well."""
+
+from time import perf_counter
+import pytest
+from calculation_scripts import calculations_utils
+from calculation_scripts.search_budget import create_search_budget, start_search_deadline
+from calculation_scripts.character_algorithms.all_algorithms import (apply_correct_algorithm,
+                                                                     create_aggregators,
+                                                                     print_results)
+from configurations import create_configuration
+
+
+def test_searches_share_the_calculation_deadline():
+    _, user_input = create_configuration("Asta", 0, max_search_seconds=60)
+    start_search_deadline(user_input)
+
+    deadlines = [create_search_budget(user_input).deadline for _ in range(2)]
+
+    assert deadlines == [user_input.search_deadline] * 2
+    assert perf_counter() < user_input.search_deadline <= perf_counter() + 60
+
+
+# Configurations whose searches are stopped early after finding a rotation longer than a turn,
+# with energy that is linear in ER (Arlan's) and that is not (Asta's and Topaz's)
+STOPPED_CONFIGURATIONS = (("Arlan", 2), ("Asta", 4), ("Topaz", 1))
+
+
+@pytest.mark.parametrize("char_name, variant", STOPPED_CONFIGURATIONS)
+def test_breakpoints_are_unknown_if_the_search_is_stopped_early(char_name, variant,
+                                                                monkeypatch, capsys):
+    stats, user_input = create_configuration(char_name, variant, max_search_nodes=10)
+    aggregators = apply_correct_algorithm(stats, user_input, create_aggregators(user_input))
+
+    assert not aggregators.is_complete
+
+    def find_er_steps(*args, **kwargs):
+        raise AssertionError("ER breakpoints are searched for")
+
+    monkeypatch.setattr(calculations_utils, "_find_er_steps", find_er_steps)
+    print_results(stats, user_input, aggregators, apply_correct_algorithm)
+
+    assert "ER needed for the next breakpoint: unknown" in capsys.readouterr().out
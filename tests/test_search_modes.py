@@ -0,0 +1,60 @@
+"""Every search mode has to find the same best rotations as the exhaustive search,
+which runs the kernel generated for the character's mechanics (see kernel_generator),
+in every category the character's print function uses.
+The frontier search has to find every rotation the exhaustive search finds.
+Searches in the fixed-point energy mode have to find the same rotations as well."""
+
+from functools import lru_cache
+import pytest
+from calculation_scripts.character_algorithms.all_algorithms import (apply_correct_algorithm,
+                                                                     create_aggregators)
+from calculation_scripts.rotation import RotationList
+from configurations import CHARACTER_NAMES, VARIANTS, create_configuration
+
+SEARCH_MODES = ("bounded", "frontier", "shortest", "astar")
+
+
+@lru_cache(maxsize=None)
+def find_best_rotations(char_name: str, variant: int, search_mode: str,
+                        fixed_point_energy: bool = False) -> dict[str, tuple[int, int]]:
+    """Returns the rotation key and skill points of the best rotation of every category."""
+
+    stats, user_input = create_configuration(char_name, variant, search_mode=search_mode,
+                                             fixed_point_energy=fixed_point_energy)
+    aggregators = apply_correct_algorithm(stats, user_input, create_aggregators(user_input))
+
+    assert aggregators.is_complete
+
+    return {query: (rotation.rotation_key, rotation.skill_points_generated) if rotation else None
+            for query, rotation in aggregators.aggregators.items()
+            for rotation in [aggregators.get(query)]}
+
+
+@pytest.mark.parametrize("search_mode", SEARCH_MODES)
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("char_name", CHARACTER_NAMES)
+def test_search_mode_matches_exhaustive_search(char_name, variant, search_mode):
+    assert (find_best_rotations(char_name, variant, search_mode)
+            == find_best_rotations(char_name, variant, "exhaustive"))
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("char_name", CHARACTER_NAMES)
+def test_frontier_search_finds_every_rotation(char_name, variant):
+    turn_sequences = []
+
+    for search_mode in ("exhaustive", "frontier"):
+        stats, user_input = create_configuration(char_name, variant, search_mode=search_mode)
+        all_rotations = apply_correct_algorithm(stats, user_input)
+
+        assert isinstance(all_rotations, RotationList)
+        turn_sequences.append({rotation.turn_sequence for rotation in all_rotations})
+
+    assert turn_sequences[0] == turn_sequences[1]
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("char_name", CHARACTER_NAMES)
+def test_fixed_point_energy_matches_float_energy(char_name, variant):
+    assert (find_best_rotations(char_name, variant, "exhaustive", fixed_point_energy=True)
+            == find_best_rotations(char_name, variant, "exhaustive"))
@@ -0,0 +1,35 @@
+"""The highest value rotation (see value_algorithm) has to be as valuable
+as the most valuable of all rotations the exhaustive search finds
+within the same number of turns and skill point budget."""
+
+import pytest
+from calculation_scripts.character_algorithms.all_algorithms import (apply_correct_algorithm,
+                                                                     apply_value_algorithm)
+from calculation_scripts.rotation_scores import get_total_value
+from configurations import CHARACTER_NAMES, VARIANTS, create_configuration
+
+SCORE_WEIGHTS = {"BASIC": 1.0, "SKILL": 2.0, "E. BASIC": 2.5, "EB1": 2.0, "EB2": 3.0,
+                 "EB3": 4.5, "E. SKILL": 3.0, "SP/T": 0.3}
+
+# Maximum numbers of turns, each with a skill point budget
+LIMITS = ((3, 0), (5, 2), (8, 4), (6, 10))
+
+
+@pytest.mark.parametrize("max_turns, sp_budget", LIMITS)
+@pytest.mark.parametrize("variant", VARIANTS)
+@pytest.mark.parametrize("char_name", CHARACTER_NAMES)
+def test_value_algorithm_matches_brute_force(char_name, variant, max_turns, sp_budget):
+    stats, user_input = create_configuration(char_name, variant, score_weights=SCORE_WEIGHTS,
+                                             max_value_turns=max_turns, sp_budget=sp_budget)
+
+    value_rotations = apply_value_algorithm(stats, user_input)
+    values = [get_total_value(rotation, SCORE_WEIGHTS)
+              for rotation in apply_correct_algorithm(stats, user_input)
+              if rotation.num_turns <= max_turns
+              and rotation.skill_points_generated >= -sp_budget]
+
+    if not values:
+        assert not value_rotations
+    else:
+        assert len(value_rotations) == 1
+        assert get_total_value(value_rotations[0], SCORE_WEIGHTS) == pytest.approx(max(values))